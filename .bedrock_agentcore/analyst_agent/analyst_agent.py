@@ -4,23 +4,35 @@ This agent uses Lambda functions as tools for requirements gathering and BRD gen
 """
 
 import json
+import logging
 import os
+import sys
 from typing import Optional
 
+# Log to stdout (picked up by the runtime's CloudWatch stream). Per-request
+# detail is DEBUG with %-style args, so it is never formatted unless LOG_LEVEL
+# asks for it.
+logging.basicConfig(
+    level=os.getenv('LOG_LEVEL', 'INFO').upper(),
+    stream=sys.stdout,
+    format='%(message)s',
+)
+logger = logging.getLogger("analyst.agent")
+
 # Defensive import strategy for BedrockAgentCoreApp (same as my_agent)
 try:
     from bedrock_agentcore.runtime import BedrockAgentCoreApp
-    print("[ANALYST-AGENT] Imported BedrockAgentCoreApp from bedrock_agentcore.runtime", flush=True)
+    logger.info("[ANALYST-AGENT] Imported BedrockAgentCoreApp from bedrock_agentcore.runtime")
 except ImportError:
     try:
         from bedrock_agentcore import BedrockAgentCoreApp
-        print("[ANALYST-AGENT] Imported BedrockAgentCoreApp from bedrock_agentcore", flush=True)
+        logger.info("[ANALYST-AGENT] Imported BedrockAgentCoreApp from bedrock_agentcore")
     except ImportError:
         try:
             from bedrock_agentcore.runtime.app import BedrockAgentCoreApp
-            print("[ANALYST-AGENT] Imported BedrockAgentCoreApp from bedrock_agentcore.runtime.app", flush=True)
+            logger.info("[ANALYST-AGENT] Imported BedrockAgentCoreApp from bedrock_agentcore.runtime.app")
         except ImportError as e:
-            print(f"[ANALYST-AGENT] Failed to import BedrockAgentCoreApp: {e}", flush=True)
+            logger.error("[ANALYST-AGENT] Failed to import BedrockAgentCoreApp: %s", e)
             raise
 
 from strands import Agent, tool
@@ -75,8 +87,8 @@ def invoke_lambda_tool(function_name: str, payload: dict) -> dict:
     """
     try:
         lambda_client = _get_lambda_client()
-        print(f"[ANALYST-AGENT] Invoking Lambda: {function_name}", flush=True)
-        print(f"[ANALYST-AGENT] Payload keys: {list(payload.keys())}", flush=True)
+        logger.info("[ANALYST-AGENT] Invoking Lambda: %s", function_name)
+        logger.debug("[ANALYST-AGENT] Payload keys: %s", list(payload))
         
         response = lambda_client.invoke(
             FunctionName=function_name,
@@ -88,19 +100,36 @@ def invoke_lambda_tool(function_name: str, payload: dict) -> dict:
         
         if 'FunctionError' in response:
             error_msg = response_payload.get('errorMessage', 'Unknown Lambda error')
-            print(f"[ANALYST-AGENT] Lambda error: {error_msg}", flush=True)
+            logger.error("[ANALYST-AGENT] Lambda error: %s", error_msg)
             raise Exception(f"Lambda function error: {error_msg}")
         
-        print(f"[ANALYST-AGENT] Lambda response received successfully", flush=True)
+        logger.debug("[ANALYST-AGENT] Lambda response received successfully")
         return response_payload
         
     except Exception as e:
-        print(f"[ANALYST-AGENT] Error invoking Lambda {function_name}: {str(e)}", flush=True)
-        import traceback
-        print(traceback.format_exc(), flush=True)
+        logger.exception("[ANALYST-AGENT] Error invoking Lambda %s: %s", function_name, e)
         raise
 
 
+def _lambda_body(result) -> Optional[dict]:
+    """
+    Return the response body of a Lambda tool result as a dict.
+
+    The tool Lambdas answer with an API Gateway style envelope
+    ({"statusCode": ..., "body": "<json>"}); the body is only decoded when it
+    actually arrives as a string. A result without an envelope is returned
+    as-is, and None is returned for non-dict results.
+    """
+    if not isinstance(result, dict):
+        return None
+    if 'statusCode' not in result:
+        return result
+    body = result.get('body') or {}
+    if isinstance(body, (str, bytes)):
+        body = json.loads(body)
+    return body
+
+
 # --- Tool Definitions (using @tool decorator) ---
 
 @tool
@@ -135,22 +164,19 @@ def gather_requirements(session_id: str, user_message: str) -> str:
         result = invoke_lambda_tool(LAMBDA_REQUIREMENTS_GATHERING, payload)
         
         # Parse response
-        if isinstance(result, dict):
-            if 'statusCode' in result:
-                body = result.get('body', '{}')
-                if isinstance(body, str):
-                    body = json.loads(body)
-                response_text = body.get('response', body.get('message', 'Response received'))
-            else:
-                response_text = result.get('response', result.get('message', str(result)))
-        else:
+        body = _lambda_body(result)
+        if body is None:
             response_text = str(result)
+        elif body is result:
+            response_text = body.get('response', body.get('message', str(result)))
+        else:
+            response_text = body.get('response', body.get('message', 'Response received'))
         
         return response_text
         
     except Exception as e:
         error_msg = f"Error in requirements gathering: {str(e)}"
-        print(f"[ANALYST-AGENT] {error_msg}", flush=True)
+        logger.error("[ANALYST-AGENT] %s", error_msg)
         return error_msg
 
 
@@ -192,26 +218,20 @@ def generate_brd_from_history(session_id: str, brd_id: Optional[str] = None) ->
         result = invoke_lambda_tool(LAMBDA_BRD_FROM_HISTORY, payload)
         
         # Parse response
-        if isinstance(result, dict):
-            if 'statusCode' in result:
-                body = result.get('body', '{}')
-                if isinstance(body, str):
-                    body = json.loads(body)
-                brd_id_result = body.get('brd_id', 'unknown')
-                message = body.get('message', 'BRD generated successfully')
-            else:
-                brd_id_result = result.get('brd_id', 'unknown')
-                message = result.get('message', 'BRD generated successfully')
-        else:
+        body = _lambda_body(result)
+        if body is None:
             brd_id_result = 'unknown'
             message = str(result)
+        else:
+            brd_id_result = body.get('brd_id', 'unknown')
+            message = body.get('message', 'BRD generated successfully')
         
         success_msg = f"✅ {message}\n\nBRD ID: {brd_id_result}\n\nYou can now view and edit this BRD using the BRD chat agent."
         return success_msg
         
     except Exception as e:
         error_msg = f"Error generating BRD: {str(e)}"
-        print(f"[ANALYST-AGENT] {error_msg}", flush=True)
+        logger.error("[ANALYST-AGENT] %s", error_msg)
         return error_msg
 
 
@@ -257,16 +277,14 @@ IMPORTANT:
             
             if not fresh:
                 _agent_instance = agent
-                print("[ANALYST-AGENT] Strands agent initialized with Lambda tools", flush=True)
+                logger.info("[ANALYST-AGENT] Strands agent initialized with Lambda tools")
             else:
-                print("[ANALYST-AGENT] Created fresh Strands agent instance", flush=True)
+                logger.info("[ANALYST-AGENT] Created fresh Strands agent instance")
             
             return agent
             
         except Exception as e:
-            print(f"[ANALYST-AGENT] Error initializing agent: {str(e)}", flush=True)
-            import traceback
-            print(traceback.format_exc(), flush=True)
+            logger.exception("[ANALYST-AGENT] Error initializing agent: %s", e)
             raise
     
     return _agent_instance
@@ -288,24 +306,22 @@ def invoke(payload):
     }
     """
     try:
-        print("=" * 80, flush=True)
-        print("[ANALYST-AGENT] Handler invoked (Strands + Lambda Tools)", flush=True)
-        print("=" * 80, flush=True)
+        logger.info("[ANALYST-AGENT] Handler invoked (Strands + Lambda Tools)")
         
         # Extract user message
         user_message = payload.get("prompt") or payload.get("text") or payload.get("message", "Hello! I'd like to create a BRD.")
         
-        print(f"[ANALYST-AGENT] User message: {user_message[:200]}...", flush=True)
-        print(f"[ANALYST-AGENT] Payload keys: {list(payload.keys())}", flush=True)
+        logger.debug("[ANALYST-AGENT] User message: %.200s...", user_message)
+        logger.debug("[ANALYST-AGENT] Payload keys: %s", list(payload))
         
         # Get or create session ID
         session_id = payload.get("session_id") or payload.get("runtime_session_id")
         if not session_id:
             import uuid
             session_id = f"analyst-session-{str(uuid.uuid4())}"
-            print(f"[ANALYST-AGENT] Generated new session ID: {session_id}", flush=True)
+            logger.info("[ANALYST-AGENT] Generated new session ID: %s", session_id)
         else:
-            print(f"[ANALYST-AGENT] Using session ID: {session_id}", flush=True)
+            logger.info("[ANALYST-AGENT] Using session ID: %s", session_id)
         
         # Check if this is a BRD generation request
         is_generate_request = any(keyword in user_message.lower() for keyword in [
@@ -315,7 +331,7 @@ def invoke(payload):
         
         # If it's a generate request, use the generate_brd_from_history tool directly
         if is_generate_request:
-            print(f"[ANALYST-AGENT] Detected BRD generation request, calling generate_brd_from_history tool", flush=True)
+            logger.info("[ANALYST-AGENT] Detected BRD generation request, calling generate_brd_from_history tool")
             try:
                 result_text = generate_brd_from_history(session_id=session_id)
                 return json.dumps({
@@ -325,7 +341,7 @@ def invoke(payload):
                 })
             except Exception as e:
                 error_msg = f"Error generating BRD: {str(e)}"
-                print(f"[ANALYST-AGENT] {error_msg}", flush=True)
+                logger.error("[ANALYST-AGENT] %s", error_msg)
                 return json.dumps({
                     "result": error_msg,
                     "session_id": session_id,
@@ -333,7 +349,7 @@ def invoke(payload):
                 })
         
         # For all other messages, ALWAYS call gather_requirements to ensure messages are stored
-        print(f"[ANALYST-AGENT] Calling gather_requirements tool to store message and get response", flush=True)
+        logger.debug("[ANALYST-AGENT] Calling gather_requirements tool to store message and get response")
         try:
             result_text = gather_requirements(session_id=session_id, user_message=user_message)
             
@@ -345,12 +361,10 @@ def invoke(payload):
             })
         except Exception as e:
             error_msg = f"Error in requirements gathering: {str(e)}"
-            print(f"[ANALYST-AGENT] {error_msg}", flush=True)
-            import traceback
-            print(traceback.format_exc(), flush=True)
+            logger.exception("[ANALYST-AGENT] %s", error_msg)
             
             # Fallback: try using the agent directly if tool call fails
-            print(f"[ANALYST-AGENT] Falling back to direct agent call", flush=True)
+            logger.warning("[ANALYST-AGENT] Falling back to direct agent call")
             agent = _get_agent()
             
             # Build prompt for the agent with session context
@@ -374,7 +388,7 @@ Please help the user with their BRD requirements gathering or generation request
             else:
                 result_text = str(result)
             
-            print(f"[ANALYST-AGENT] Agent response generated successfully", flush=True)
+            logger.debug("[ANALYST-AGENT] Agent response generated successfully")
             
             # Return JSON with session_id
             return json.dumps({
@@ -385,9 +399,7 @@ Please help the user with their BRD requirements gathering or generation request
             
         except Exception as e:
             error_msg = f"I apologize, but I encountered an error: {str(e)}"
-            print(f"[ANALYST-AGENT] Error in agent execution: {str(e)}", flush=True)
-            import traceback
-            print(traceback.format_exc(), flush=True)
+            logger.exception("[ANALYST-AGENT] Error in agent execution: %s", e)
             
             return json.dumps({
                 "result": error_msg,
@@ -396,9 +408,7 @@ Please help the user with their BRD requirements gathering or generation request
             })
     
     except Exception as e:
-        print(f"[ANALYST-AGENT] Error in invoke: {str(e)}", flush=True)
-        import traceback
-        print(traceback.format_exc(), flush=True)
+        logger.exception("[ANALYST-AGENT] Error in invoke: %s", e)
         
         session_id = payload.get("session_id", "unknown")
         return json.dumps({
@@ -409,8 +419,8 @@ Please help the user with their BRD requirements gathering or generation request
 
 
 # Run the app when module is loaded (always run, not just when executed directly)
-print("[ANALYST-AGENT] Initializing AgentCore Runtime app...", flush=True)
-print(f"[ANALYST-AGENT] Bedrock Model: {BEDROCK_MODEL_ID}", flush=True)
-print(f"[ANALYST-AGENT] Lambda Requirements Gathering ARN: {LAMBDA_REQUIREMENTS_GATHERING_ARN}", flush=True)
-print(f"[ANALYST-AGENT] Lambda BRD from History ARN: {LAMBDA_BRD_FROM_HISTORY_ARN}", flush=True)
+logger.info("[ANALYST-AGENT] Initializing AgentCore Runtime app...")
+logger.info("[ANALYST-AGENT] Bedrock Model: %s", BEDROCK_MODEL_ID)
+logger.info("[ANALYST-AGENT] Lambda Requirements Gathering ARN: %s", LAMBDA_REQUIREMENTS_GATHERING_ARN)
+logger.info("[ANALYST-AGENT] Lambda BRD from History ARN: %s", LAMBDA_BRD_FROM_HISTORY_ARN)
 app.run()
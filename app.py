@@ -1,5 +1,6 @@
 import asyncio
 import base64
+import copy
 import email
 import hashlib
 import io
@@ -7,9 +8,10 @@ import json
 import logging
 import os
 import re
+import threading
 import time
-import traceback
 import uuid
+from collections import OrderedDict
 from datetime import datetime
 from functools import wraps
 from typing import Optional, List
@@ -18,20 +20,55 @@ import boto3
 import jwt
 import requests
 from botocore.config import Config
-from botocore.exceptions import ClientError
+from botocore.exceptions import (
+    ClientError,
+    ConnectTimeoutError,
+    NoCredentialsError,
+    PartialCredentialsError,
+    ReadTimeoutError,
+)
 from docx import Document
+from docx.oxml.ns import nsmap, qn
 from dotenv import load_dotenv
-from fastapi import FastAPI, UploadFile, File, HTTPException, Form, Depends, Header, Query
+from fastapi import FastAPI, UploadFile, File, HTTPException, Form, Depends, Header, Query, BackgroundTasks
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.requests import Request
-from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse, Response
+from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse, StreamingResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from jwt import PyJWKClient
+from lxml import etree
 from pydantic import BaseModel
 from pypdf import PdfReader
 
+# orjson is an optional speed-up for the JSON payloads built on the request
+# path (emits UTF-8 bytes directly); stdlib json is the fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so existing
+    # ``except json.JSONDecodeError`` handlers keep working unchanged.
+    _loads = orjson.loads
+
+    def _dumps_bytes(obj) -> bytes:
+        return orjson.dumps(obj)
+else:
+    _loads = json.loads
+
+    def _dumps_bytes(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+# ijson (optional) lets the /generate handler decode the agent's JSON
+# envelope incrementally while the response is still streaming in.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 # Import API routers
 from routers.projects import router as projects_router
 from routers.sessions import router as sessions_router
@@ -56,6 +93,7 @@ from routers.figma import router as figma_router
 from routers.velox_guide import router as velox_guide_router
 from routers.home_assistant import router as home_assistant_router
 from routers.internal_utils import validate_api_key
+from utils.agent_response import extract_agent_text, first_non_ws
 # Import database helpers for session persistence
 from db_helper import (
     save_project_brd_session,
@@ -253,6 +291,10 @@ LAMBDA_REQUIREMENTS_GATHERING = os.getenv("LAMBDA_REQUIREMENTS_GATHERING", DEFAU
 LAMBDA_BRD_GENERATOR = os.getenv("LAMBDA_BRD_GENERATOR", DEFAULT_LAMBDA_BRD_GENERATOR)
 AGENTCORE_MEMORY_ID = os.getenv("AGENTCORE_MEMORY_ID", DEFAULT_AGENTCORE_MEMORY_ID)
 AGENTCORE_ACTOR_ID = os.getenv("AGENTCORE_ACTOR_ID", DEFAULT_AGENTCORE_ACTOR_ID)
+# Generator Lambda invoked by /api/generate-from-s3 (historically its own env var)
+BRD_GENERATOR_LAMBDA = os.getenv("BRD_GENERATOR_LAMBDA", "sdlc-dev-brd-generator")
+# BRD template that /api/generate-from-s3 reads from S3_BUCKET_NAME
+TEMPLATE_S3_KEY = "templates/Deluxe_BRD_Template.docx"
 
 # Log agent ARNs on startup
 logger.info("[CONFIG] Agent ARN: %s", AGENT_ARN)
@@ -333,29 +375,99 @@ def check_aws_credentials():
     except Exception as e:
         return False, str(e)
 
+# The error handlers re-check credentials on every auth-looking failure; in
+# an outage that is one STS round-trip per failing request. They share one
+# verdict for a short window instead.
+_CREDENTIALS_CHECK_TTL_SECONDS = 30.0
+_credentials_check_cache = None  # (time.monotonic() stamp, result)
+_credentials_check_stats = {"hits": 0, "misses": 0}
+
+
+def check_aws_credentials_cached():
+    """check_aws_credentials(), memoized for _CREDENTIALS_CHECK_TTL_SECONDS."""
+    global _credentials_check_cache
+    now = time.monotonic()
+    cached = _credentials_check_cache
+    if cached is not None and now - cached[0] < _CREDENTIALS_CHECK_TTL_SECONDS:
+        _credentials_check_stats["hits"] += 1
+        return cached[1]
+    _credentials_check_stats["misses"] += 1
+    result = check_aws_credentials()
+    _credentials_check_cache = (now, result)
+    return result
+
+# Shared AgentCore client (see the Lambda client note below). Dropped by
+# refresh_agent_core_client() when a request fails on credentials, so the
+# next call rebuilds it against the current credential chain.
+_agent_core_client = None
+
+# Concurrent requests run their AWS calls on worker threads and share the
+# cached clients below; botocore's default pool of 10 connections would make
+# the 11th in-flight call wait for a socket or open an unpooled one.
+_AWS_MAX_POOL_CONNECTIONS = int(os.getenv("AWS_MAX_POOL_CONNECTIONS", "50"))
+# Adaptive retry mode backs off on throttling with client-side rate limiting
+# rather than the legacy mode's fixed exponential retries.
+_AWS_RETRY_MODE = os.getenv("AWS_RETRY_MODE", "adaptive")
+
+
 def get_agent_core_client():
-    """Get a fresh AgentCore client with increased timeout for long-running operations"""
-    # Increase timeout to 5 minutes (300 seconds) for BRD generation
-    config = Config(
-        read_timeout=300,
-        connect_timeout=10,
-        retries={'max_attempts': 3}
-    )
-    return boto3.client('bedrock-agentcore', region_name=REGION, config=config)
+    """Get the shared AgentCore client with increased timeout for long-running operations"""
+    global _agent_core_client
+    if _agent_core_client is None:
+        # Increase timeout to 5 minutes (300 seconds) for BRD generation
+        config = Config(
+            read_timeout=300,
+            connect_timeout=10,
+            retries={'max_attempts': 3, 'mode': _AWS_RETRY_MODE},
+            max_pool_connections=_AWS_MAX_POOL_CONNECTIONS,
+            tcp_keepalive=True
+        )
+        _agent_core_client = boto3.client('bedrock-agentcore', region_name=REGION, config=config)
+    return _agent_core_client
+
+
+def refresh_agent_core_client():
+    """Discard the cached AgentCore client; the next get_agent_core_client() rebuilds it."""
+    global _agent_core_client
+    _agent_core_client = None
+
+# boto3 clients are thread-safe and costly to build (the service model is
+# loaded from disk on every boto3.client() call), so the Lambda client is
+# created once and shared across requests.
+_lambda_client = None
+
 
 def get_lambda_client():
-    """Get a fresh Lambda client with extended timeout for long-running Lambda functions"""
-    # Increase timeout to 15 minutes (900 seconds) - max Lambda execution time
-    config = Config(
-        read_timeout=900,
-        connect_timeout=60,
-        retries={'max_attempts': 0}  # Don't retry on timeout - Lambda is already processing
-    )
-    return boto3.client('lambda', region_name=REGION, config=config)
+    """Get the shared Lambda client with extended timeout for long-running Lambda functions"""
+    global _lambda_client
+    if _lambda_client is None:
+        # Increase timeout to 15 minutes (900 seconds) - max Lambda execution time
+        config = Config(
+            read_timeout=900,
+            connect_timeout=60,
+            retries={'max_attempts': 0},  # Don't retry on timeout - Lambda is already processing
+            max_pool_connections=_AWS_MAX_POOL_CONNECTIONS,
+            tcp_keepalive=True  # keep idle sockets alive through long synchronous invokes
+        )
+        _lambda_client = boto3.client('lambda', region_name=REGION, config=config)
+    return _lambda_client
+
+_agentcore_identity_client = None
+
 
 def get_agentcore_identity_client():
-    """Get AgentCore Identity client"""
-    return boto3.client('bedrock-agentcore', region_name=REGION)
+    """Get the shared AgentCore Identity client"""
+    global _agentcore_identity_client
+    if _agentcore_identity_client is None:
+        _agentcore_identity_client = boto3.client(
+            'bedrock-agentcore', region_name=REGION,
+            config=Config(
+                retries={'max_attempts': 5, 'mode': _AWS_RETRY_MODE},
+                max_pool_connections=_AWS_MAX_POOL_CONNECTIONS,
+                tcp_keepalive=True
+            )
+        )
+    return _agentcore_identity_client
 
 # -------------------------
 # Azure AD Token Verification
@@ -525,37 +637,51 @@ def render_brd_json_to_text(brd_data: dict) -> str:
     # Fallback: Convert to JSON string if all else fails
     return json.dumps(brd_data, indent=2, ensure_ascii=False)
 
+# Markdown-stripping patterns for clean_markdown_text(), which runs once per
+# paragraph/table cell while rendering a BRD -- compiled once at import.
+# Markdown headers (# ## ###) - but preserve the text after
+_MD_HEADER_RE = re.compile(r'^#+\s+', re.MULTILINE)
+# Horizontal rules (---) on their own line
+_MD_HRULE_RE = re.compile(r'^---+$', re.MULTILINE)
+# Bold (**text** or __text__); **text** but not ***text*** (that's bold+italic)
+_MD_BOLD_STAR_RE = re.compile(r'\*\*([^*]+?)\*\*')
+_MD_BOLD_UNDERSCORE_RE = re.compile(r'__([^_]+?)__')
+# Italic (*text* or _text_) - only if not at start of line with space after,
+# so list markers (- item) survive
+_MD_ITALIC_STAR_RE = re.compile(r'(?<!^)(?<!\n)(?<!\s)\*([^*\n\s]+?)\*(?!\s)')
+_MD_ITALIC_UNDERSCORE_RE = re.compile(r'(?<!^)(?<!\n)(?<!\s)_([^_\n\s]+?)_(?!\s)')
+# Code blocks and inline code
+_MD_CODE_BLOCK_RE = re.compile(r'```[\s\S]*?```')
+_MD_INLINE_CODE_RE = re.compile(r'`([^`]+)`')
+# Table separators (|---|---| or |---|)
+_MD_TABLE_SEP_RE = re.compile(r'^\|?[\s\-|:]+\|?\s*$', re.MULTILINE)
+_MD_EXTRA_NEWLINES_RE = re.compile(r'\n{3,}')
+
 def clean_markdown_text(text: str) -> str:
     """Remove markdown syntax from text"""
     if not text:
         return ""
     
-    # Remove markdown headers (# ## ###) - but preserve the text after
-    # Match: # Text or ## Text or ### Text
-    text = re.sub(r'^#+\s+', '', text, flags=re.MULTILINE)
-    
-    # Remove horizontal rules (---) on their own line
-    text = re.sub(r'^---+$', '', text, flags=re.MULTILINE)
+    text = _MD_HEADER_RE.sub('', text)
+    text = _MD_HRULE_RE.sub('', text)
     
-    # Remove bold markdown (**text** or __text__) - handle nested cases
-    # Match **text** but not ***text*** (that's bold+italic)
-    text = re.sub(r'\*\*([^*]+?)\*\*', r'\1', text)
-    text = re.sub(r'__([^_]+?)__', r'\1', text)
+    # Remove bold markdown - handle nested cases
+    text = _MD_BOLD_STAR_RE.sub(r'\1', text)
+    text = _MD_BOLD_UNDERSCORE_RE.sub(r'\1', text)
     
-    # Remove italic markdown (*text* or _text_) - but preserve list markers (- item)
-    # Only match if not at start of line with space after
-    text = re.sub(r'(?<!^)(?<!\n)(?<!\s)\*([^*\n\s]+?)\*(?!\s)', r'\1', text)
-    text = re.sub(r'(?<!^)(?<!\n)(?<!\s)_([^_\n\s]+?)_(?!\s)', r'\1', text)
+    # Remove italic markdown
+    text = _MD_ITALIC_STAR_RE.sub(r'\1', text)
+    text = _MD_ITALIC_UNDERSCORE_RE.sub(r'\1', text)
     
     # Remove code blocks
-    text = re.sub(r'```[\s\S]*?```', '', text)
-    text = re.sub(r'`([^`]+)`', r'\1', text)
+    text = _MD_CODE_BLOCK_RE.sub('', text)
+    text = _MD_INLINE_CODE_RE.sub(r'\1', text)
     
-    # Remove markdown table separators (|---|---| or |---|)
-    text = re.sub(r'^\|?[\s\-|:]+\|?\s*$', '', text, flags=re.MULTILINE)
+    # Remove markdown table separators
+    text = _MD_TABLE_SEP_RE.sub('', text)
     
     # Clean up extra whitespace
-    text = re.sub(r'\n{3,}', '\n\n', text)
+    text = _MD_EXTRA_NEWLINES_RE.sub('\n\n', text)
     text = text.strip()
     
     return text
@@ -579,13 +705,44 @@ def parse_markdown_table(text: str):
     
     return rows if rows else None
 
-def render_brd_json_to_docx(brd_data) -> bytes:
+def _add_docx_table(doc, rows, style):
+    """Append a table holding ``rows`` to ``doc``, with the first row bold.
+
+    Cell text is cleaned up front and written straight into each new
+    <w:tc>'s empty paragraph as one run, instead of going through
+    ``cell.text`` (which tears down and rebuilds the cell's paragraph via
+    _Cell/Paragraph/Run proxies) and then re-walking every header run to
+    bold it. Ragged rows leave their trailing cells empty.
+    """
+    max_cols = max(len(row) for row in rows)
+    table = doc.add_table(rows=len(rows), cols=max_cols)
+    table.style = style
+    cleaned = [[clean_markdown_text(str(cell)) for cell in row] for row in rows]
+    for row_idx, (tr, texts) in enumerate(zip(table._tbl.tr_lst, cleaned)):
+        for tc, text in zip(tr.tc_lst, texts):
+            r = tc.p_lst[0].add_r()
+            if row_idx == 0:
+                r.get_or_add_rPr().get_or_add_b()
+            r.text = text
+    return table
+
+# Blank python-docx document, parsed once at import. render_brd_json_to_docx
+# deep-copies it per call instead of re-opening and parsing the default
+# template package (zip + styles/numbering XML) on every download.
+_BASE_DOCX = Document()
+
+def render_brd_json_to_docx(brd_data, out=None):
     """Render structured BRD JSON or text into DOCX format with clean formatting
     
     Args:
         brd_data: Can be a dict (JSON structure) or str (plain text)
+        out: Optional writable binary file object. When given, the DOCX is
+            saved straight into it and ``out`` is returned instead of bytes.
     """
-    doc = Document()
+    doc = copy.deepcopy(_BASE_DOCX)
+    # Resolve the table style once; assigning the Style object skips
+    # python-docx's by-name lookup through doc.styles on every table.
+    grid_style = doc.styles['Light Grid Accent 1']
     
     # Add title
     doc.add_heading('Business Requirements Document (BRD)', 0)
@@ -609,7 +766,7 @@ def render_brd_json_to_docx(brd_data) -> bytes:
                     text = block.get("text", "").strip()
                     if text:
                         # Clean headers only
-                        text = re.sub(r'^#+\s+', '', text, flags=re.MULTILINE)
+                        text = _MD_HEADER_RE.sub('', text)
                         
                         # Check if paragraph contains markdown table (multi-line)
                         if '\n' in text and '|' in text and text.count('|') >= 2:
@@ -628,20 +785,7 @@ def render_brd_json_to_docx(brd_data) -> bytes:
                             if table_lines:
                                 table_data = parse_markdown_table('\n'.join(table_lines))
                                 if table_data and len(table_data) > 0:
-                                    max_cols = max(len(row) for row in table_data)
-                                    table = doc.add_table(rows=len(table_data), cols=max_cols)
-                                    table.style = 'Light Grid Accent 1'
-                                    for row_idx, row_data in enumerate(table_data):
-                                        for col_idx, cell_data in enumerate(row_data):
-                                            if col_idx < len(table.rows[row_idx].cells):
-                                                cell = table.rows[row_idx].cells[col_idx]
-                                                cell.text = clean_markdown_text(str(cell_data))
-                                    if len(table_data) > 0:
-                                        header_cells = table.rows[0].cells
-                                        for cell in header_cells:
-                                            for paragraph in cell.paragraphs:
-                                                for run in paragraph.runs:
-                                                    run.bold = True
+                                    _add_docx_table(doc, table_data, grid_style)
                             
                             # Process regular lines
                             for reg_line in regular_lines:
@@ -652,25 +796,8 @@ def render_brd_json_to_docx(brd_data) -> bytes:
                         elif '|' in text and text.count('|') >= 2:
                             table_rows = parse_markdown_table(text)
                             if table_rows and len(table_rows) > 0:
-                                # Create Word table
-                                max_cols = max(len(row) for row in table_rows)
-                                table = doc.add_table(rows=len(table_rows), cols=max_cols)
-                                table.style = 'Light Grid Accent 1'
-                                
-                                for row_idx, row_data in enumerate(table_rows):
-                                    for col_idx, cell_data in enumerate(row_data):
-                                        if col_idx < len(table.rows[row_idx].cells):
-                                            cell = table.rows[row_idx].cells[col_idx]
-                                            # Clean markdown from cell text
-                                            cell.text = clean_markdown_text(str(cell_data))
-                                
-                                # Make header row bold
-                                if len(table_rows) > 0:
-                                    header_cells = table.rows[0].cells
-                                    for cell in header_cells:
-                                        for paragraph in cell.paragraphs:
-                                            for run in paragraph.runs:
-                                                run.bold = True
+                                # Create Word table (header row bold)
+                                _add_docx_table(doc, table_rows, grid_style)
                             else:
                                 # Not a table, just clean text
                                 cleaned_text = clean_markdown_text(text)
@@ -724,24 +851,8 @@ def render_brd_json_to_docx(brd_data) -> bytes:
                     body_rows = block.get("rows", []) or []
                     all_rows = ([headers] if headers else []) + body_rows
                     if all_rows:
-                        max_cols = max(len(r) for r in all_rows)
-                        table = doc.add_table(rows=len(all_rows), cols=max_cols)
-                        table.style = 'Light Grid Accent 1'
-
-                        # Populate table
-                        for row_idx, row_data in enumerate(all_rows):
-                            for col_idx, cell_data in enumerate(row_data):
-                                if col_idx < len(table.rows[row_idx].cells):
-                                    cell = table.rows[row_idx].cells[col_idx]
-                                    # Clean markdown from cell text
-                                    cell.text = clean_markdown_text(str(cell_data))
-
-                        # Make the first row (the header row when present) bold.
-                        header_cells = table.rows[0].cells
-                        for cell in header_cells:
-                            for paragraph in cell.paragraphs:
-                                for run in paragraph.runs:
-                                    run.bold = True
+                        # The first row (the header row when present) is bolded.
+                        _add_docx_table(doc, all_rows, grid_style)
             
             # Add spacing between sections
             doc.add_paragraph("")
@@ -786,23 +897,7 @@ def render_brd_json_to_docx(brd_data) -> bytes:
                 if table_rows:
                     table_data = parse_markdown_table('\n'.join(table_rows))
                     if table_data and len(table_data) > 0:
-                        # Determine max columns
-                        max_cols = max(len(row) for row in table_data)
-                        table = doc.add_table(rows=len(table_data), cols=max_cols)
-                        table.style = 'Light Grid Accent 1'
-                        for row_idx, row_data in enumerate(table_data):
-                            for col_idx, cell_data in enumerate(row_data):
-                                if col_idx < len(table.rows[row_idx].cells):
-                                    cell = table.rows[row_idx].cells[col_idx]
-                                    # Clean markdown from cell text
-                                    cell.text = clean_markdown_text(str(cell_data))
-                        # Make header row bold
-                        if len(table_data) > 0:
-                            header_cells = table.rows[0].cells
-                            for cell in header_cells:
-                                for paragraph in cell.paragraphs:
-                                    for run in paragraph.runs:
-                                        run.bold = True
+                        _add_docx_table(doc, table_data, grid_style)
                 
                 i = j  # Skip processed table lines
             else:
@@ -841,11 +936,14 @@ def render_brd_json_to_docx(brd_data) -> bytes:
             if cleaned:
                 doc.add_paragraph(cleaned)
     
+    if out is not None:
+        doc.save(out)
+        return out
+
     # Save to bytes
     docx_bytes = io.BytesIO()
     doc.save(docx_bytes)
-    docx_bytes.seek(0)
-    return docx_bytes.read()
+    return docx_bytes.getvalue()
 
 # Initialize clients on startup
 try:
@@ -871,9 +969,32 @@ except Exception as e:
     logger.info("  - Environment variables: AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY")
     logger.info("  - Or use AWS SSO/credentials file")
 
+_W_P = qn("w:p")
+
+# Run inner-content that Paragraph.text renders, in document order. Only
+# direct w:r / w:hyperlink runs count, as in python-docx, so tab stops under
+# w:pPr and text in tracked insertions are not picked up.
+_RUN_TEXT_XPATH = etree.XPath(
+    " | ".join(
+        f"{run}/w:{child}"
+        for run in ("w:r", "w:hyperlink/w:r")
+        for child in ("t", "tab", "ptab", "br", "cr", "noBreakHyphen")
+    ),
+    namespaces={"w": nsmap["w"]},
+)
+
+
 def read_docx(file_content):
-    doc = Document(io.BytesIO(file_content))
-    return "\n".join([p.text for p in doc.paragraphs])
+    # Walk the lxml tree directly instead of building python-docx Paragraph /
+    # Run proxies: one line per top-level body paragraph (same scope as
+    # doc.paragraphs). The oxml element classes give each run child its text
+    # equivalent (w:tab -> "\t", line-wrap w:br / w:cr -> "\n"), matching
+    # Paragraph.text.
+    body = Document(io.BytesIO(file_content)).element.body
+    return "\n".join(
+        "".join(str(e) for e in _RUN_TEXT_XPATH(p))
+        for p in body.iterchildren(_W_P)
+    )
 
 def read_pdf(file_content):
     # Use `pypdf` (the modern fork) —" it's what requirements.txt installs.
@@ -892,6 +1013,248 @@ def extract_text(file_content, filename):
     else:
         return file_content.decode("utf-8", errors="replace")
 
+# The /generate endpoints extract transcript(s) + template concurrently on
+# worker threads instead of serially on the event loop. python-docx and
+# pypdf jobs are short, and a thread pool avoids forking a multithreaded
+# server (inherited locks), pickling upload bytes to workers, and a broken
+# process pool after one worker dies.
+async def _extract_texts_parallel(jobs):
+    """Run ``(func, *args)`` extraction jobs concurrently on worker threads.
+
+    Returns results in submission order, mirroring ``asyncio.gather``.
+    """
+    return await asyncio.gather(
+        *(asyncio.to_thread(func, *args) for func, *args in jobs)
+    )
+
+def _consume_agent_stream(chunks):
+    """Drain an AgentCore runtime response stream.
+
+    Returns ``(raw_bytes, result)``. With ijson installed, the top-level
+    ``result`` field of the JSON envelope is decoded as chunks arrive, so
+    parsing overlaps network I/O instead of starting after the last byte.
+    ``result`` is ``None`` when ijson is unavailable, the body isn't JSON, or
+    the key is absent -- callers then fall back to ``json.loads`` on the raw
+    bytes.
+    """
+    buf = bytearray()
+    found = []
+    parser = None
+    if ijson is not None:
+        found = ijson.sendable_list()
+        parser = ijson.items_coro(found, 'result')
+    for chunk in chunks:
+        buf += chunk
+        if parser is not None:
+            try:
+                parser.send(chunk)
+            except ijson.JSONError:
+                parser = None
+    if parser is not None:
+        try:
+            parser.close()
+        except ijson.JSONError:
+            parser = None
+    result = found[0] if parser is not None and found else None
+    return bytes(buf), result
+
+def _read_agent_stream(chunks) -> bytearray:
+    """Drain an AgentCore runtime response stream into one buffer.
+
+    Chunks are kept as bytes and decoded once by the caller: per-chunk
+    decoding breaks on multi-byte characters split across chunk boundaries.
+    """
+    buf = bytearray()
+    for chunk in chunks:
+        buf += chunk
+    return buf
+
+def _invoke_and_read(client, arn: str, session_id: str, payload_bytes: bytes, reader=_read_agent_stream):
+    """Invoke an AgentCore runtime and drain its streamed body with ``reader``.
+
+    Blocking end to end -- both the call and iterating the response body are
+    network I/O -- so handlers run it via ``asyncio.to_thread`` to keep the
+    event loop free.
+    """
+    response = client.invoke_agent_runtime(
+        agentRuntimeArn=arn,
+        runtimeSessionId=session_id,
+        payload=payload_bytes,
+        qualifier="DEFAULT"
+    )
+    return reader(response.get("response", []))
+
+_BRD_STREAM_CHUNK_CHARS = 64 * 1024
+
+
+def _stream_brd_result(brd_text: str, brd_id, session_id):
+    """Yield the /generate success body as UTF-8 JSON fragments.
+
+    Same shape as the JSONResponse it replaces -- ``{result, brd_id,
+    session_id, status}`` -- but the BRD text is escaped slice by slice, so
+    a second fully-serialised copy of a multi-MB BRD is never built in
+    memory before the first byte goes out.
+    """
+    yield b'{"result": "'
+    for i in range(0, len(brd_text), _BRD_STREAM_CHUNK_CHARS):
+        piece = json.dumps(brd_text[i:i + _BRD_STREAM_CHUNK_CHARS], ensure_ascii=False)
+        yield piece[1:-1].encode('utf-8')
+    tail = json.dumps(
+        {'brd_id': brd_id, 'session_id': session_id, 'status': 'success'},
+        ensure_ascii=False,
+    )
+    yield b'", ' + tail[1:].encode('utf-8')
+
+def _make_session_payload(brd_id, session_id, template_text, transcript_text) -> bytes:
+    """Build the BRD chat Lambda ``create_session`` payload as UTF-8 JSON bytes.
+
+    Template/transcript are truncated to 500 chars -- the session only needs
+    a preview, the full text lives with the BRD.
+    """
+    payload = {
+        'action': 'create_session',
+        'brd_id': brd_id,
+        'session_id': session_id,
+        'template': template_text[:500],
+        'transcript': transcript_text[:500],
+    }
+    return _dumps_bytes(payload)
+
+_TIMEOUT_ERRORS = (ReadTimeoutError, ConnectTimeoutError, TimeoutError)
+
+# ClientError codes that mean "your AWS credentials are the problem" -- the
+# error handler re-checks STS for these to give an actionable message.
+_CREDENTIAL_ERROR_CODES = frozenset({
+    "AccessDeniedException",
+    "ExpiredToken",
+    "ExpiredTokenException",
+    "InvalidClientTokenId",
+    "InvalidSignatureException",
+    "UnrecognizedClientException",
+})
+
+# S3 reports a denied GetObject as "AccessDenied" (or a bare "403" when the
+# request carried no body, e.g. head_object); other services use
+# "AccessDeniedException".
+_ACCESS_DENIED_CODES = frozenset({"AccessDeniedException", "AccessDenied", "403"})
+
+
+def _is_timeout_error(err: Exception) -> bool:
+    """True if a boto3 invoke failed because the read/connect timed out."""
+    return isinstance(err, _TIMEOUT_ERRORS)
+
+def _generation_error_response(e: Exception) -> JSONResponse:
+    """Shared 500 reply for the BRD generation endpoints.
+
+    Re-checks AWS credentials when the error looks like an auth failure so
+    the user gets an actionable message instead of a raw botocore string.
+    """
+    error_msg = str(e)
+    logger.info(f"[APP] ERROR: {error_msg}")
+    logger.exception("Exception details:")
+    
+    error_code = e.response.get("Error", {}).get("Code") if isinstance(e, ClientError) else None
+    
+    # Check if it's a credentials issue
+    if error_code in _CREDENTIAL_ERROR_CODES or isinstance(e, (NoCredentialsError, PartialCredentialsError)):
+        creds_valid, creds_info = check_aws_credentials_cached()
+        if not creds_valid:
+            refresh_agent_core_client()
+            error_msg = f"AWS credentials are invalid or expired. Please refresh your credentials.\n\nTo fix:\n1. Run: aws configure\n2. Or set environment variables: AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY\n3. Or refresh AWS SSO: aws sso login\n\nError details: {creds_info}"
+        else:
+            error_msg = f"AWS credentials are valid but access denied. Check IAM permissions for AgentCore.\n\nOriginal error: {error_msg}"
+    
+    return JSONResponse(status_code=500, content={
+        "error": error_msg,
+        "message": error_msg,
+        "type": "AccessDeniedException" if error_code == "AccessDeniedException" else "UnknownError"
+    })
+
+def _finalize_agent_response(full_response_bytes: bytes, streamed_result, template_text: str, transcript_text: str):
+    """Turn a drained AgentCore response into the /generate reply.
+
+    Takes the ``(raw_bytes, result)`` pair from ``_consume_agent_stream``,
+    unwraps the agent's ``{status, brd, brd_id}`` result, queues the BRD
+    chat session, and returns either the streamed BRD body or the raw
+    envelope when it isn't a BRD.
+    """
+    full_response_str = full_response_bytes.decode('utf-8')
+    
+    logger.info(f"[APP] Response length: {len(full_response_str)} chars")
+    logger.info(f"[APP] Response preview: {full_response_str[:300]}")
+    
+    # The agent now returns clean JSON with the BRD
+    try:
+        # First parse the outer response -- skipped when the stream
+        # parser already pulled out the result string.
+        if isinstance(streamed_result, str):
+            result_json = {'result': streamed_result}
+        else:
+            result_json = _loads(full_response_str)
+        logger.info(f"[APP] Parsed as JSON, keys: {list(result_json.keys())}")
+        
+        # The result field contains the agent's response
+        if 'result' in result_json:
+            result_str = result_json['result']
+            logger.info(f"[APP] Result preview: {result_str[:200]}")
+            
+            # Agent now returns JSON with {status, brd, brd_id}
+            try:
+                agent_data = _loads(result_str)
+                logger.info(f"[APP] Agent data keys: {list(agent_data.keys())}")
+                
+                if agent_data.get('brd'):
+                    logger.info(f"[APP] Found BRD! Length: {len(agent_data['brd'])} chars")
+                    brd_id = agent_data.get('brd_id')
+                    
+                    # Create AgentCore Memory session for this BRD.
+                    # Fire-and-forget (InvocationType='Event'): the session
+                    # id is deterministic -- the same brd-session-{brd_id}
+                    # that /api/chat synthesizes when none is supplied --
+                    # so the response doesn't wait on a second Lambda
+                    # round-trip (+ possible cold start) just to learn it.
+                    session_id = None
+                    if brd_id:
+                        session_id = f"brd-session-{brd_id}"
+                        try:
+                            logger.info(f"[APP] Creating AgentCore Memory session for BRD {brd_id}")
+                            lambda_client = get_lambda_client()
+                            lambda_client.invoke(
+                                FunctionName=LAMBDA_BRD_CHAT,
+                                InvocationType='Event',
+                                Payload=_make_session_payload(
+                                    brd_id, session_id, template_text, transcript_text
+                                )
+                            )
+                            logger.info(f"[APP] âœ… Queued session creation: {session_id}")
+                        except Exception as e:
+                            logger.info(f"[APP] âš ï¸  Failed to queue session creation: {e}, will auto-create on first chat")
+                    
+                    if isinstance(agent_data['brd'], str):
+                        return StreamingResponse(
+                            _stream_brd_result(agent_data['brd'], brd_id, session_id),
+                            media_type='application/json',
+                        )
+                    return JSONResponse(content={
+                        'result': agent_data['brd'],
+                        'brd_id': brd_id,
+                        'session_id': session_id,  # Return session_id to frontend
+                        'status': 'success'
+                    })
+            except json.JSONDecodeError:
+                # If result is not JSON, return as-is
+                pass
+        
+        # Not a BRD payload: echo the whole envelope. The stream parser
+        # only materialised `result`, so decode the rest on this path.
+        if streamed_result is not None:
+            result_json = _loads(full_response_str)
+        return JSONResponse(content=result_json)
+        
+    except json.JSONDecodeError as e:
+        logger.info(f"[APP] JSON decode error: {e}")
+        return JSONResponse(content={"result": full_response_str})
+
 @app.get("/", response_class=HTMLResponse)
 async def read_root(request: Request):
     return templates.TemplateResponse("index.html", {"request": request})
@@ -914,10 +1277,12 @@ async def generate_brd(
         logger.info(f"[APP] Transcript file: {transcript.filename} ({len(transcript_content)} bytes)")
         logger.info(f"[APP] Template file: {template.filename} ({len(template_content)} bytes)")
         
-        # 2. Extract text (supports .docx, .pdf, .txt)
-        transcript_text = extract_text(transcript_content, transcript.filename)
-
-        template_text = read_docx(template_content)
+        # 2. Extract text (supports .docx, .pdf, .txt) -- transcript and
+        #    template in parallel
+        transcript_text, template_text = await _extract_texts_parallel([
+            (extract_text, transcript_content, transcript.filename),
+            (read_docx, template_content),
+        ])
 
         logger.info(f"[APP] Transcript text: {len(transcript_text)} chars")
         logger.info(f"[APP] Template text: {len(template_text)} chars")
@@ -937,7 +1302,7 @@ async def generate_brd(
             "transcript": transcript_text,
             "user_id": current_user.get("user_id"),  # for token usage tracking
         }
-        payload_bytes = json.dumps(payload_dict).encode('utf-8')
+        payload_bytes = _dumps_bytes(payload_dict)
         
         logger.info(f"[APP] Payload size: {len(payload_bytes)} bytes")
         
@@ -948,23 +1313,16 @@ async def generate_brd(
         logger.info(f"[APP] Calling agent...")
         logger.info(f"[APP] Note: BRD generation may take 1-3 minutes. Please wait...")
         
-        # Get fresh client to ensure we use latest credentials
         # Increased timeout to 5 minutes for BRD generation
         agent_core_client = get_agent_core_client()
         
         try:
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: agent_core_client.invoke_agent_runtime(
-                    agentRuntimeArn=AGENT_ARN,
-                    runtimeSessionId=session_id,
-                    payload=payload_bytes,
-                    qualifier="DEFAULT"
-                )
+            full_response_bytes, streamed_result = await asyncio.to_thread(
+                _invoke_and_read, agent_core_client, AGENT_ARN, session_id, payload_bytes,
+                _consume_agent_stream
             )
         except Exception as timeout_error:
-            if "timeout" in str(timeout_error).lower() or "ReadTimeoutError" in str(type(timeout_error).__name__):
+            if _is_timeout_error(timeout_error):
                 logger.info(f"[APP] âš ï¸  Request timed out. The agent may still be processing.")
                 logger.info(f"[APP] This can happen if the BRD is very large or the agent is slow.")
                 logger.info(f"[APP] Try checking CloudWatch logs or reducing the transcript/template size.")
@@ -977,98 +1335,15 @@ async def generate_brd(
         
         logger.info(f"[APP] Agent response received")
         
-        # 5. Parse Response
-        content = []
-        for chunk in response.get("response", []):
-            content.append(chunk.decode('utf-8'))
-            
-        full_response_str = ''.join(content)
-        
-        logger.info(f"[APP] Response length: {len(full_response_str)} chars")
-        logger.info(f"[APP] Response preview: {full_response_str[:300]}")
-        
-        # The agent now returns clean JSON with the BRD
-        try:
-            # First parse the outer response
-            result_json = json.loads(full_response_str)
-            logger.info(f"[APP] Parsed as JSON, keys: {list(result_json.keys())}")
-            
-            # The result field contains the agent's response
-            if 'result' in result_json:
-                result_str = result_json['result']
-                logger.info(f"[APP] Result preview: {result_str[:200]}")
-                
-                # Agent now returns JSON with {status, brd, brd_id}
-                try:
-                    agent_data = json.loads(result_str)
-                    logger.info(f"[APP] Agent data keys: {list(agent_data.keys())}")
-                    
-                    if agent_data.get('brd'):
-                        logger.info(f"[APP] Found BRD! Length: {len(agent_data['brd'])} chars")
-                        brd_id = agent_data.get('brd_id')
-                        
-                        # Create AgentCore Memory session for this BRD
-                        session_id = None
-                        if brd_id:
-                            try:
-                                logger.info(f"[APP] Creating AgentCore Memory session for BRD {brd_id}")
-                                # Call Lambda to create session
-                                lambda_client = get_lambda_client()
-                                session_payload = {
-                                    'action': 'create_session',
-                                    'brd_id': brd_id,
-                                    'template': template_text[:500],  # Truncate for session creation
-                                    'transcript': transcript_text[:500]  # Truncate for session creation
-                                }
-                                session_response = lambda_client.invoke(
-                                    FunctionName=LAMBDA_BRD_CHAT,
-                                    InvocationType='RequestResponse',
-                                    Payload=json.dumps(session_payload)
-                                )
-                                session_result = json.loads(session_response['Payload'].read())
-                                if session_result.get('statusCode') == 200:
-                                    session_body = json.loads(session_result.get('body', '{}'))
-                                    session_id = session_body.get('session_id')
-                                    logger.info(f"[APP] âœ… Created session: {session_id}")
-                                else:
-                                    logger.info(f"[APP] âš ï¸  Session creation failed, will auto-create on first chat")
-                            except Exception as e:
-                                logger.info(f"[APP] âš ï¸  Failed to create session: {e}, will auto-create on first chat")
-                        
-                        return JSONResponse(content={
-                            'result': agent_data['brd'],
-                            'brd_id': brd_id,
-                            'session_id': session_id,  # Return session_id to frontend
-                            'status': 'success'
-                        })
-                except json.JSONDecodeError:
-                    # If result is not JSON, return as-is
-                    pass
-            
-            return JSONResponse(content=result_json)
-            
-        except json.JSONDecodeError as e:
-            logger.info(f"[APP] JSON decode error: {e}")
-            return JSONResponse(content={"result": full_response_str})
+        # 5. Parse the response, queue the chat session, build the reply
+        # Finalizing queues the chat-session Lambda (a blocking boto3 call),
+        # so it runs off the event loop too.
+        return await asyncio.to_thread(
+            _finalize_agent_response, full_response_bytes, streamed_result, template_text, transcript_text
+        )
 
     except Exception as e:
-        error_msg = str(e)
-        logger.info(f"[APP] ERROR: {error_msg}")
-        logger.exception("Exception details:")
-        
-        # Check if it's a credentials issue
-        if "AccessDeniedException" in error_msg or "security token" in error_msg.lower() or "invalid" in error_msg.lower():
-            creds_valid, creds_info = check_aws_credentials()
-            if not creds_valid:
-                error_msg = f"AWS credentials are invalid or expired. Please refresh your credentials.\n\nTo fix:\n1. Run: aws configure\n2. Or set environment variables: AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY\n3. Or refresh AWS SSO: aws sso login\n\nError details: {creds_info}"
-            else:
-                error_msg = f"AWS credentials are valid but access denied. Check IAM permissions for AgentCore.\n\nOriginal error: {error_msg}"
-        
-        return JSONResponse(status_code=500, content={
-            "error": error_msg,
-            "message": error_msg,
-            "type": "AccessDeniedException" if "AccessDeniedException" in str(e) else "UnknownError"
-        })
+        return _generation_error_response(e)
 
 @app.post("/api/upload-transcript")
 async def upload_transcript_to_s3(
@@ -1094,7 +1369,8 @@ async def upload_transcript_to_s3(
             logger.info(f"[UPLOAD] Uploading to S3: s3://{bucket_name}/{transcript_key}")
             logger.info(f"[UPLOAD] File: {transcript.filename}, Size: {len(transcript_content)} bytes")
 
-            s3_put_object(
+            await asyncio.to_thread(
+                s3_put_object,
                 key=transcript_key,
                 body=transcript_content,
                 content_type=transcript.content_type or "application/octet-stream",
@@ -1132,14 +1408,307 @@ async def upload_transcript_to_s3(
             "message": f"Failed to upload transcript to S3: {error_msg}"
         })
 
+# In-flight generations keyed by request identity; see _single_flight.
+_inflight_generations = {}
+
+
+def _read_s3_object(s3_client, bucket: str, key: str) -> bytes:
+    """get_object + read the body (blocking; callers run it via asyncio.to_thread)."""
+    return s3_client.get_object(Bucket=bucket, Key=key)['Body'].read()
+
+
+async def _single_flight(key, start):
+    """Run ``start()`` once per ``key`` at a time; concurrent callers await the same task.
+
+    The shared task is shielded so one caller disconnecting does not cancel
+    the work for the others. The entry is dropped as soon as the task ends,
+    so a later identical request starts a fresh run.
+    """
+    task = _inflight_generations.get(key)
+    if task is None:
+        task = asyncio.ensure_future(start())
+        _inflight_generations[key] = task
+        task.add_done_callback(lambda _t: _inflight_generations.pop(key, None))
+    else:
+        # key is (route, user_id, project_id, ...); the route alone says nothing
+        # about which generation is being joined.
+        user_id, project_id = key[1:3]
+        logger.info(f"[APP] Joining in-flight {key[0]} for user={user_id} project={project_id}")
+    return await asyncio.shield(task)
+
+
+# Lambda's async (Event) invoke payload cap, less headroom for the envelope.
+_EVENT_INVOKE_MAX_PAYLOAD_BYTES = 1_000_000 - 16_384
+
+# Transcripts larger than this go to S3 and reach the generator as
+# transcript_s3_bucket/transcript_s3_key (the same 256 KB spill threshold
+# routers/brd.py uses) instead of riding inline in the invoke payload.
+_INLINE_TRANSCRIPT_MAX_BYTES = 256 * 1024
+
+
+def _persist_project_brd_session(project_id: Optional[str], brd_id: str, session_id: Optional[str]) -> None:
+    """Record the BRD session on the project so the user can resume later (non-fatal)."""
+    if not (project_id and brd_id):
+        return
+    try:
+        save_project_brd_session(
+            project_id=project_id,
+            brd_id=brd_id,
+            agentcore_session_id=session_id,
+        )
+        logger.info("[APP] ✅ Persisted BRD session to project %s", project_id)
+    except Exception as e:
+        logger.warning("[APP] ⚠️  Failed to persist BRD session: %s", e)
+
+
+async def _run_generate_brd_from_s3(s3_paths: list, project_id: Optional[str], current_user: dict, t0: float,
+                                    wait: bool = True):
+    """Body of /api/generate-from-s3 once the transcript paths are validated."""
+    s3_client = get_s3_client()
+    bucket_name = S3_BUCKET_NAME
+
+    logger.info(f"[APP] Transcript S3 paths ({len(s3_paths)}): {s3_paths}")
+    logger.info(f"[APP] Template S3 path: {TEMPLATE_S3_KEY}")
+
+    # 1-2. Fetch all transcript files and the template concurrently, off the event loop
+    logger.info(f"[APP] Fetching {len(s3_paths)} transcript(s) and template from S3...")
+    *transcript_bodies, template_content = await asyncio.gather(
+        *(asyncio.to_thread(_read_s3_object, s3_client, bucket_name, key)
+          for key in (*s3_paths, TEMPLATE_S3_KEY))
+    )
+    transcript_contents = list(zip(s3_paths, transcript_bodies))
+    for s3_path, content in transcript_contents:
+        logger.info(f"[APP] File: {s3_path}, Size: {len(content)} bytes")
+    logger.info(f"[APP] Template file: {len(template_content)} bytes")
+
+    # 3. Extract transcript + template text in parallel
+    *transcript_texts, template_text = await _extract_texts_parallel(
+        [(extract_text, content, s3_path) for s3_path, content in transcript_contents]
+        + [(read_docx, template_content)]
+    )
+    transcript_text = "\n\n---\n\n".join(transcript_texts)
+    logger.info(f"[APP] Combined transcript text: {len(transcript_text)} chars")
+
+    logger.info(f"[APP] Transcript text: {len(transcript_text)} chars")
+    logger.info(f"[APP] Template text: {len(template_text)} chars")
+
+    # Validate transcript is not empty
+    if not transcript_text or len(transcript_text.strip()) < 50:
+        return JSONResponse(status_code=400, content={
+            "error": "Transcript is empty or too short. Please upload a transcript with meaningful content."
+        })
+
+    # 4. Generate brd_id + create the analyst_sessions row up front. This
+    #    replaces the legacy LAMBDA_BRD_CHAT session-creation call --
+    #    the unified BRD agent stores chat sessions in this table, and
+    #    /api/brd/* endpoints look them up via get_brd_session.
+    #
+    #    use_long_term_context=True so subsequent chat turns on this
+    #    session benefit from any project-scoped facts the user has
+    #    accumulated. session_id must be >= 33 chars for AgentCore
+    #    Memory; prefix "brd-" gets us to 36.
+    brd_id = str(uuid.uuid4())
+    session_id_memory = f"brd-{uuid.uuid4().hex}"
+
+    if project_id:
+        try:
+            from db_helper import create_session as _create_brd_session
+            # brd_id is stamped in the same INSERT so /api/brd/* readers
+            # see it without a follow-up UPDATE round-trip.
+            await asyncio.to_thread(
+                _create_brd_session,
+                session_id=session_id_memory,
+                project_id=project_id,
+                user_id=current_user.get("user_id"),
+                title="PM generation (from S3)",
+                stage="GENERATING",
+                use_long_term_context=True,
+                brd_id=brd_id,
+            )
+            logger.info("[APP] ✅ Created BRD session: %s (brd_id=%s)", session_id_memory, brd_id)
+        except Exception as _create_err:
+            # If session creation fails (e.g. project doesn't exist in
+            # analyst_sessions's FK target), proceed without it. The
+            # BRD content + ID still gets generated and saved to S3,
+            # the user just won't have a chat session pre-stamped.
+            logger.warning("[APP] ⚠️  Failed to create BRD session (non-fatal): %s", _create_err)
+            session_id_memory = None
+    else:
+        session_id_memory = None
+
+    # 5. Invoke the unified BRD generator (parallel path) DIRECTLY.
+    #    This replaces the dead AgentCore PM Runtime call. Parallel=True
+    #    fans out the 16 sections across BRD_SECTION_PARALLELISM workers
+    #    (~30-40s wall-clock vs. the old ~90s monolithic call).
+    #
+    #    Synchronous invoke by default -- the legacy caller waits for the
+    #    full response, so we preserve that UX. Long-running call up to
+    #    Lambda's 10-minute timeout. wait=False fires an Event invoke and
+    #    returns 202 straight away; the generator reports progress through
+    #    brds/{brd_id}/_generation_status.json (/api/brd/stream/{session_id}).
+    logger.info("[APP] BRD ID: %s", brd_id)
+    logger.debug("[APP] Note: BRD generation runs in parallel; expect ~30-40s.")
+
+    lambda_client = get_lambda_client()
+    generator_payload = {
+        "parallel": True,
+        "brd_id": brd_id,
+        "user_id": current_user.get("user_id"),
+        "project_id": project_id,
+        "session_id": session_id_memory,
+        "template": template_text,
+        "transcript": transcript_text,
+    }
+    # A large transcript is written to S3 once and passed by key: the
+    # generator reads the bytes back directly instead of having a multi-MB
+    # string JSON-encoded into the invoke and re-parsed on the other side.
+    transcript_bytes = transcript_text.encode("utf-8")
+    if len(transcript_bytes) > _INLINE_TRANSCRIPT_MAX_BYTES:
+        transcript_key = f"brd_inputs/{current_user.get('user_id')}/{brd_id}/transcript.txt"
+        await asyncio.to_thread(
+            s3_put_object, key=transcript_key, body=transcript_bytes,
+            content_type="text/plain; charset=utf-8", bucket=bucket_name,
+        )
+        generator_payload["transcript"] = None
+        generator_payload["transcript_s3_bucket"] = bucket_name
+        generator_payload["transcript_s3_key"] = transcript_key
+        logger.info("[APP] Transcript (%d bytes) passed via s3://%s/%s",
+                    len(transcript_bytes), bucket_name, transcript_key)
+    generator_payload_bytes = _dumps_bytes(generator_payload)
+
+    if not wait:
+        if len(generator_payload_bytes) <= _EVENT_INVOKE_MAX_PAYLOAD_BYTES:
+            await asyncio.to_thread(
+                lambda_client.invoke,
+                FunctionName=BRD_GENERATOR_LAMBDA,
+                InvocationType="Event",
+                Payload=generator_payload_bytes,
+            )
+            logger.info("[APP] ✅ Queued BRD generation %s (async)", brd_id)
+            await asyncio.to_thread(_persist_project_brd_session, project_id, brd_id, session_id_memory)
+            return JSONResponse(status_code=202, content={
+                "brd_id": brd_id,
+                "session_id": session_id_memory,
+                "status": "accepted",
+                "status_s3_key": f"brds/{brd_id}/_generation_status.json",
+                "stream_url": f"/api/brd/stream/{session_id_memory}" if session_id_memory else None,
+            })
+        logger.warning("[APP] ⚠️  Payload %d bytes exceeds the async invoke cap; generating synchronously",
+                       len(generator_payload_bytes))
+
+    try:
+        response = await asyncio.to_thread(
+            lambda_client.invoke,
+            FunctionName=BRD_GENERATOR_LAMBDA,
+            InvocationType="RequestResponse",
+            Payload=generator_payload_bytes,
+        )
+    except Exception as timeout_error:
+        if _is_timeout_error(timeout_error):
+            logger.warning("[APP] ⚠️  Generation timed out.")
+            return JSONResponse(status_code=504, content={
+                "error": "BRD generation timeout",
+                "message": "Generation took longer than expected. The worker may still finish; "
+                           "poll /api/brd/{session_id}/sections to check.",
+                "brd_id": brd_id,
+                "session_id": session_id_memory,
+                "type": "TimeoutError",
+            })
+        raise
+
+    # 6. Unwrap the Lambda envelope. _handle_parallel returns a slim
+    #    {brd_id, status, section_count, failed_sections, s3_key,
+    #    mode} body via {statusCode, body}.
+    if "FunctionError" in response:
+        err_body = response.get("Payload").read().decode("utf-8", errors="replace")
+        return JSONResponse(status_code=502, content={
+            "error": "BRD generator failed",
+            "message": err_body[:500],
+            "brd_id": brd_id,
+            "session_id": session_id_memory,
+            "type": "WorkerError",
+        })
+
+    try:
+        outer = _loads(response["Payload"].read())
+        inner_body = outer.get("body") if isinstance(outer, dict) else None
+        generator_result = _loads(inner_body) if isinstance(inner_body, str) else outer
+    except Exception as parse_err:
+        logger.warning("[APP] ⚠️  Generator response parse failed: %s", parse_err)
+        generator_result = {}
+
+    section_count = generator_result.get("section_count", 0)
+    failed_sections = generator_result.get("failed_sections", 0)
+    logger.info("[APP] Generator returned: %s sections, %s failed", section_count, failed_sections)
+
+    # 7. Flip session stage GENERATING -> DRAFTED (or back on full failure).
+    if session_id_memory:
+        try:
+            from db_helper import update_brd_session_stage as _update_stage
+            final_stage = "DRAFTED" if section_count > failed_sections else "GATHERING"
+            _update_stage(session_id_memory, final_stage)
+        except Exception as _stage_err:
+            logger.warning("[APP] ⚠️  Stage update failed (non-fatal): %s", _stage_err)
+
+    # 8. Render the produced brd_structure.json into plain text so the
+    #    legacy frontend (which expects {result: <text>, brd_id, ...})
+    #    keeps working without a UI change.
+    brd_text = ""
+    try:
+        brd_structure = _loads(await asyncio.to_thread(
+            _read_s3_object, s3_client, bucket_name, f"brds/{brd_id}/brd_structure.json"
+        ))
+        brd_text = render_brd_json_to_text(brd_structure)
+    except Exception as render_err:
+        logger.warning("[APP] ⚠️  Could not render BRD structure to text: %s", render_err)
+        brd_text = ("BRD generation completed but the structured render failed. "
+                    "View at /api/brd/" + (session_id_memory or "") + "/sections")
+
+    # Persist BRD session to project so the user can resume later.
+    _persist_project_brd_session(project_id, brd_id, session_id_memory)
+
+    try:
+        from db_helper import track_event
+        track_event(
+            current_user["user_id"],
+            module="brd",
+            event_type="pm_agent_brd_generated",
+            project_id=project_id,
+            metadata={
+                "transcript_s3_paths": s3_paths,
+                "transcript_count": len(s3_paths),
+                "brd_id": brd_id,
+                "section_count": section_count,
+                "failed_sections": failed_sections,
+                "duration_ms": int((time.time() - t0) * 1000),
+            },
+        )
+    except Exception as _track_err:
+        logger.warning("[APP] track_event failed (non-fatal): %s", _track_err)
+
+    return JSONResponse(content={
+        "result": brd_text,
+        "brd_id": brd_id,
+        "session_id": session_id_memory,
+        "section_count": section_count,
+        "failed_sections": failed_sections,
+        "status": "success" if failed_sections == 0 else "partial",
+    })
+
+
 @app.post("/api/generate-from-s3")
 async def generate_brd_from_s3(
     transcript_s3_paths: Optional[str] = Form(None),
     transcript_s3_path: Optional[str] = Form(None),
     project_id: Optional[str] = Form(None),
+    wait: bool = Form(True),
     current_user: dict = Depends(get_current_user)
 ):
-    """Generate BRD from transcript(s) in S3 and template in S3"""
+    """Generate BRD from transcript(s) in S3 and template in S3.
+
+    ``wait=false`` queues the generator asynchronously and returns 202 with
+    the brd_id/session_id to follow instead of blocking until it finishes.
+    """
     t0 = time.time()
     try:
         logger.info("\n" + "="*80)
@@ -1164,244 +1733,17 @@ async def generate_brd_from_s3(
         if not s3_paths:
             return JSONResponse(status_code=400, content={"error": "No transcript S3 paths provided"})
 
-        s3_client = get_s3_client()
-        bucket_name = S3_BUCKET_NAME
-
-        # Template path in S3
-        template_s3_path_key = "templates/Deluxe_BRD_Template.docx"
-
-        logger.info(f"[APP] Transcript S3 paths ({len(s3_paths)}): {s3_paths}")
-        logger.info(f"[APP] Template S3 path: {template_s3_path_key}")
-
-        # 1. Fetch and extract text from all transcript files
-        transcript_texts = []
-        for s3_path in s3_paths:
-            logger.info(f"[APP] Fetching transcript from S3: {s3_path}")
-            resp = s3_client.get_object(Bucket=bucket_name, Key=s3_path)
-            content = resp['Body'].read()
-            logger.info(f"[APP] File: {s3_path}, Size: {len(content)} bytes")
-            text = extract_text(content, s3_path)
-            transcript_texts.append(text)
-
-        transcript_text = "\n\n---\n\n".join(transcript_texts)
-
-        # 2. Fetch template from S3
-        logger.info(f"[APP] Fetching template from S3...")
-        template_response = s3_client.get_object(Bucket=bucket_name, Key=template_s3_path_key)
-        template_content = template_response['Body'].read()
-
-        logger.info(f"[APP] Combined transcript text: {len(transcript_text)} chars")
-        logger.info(f"[APP] Template file: {len(template_content)} bytes")
-
-        # 3. Extract template text
-        template_text = read_docx(template_content)
-
-        logger.info(f"[APP] Transcript text: {len(transcript_text)} chars")
-        logger.info(f"[APP] Template text: {len(template_text)} chars")
-
-        # Validate transcript is not empty
-        if not transcript_text or len(transcript_text.strip()) < 50:
-            return JSONResponse(status_code=400, content={
-                "error": "Transcript is empty or too short. Please upload a transcript with meaningful content."
-            })
-
-        # 4. Generate brd_id + create the analyst_sessions row up front. This
-        #    replaces the legacy LAMBDA_BRD_CHAT session-creation call --
-        #    the unified BRD agent stores chat sessions in this table, and
-        #    /api/brd/* endpoints look them up via get_brd_session.
-        #
-        #    use_long_term_context=True so subsequent chat turns on this
-        #    session benefit from any project-scoped facts the user has
-        #    accumulated. session_id must be >= 33 chars for AgentCore
-        #    Memory; prefix "brd-" gets us to 36.
-        brd_id = str(uuid.uuid4())
-        session_id_memory = f"brd-{uuid.uuid4().hex}"
-
-        if project_id:
-            try:
-                from db_helper import create_session as _create_brd_session
-                _create_brd_session(
-                    session_id=session_id_memory,
-                    project_id=project_id,
-                    user_id=current_user.get("user_id"),
-                    title="PM generation (from S3)",
-                    stage="GENERATING",
-                    use_long_term_context=True,
-                )
-                # Stamp brd_id on the row so /api/brd/* readers see it.
-                try:
-                    from db_helper import update_session as _update_brd_session
-                    _update_brd_session(session_id=session_id_memory, brd_id=brd_id)
-                except Exception as _update_err:
-                    print(f"[APP] ⚠️  Failed to stamp brd_id on session: {_update_err}")
-                print(f"[APP] ✅ Created BRD session: {session_id_memory} (brd_id={brd_id})")
-            except Exception as _create_err:
-                # If session creation fails (e.g. project doesn't exist in
-                # analyst_sessions's FK target), proceed without it. The
-                # BRD content + ID still gets generated and saved to S3,
-                # the user just won't have a chat session pre-stamped.
-                print(f"[APP] ⚠️  Failed to create BRD session (non-fatal): {_create_err}")
-                session_id_memory = None
-        else:
-            session_id_memory = None
-
-        # 5. Invoke the unified BRD generator (parallel path) DIRECTLY.
-        #    This replaces the dead AgentCore PM Runtime call. Parallel=True
-        #    fans out the 16 sections across BRD_SECTION_PARALLELISM workers
-        #    (~30-40s wall-clock vs. the old ~90s monolithic call).
-        #
-        #    Synchronous invoke -- the legacy caller waits for the full
-        #    response, so we preserve that UX. Long-running call up to
-        #    Lambda's 10-minute timeout.
-        print(f"[APP] BRD ID: {brd_id}")
-        print(f"[APP] Note: BRD generation runs in parallel; expect ~30-40s.")
-
-        lambda_client = get_lambda_client()
-        generator_payload = {
-            "parallel": True,
-            "brd_id": brd_id,
-            "user_id": current_user.get("user_id"),
-            "project_id": project_id,
-            "session_id": session_id_memory,
-            "template": template_text,
-            "transcript": transcript_text,
-        }
-
-        try:
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: lambda_client.invoke(
-                    FunctionName=os.getenv(
-                        "BRD_GENERATOR_LAMBDA", "sdlc-dev-brd-generator"
-                    ),
-                    InvocationType="RequestResponse",
-                    Payload=json.dumps(generator_payload).encode("utf-8"),
-                ),
-            )
-        except Exception as timeout_error:
-            if (
-                "timeout" in str(timeout_error).lower()
-                or "ReadTimeoutError" in str(type(timeout_error).__name__)
-            ):
-                print(f"[APP] ⚠️  Generation timed out.")
-                return JSONResponse(status_code=504, content={
-                    "error": "BRD generation timeout",
-                    "message": "Generation took longer than expected. The worker may still finish; "
-                               "poll /api/brd/{session_id}/sections to check.",
-                    "brd_id": brd_id,
-                    "session_id": session_id_memory,
-                    "type": "TimeoutError",
-                })
-            raise
-
-        # 6. Unwrap the Lambda envelope. _handle_parallel returns a slim
-        #    {brd_id, status, section_count, failed_sections, s3_key,
-        #    mode} body via {statusCode, body}.
-        if "FunctionError" in response:
-            err_body = response.get("Payload").read().decode("utf-8", errors="replace")
-            return JSONResponse(status_code=502, content={
-                "error": "BRD generator failed",
-                "message": err_body[:500],
-                "brd_id": brd_id,
-                "session_id": session_id_memory,
-                "type": "WorkerError",
-            })
-
-        try:
-            outer = json.loads(response["Payload"].read())
-            inner_body = outer.get("body") if isinstance(outer, dict) else None
-            generator_result = json.loads(inner_body) if isinstance(inner_body, str) else outer
-        except Exception as parse_err:
-            print(f"[APP] ⚠️  Generator response parse failed: {parse_err}")
-            generator_result = {}
-
-        section_count = generator_result.get("section_count", 0)
-        failed_sections = generator_result.get("failed_sections", 0)
-        print(f"[APP] Generator returned: {section_count} sections, {failed_sections} failed")
-
-        # 7. Flip session stage GENERATING -> DRAFTED (or back on full failure).
-        if session_id_memory:
-            try:
-                from db_helper import update_brd_session_stage as _update_stage
-                final_stage = "DRAFTED" if section_count > failed_sections else "GATHERING"
-                _update_stage(session_id_memory, final_stage)
-            except Exception as _stage_err:
-                print(f"[APP] ⚠️  Stage update failed (non-fatal): {_stage_err}")
-
-        # 8. Render the produced brd_structure.json into plain text so the
-        #    legacy frontend (which expects {result: <text>, brd_id, ...})
-        #    keeps working without a UI change.
-        brd_text = ""
-        try:
-            structure_resp = s3_client.get_object(
-                Bucket=bucket_name,
-                Key=f"brds/{brd_id}/brd_structure.json",
-            )
-            brd_structure = json.loads(structure_resp["Body"].read().decode("utf-8"))
-            brd_text = render_brd_json_to_text(brd_structure)
-        except Exception as render_err:
-            print(f"[APP] ⚠️  Could not render BRD structure to text: {render_err}")
-            brd_text = ("BRD generation completed but the structured render failed. "
-                        "View at /api/brd/" + (session_id_memory or "") + "/sections")
-
-        # Persist BRD session to project so the user can resume later.
-        if project_id and brd_id:
-            try:
-                save_project_brd_session(
-                    project_id=project_id,
-                    brd_id=brd_id,
-                    agentcore_session_id=session_id_memory,
-                )
-                print(f"[APP] ✅ Persisted BRD session to project {project_id}")
-            except Exception as e:
-                print(f"[APP] ⚠️  Failed to persist BRD session: {e}")
-
-        try:
-            from db_helper import track_event
-            track_event(
-                current_user["user_id"],
-                module="brd",
-                event_type="pm_agent_brd_generated",
-                project_id=project_id,
-                metadata={
-                    "transcript_s3_paths": s3_paths,
-                    "transcript_count": len(s3_paths),
-                    "brd_id": brd_id,
-                    "section_count": section_count,
-                    "failed_sections": failed_sections,
-                    "duration_ms": int((time.time() - t0) * 1000),
-                },
-            )
-        except Exception as _track_err:
-            print(f"[APP] track_event failed (non-fatal): {_track_err}")
-
-        return JSONResponse(content={
-            "result": brd_text,
-            "brd_id": brd_id,
-            "session_id": session_id_memory,
-            "section_count": section_count,
-            "failed_sections": failed_sections,
-            "status": "success" if failed_sections == 0 else "partial",
-        })
+        # A double-clicked "Generate" posts the same transcripts twice; the
+        # second request joins the first instead of invoking the generator
+        # Lambda again and racing it to the same S3 keys.
+        flight_key = ("generate-from-s3", current_user.get("user_id"), project_id, tuple(s3_paths), wait)
+        return await _single_flight(
+            flight_key,
+            lambda: _run_generate_brd_from_s3(s3_paths, project_id, current_user, t0, wait),
+        )
 
     except Exception as e:
-        error_msg = str(e)
-        logger.info(f"[APP] ERROR: {error_msg}")
-        logger.exception("Exception details:")
-        
-        if "AccessDeniedException" in error_msg or "security token" in error_msg.lower() or "invalid" in error_msg.lower():
-            creds_valid, creds_info = check_aws_credentials()
-            if not creds_valid:
-                error_msg = f"AWS credentials are invalid or expired. Please refresh your credentials.\n\nTo fix:\n1. Run: aws configure\n2. Or set environment variables: AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY\n3. Or refresh AWS SSO: aws sso login\n\nError details: {creds_info}"
-            else:
-                error_msg = f"AWS credentials are valid but access denied. Check IAM permissions for AgentCore.\n\nOriginal error: {error_msg}"
-        
-        return JSONResponse(status_code=500, content={
-            "error": error_msg,
-            "message": error_msg,
-            "type": "AccessDeniedException" if "AccessDeniedException" in str(e) else "UnknownError"
-        })
+        return _generation_error_response(e)
 
 @app.post("/api/chat")
 async def chat_with_agent(
@@ -1411,9 +1753,8 @@ async def chat_with_agent(
     current_user: dict = Depends(get_current_user)
 ):
     try:
-        logger.info(f"\n[CHAT] Message: {message}")
-        logger.info(f"[CHAT] BRD ID: {brd_id}")
-        logger.info(f"[CHAT] Session ID: {session_id} (length: {len(session_id)})")
+        logger.debug("[CHAT] Message: %s", message)
+        logger.info(f"[CHAT] BRD ID: {brd_id}, Session ID: {session_id}")
         
         # Ensure brd_id is valid (not "none")
         if brd_id == "none" or not brd_id:
@@ -1440,105 +1781,52 @@ async def chat_with_agent(
             "session_id": session_id,  # Pass session_id so agent can use it
             "user_id": current_user.get("user_id"),  # for token usage tracking
         }
-        payload_bytes = json.dumps(payload_dict).encode('utf-8')
+        payload_bytes = _dumps_bytes(payload_dict)
         
-        logger.info(f"[CHAT] Payload: {payload_dict}")
-        logger.info(f"[CHAT] Calling agent...")
+        logger.debug("[CHAT] Payload: %s", payload_dict)
+        logger.info("[CHAT] Calling agent...")
         
-        # Get fresh client to ensure we use latest credentials
         agent_core_client = get_agent_core_client()
         
         # Use the consistent session_id as runtimeSessionId so that conversation
         # events are stored in AgentCore Memory under this session and can be
         # retrieved later by /api/brd-history.
-        logger.info(f"[CHAT] Using runtimeSessionId: {session_id}")
-
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None,
-            lambda: agent_core_client.invoke_agent_runtime(
-                agentRuntimeArn=AGENT_ARN,
-                runtimeSessionId=session_id,
-                payload=payload_bytes,
-                qualifier="DEFAULT"
-            )
+        logger.debug("[CHAT] Using runtimeSessionId: %s", session_id)
+
+        full_response_bytes = await asyncio.to_thread(
+            _invoke_and_read, agent_core_client, AGENT_ARN, session_id, payload_bytes
         )
+        # The agent has written this turn to memory; don't serve stale history.
+        _invalidate_memory_events(session_id)
 
-        content = []
-        for chunk in response.get("response", []):
-            content.append(chunk.decode('utf-8'))
-            
-        full_response_str = ''.join(content)
-        logger.info(f"[CHAT] Raw response: {full_response_str[:500]}")
-        logger.info(f"[CHAT] Raw response type: {type(full_response_str)}")
-        logger.info(f"[CHAT] Raw response length: {len(full_response_str)}")
+        full_response_str = full_response_bytes.decode('utf-8')
+        logger.debug("[CHAT] Raw response (%d chars): %.500s", len(full_response_str), full_response_str)
         
-        # Parse the agent response to extract the actual text content
-        final_text = None
-        try:
-            result_json = json.loads(full_response_str)
-            logger.info(f"[CHAT] Parsed JSON, keys: {list(result_json.keys()) if isinstance(result_json, dict) else 'Not a dict'}")
-            logger.info(f"[CHAT] Parsed JSON type: {type(result_json)}")
-
-            # AgentCore returns responses in format: {'role': 'assistant', 'content': [{'text': '...'}]}
-            # Extract the text from the content array
-            extracted_text = None
-
-            if isinstance(result_json, dict):
-                # Check for 'content' field with text
-                if 'content' in result_json:
-                    content_list = result_json['content']
-                    if isinstance(content_list, list) and len(content_list) > 0:
-                        first_content = content_list[0]
-                        if isinstance(first_content, dict) and 'text' in first_content:
-                            extracted_text = first_content['text']
-
-                # Also check for 'result' field (some responses use this)
-                if not extracted_text and 'result' in result_json:
-                    result_value = result_json['result']
-                    if isinstance(result_value, str):
-                        extracted_text = result_value
-                    elif isinstance(result_value, dict):
-                        # Try to extract from nested result
-                        if 'content' in result_value:
-                            content_list = result_value['content']
-                            if isinstance(content_list, list) and len(content_list) > 0:
-                                first_content = content_list[0]
-                                if isinstance(first_content, dict) and 'text' in first_content:
-                                    extracted_text = first_content['text']
-
-                # Check for direct 'text' or 'message' fields
-                if not extracted_text:
-                    extracted_text = result_json.get('text') or result_json.get('message') or result_json.get('response')
-
-            # Determine final_text from extraction results
-            if extracted_text:
-                logger.info(f"[CHAT] âœ… Extracted text successfully: {extracted_text[:200]}")
-                logger.info(f"[CHAT] Extracted text type: {type(extracted_text)}")
-                logger.info(f"[CHAT] Extracted text length: {len(extracted_text)}")
-                if not isinstance(extracted_text, str):
-                    extracted_text = str(extracted_text)
-                final_text = extracted_text
-            else:
-                logger.info(f"[CHAT] Could not extract text, trying to format response")
-                if isinstance(result_json, dict):
-                    for key in ['text', 'message', 'content', 'result', 'response', 'answer']:
-                        if key in result_json:
-                            value = result_json[key]
-                            if isinstance(value, str) and value.strip():
-                                final_text = value
-                                break
-                            elif isinstance(value, list) and len(value) > 0:
-                                if isinstance(value[0], dict) and 'text' in value[0]:
-                                    final_text = value[0]['text']
-                                    break
-
-                if not final_text:
-                    final_text = json.dumps(result_json, indent=2) if isinstance(result_json, dict) else full_response_str
-
-        except json.JSONDecodeError:
-            logger.info(f"[CHAT] Response is not JSON, returning as text")
-            final_text = full_response_str
+        # Parse the agent response to extract the actual text content.
+        # Only a JSON object can carry extractable text, so plain-text replies
+        # (and bare JSON arrays/scalars, which were echoed as-is anyway) skip
+        # the decoder instead of having it scan the whole body before failing.
+        final_text = full_response_str
+        if first_non_ws(full_response_str) != '{':
+            logger.debug("[CHAT] Response is not a JSON object, returning as text")
+        else:
+            try:
+                # A body that opens with '{' and parses is always a dict, so
+                # nothing downstream re-checks the type.
+                result_json = _loads(full_response_bytes)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("[CHAT] Parsed JSON, keys: %s", list(result_json))
+
+                extracted = extract_agent_text(result_json)
+                if extracted:
+                    final_text = extracted
+                    logger.debug("[CHAT] Extracted text (%d chars): %.200s", len(final_text), final_text)
+                else:
+                    logger.info("[CHAT] Could not extract text, returning formatted response")
+                    final_text = json.dumps(result_json, indent=2)
+
+            except json.JSONDecodeError:
+                logger.debug("[CHAT] Response is not JSON, returning as text")
 
         return JSONResponse(content={
             "result": final_text,
@@ -1551,10 +1839,13 @@ async def chat_with_agent(
         logger.info(f"[CHAT] ERROR: {error_msg}")
         logger.exception("Exception details:")
         
+        error_code = e.response.get("Error", {}).get("Code") if isinstance(e, ClientError) else None
+        
         # Check if it's a credentials issue
-        if "AccessDeniedException" in error_msg or "security token" in error_msg.lower() or "invalid" in error_msg.lower():
-            creds_valid, creds_info = check_aws_credentials()
+        if error_code in _CREDENTIAL_ERROR_CODES or isinstance(e, (NoCredentialsError, PartialCredentialsError)):
+            creds_valid, creds_info = check_aws_credentials_cached()
             if not creds_valid:
+                refresh_agent_core_client()
                 error_msg = f"AWS credentials are invalid or expired. Please refresh your credentials.\n\nTo fix:\n1. Run: aws configure\n2. Or set environment variables: AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY\n3. Or refresh AWS SSO: aws sso login\n\nError details: {creds_info}"
             else:
                 error_msg = f"AWS credentials are valid but access denied. Check IAM permissions for AgentCore.\n\nOriginal error: {error_msg}"
@@ -1562,86 +1853,9 @@ async def chat_with_agent(
         return JSONResponse(status_code=500, content={
             "error": error_msg,
             "result": f"Error: {error_msg}",
-            "type": "AccessDeniedException" if "AccessDeniedException" in str(e) else "UnknownError"
+            "type": "AccessDeniedException" if error_code == "AccessDeniedException" else "UnknownError"
         })
 
-def extract_text_from_analyst_response(response_str: str) -> tuple[str, str]:
-    """
-    Extract plain text message and session_id from analyst agent's JSON response.
-    Handles both direct analyst agent responses and AgentCore-wrapped responses.
-    Returns: (message_text, session_id)
-    """
-    logger.info(f"[extract_text] Called with response length: {len(response_str) if response_str else 0}")
-    
-    if not response_str or not isinstance(response_str, str):
-        logger.info(f"[extract_text] Response is None or not string")
-        return None, None
-    
-    response_trimmed = response_str.strip()
-    if not response_trimmed.startswith('{'):
-        logger.info(f"[extract_text] Response doesn't start with '{{', returning as plain text")
-        return response_str, None
-    
-    logger.info(f"[extract_text] Response starts with '{{'', attempting JSON parse")
-    logger.info(f"[extract_text] First 200 chars: {response_trimmed[:200]}")
-    
-    try:
-        parsed = json.loads(response_trimmed)
-        logger.info(f"[extract_text] JSON parse successful, type: {type(parsed)}")
-        
-        if isinstance(parsed, dict):
-            logger.info(f"[extract_text] Parsed dict keys: {list(parsed.keys())}")
-            
-            # Case 1: Direct analyst agent response: {"result": "...", "session_id": "...", "message": "..."}
-            has_message = 'message' in parsed
-            has_result_and_session = ('result' in parsed and 'session_id' in parsed)
-            logger.info(f"[extract_text] has_message: {has_message}, has_result_and_session: {has_result_and_session}")
-            
-            if has_message or has_result_and_session:
-                message_text = parsed.get('message') or parsed.get('result')
-                session_id = parsed.get('session_id')
-                logger.info(f"[extract_text] Extracted message_text type: {type(message_text)}, length: {len(message_text) if isinstance(message_text, str) else 'N/A'}")
-                logger.info(f"[extract_text] Extracted session_id: {session_id}")
-                
-                if message_text and isinstance(message_text, str):
-                    logger.info(f"[extract_text] âœ… Returning message_text (string)")
-                    return message_text, session_id
-                elif message_text:
-                    # If message_text is not a string, convert it
-                    logger.info(f"[extract_text] âœ… Returning message_text (converted to string)")
-                    return str(message_text), session_id
-                else:
-                    logger.info(f"[extract_text] âš ï¸ message_text is None or empty")
-            
-            # Case 2: AgentCore wrapped response: {"result": "{\"result\": \"...\", \"session_id\": \"...\", \"message\": \"...\"}"}
-            if 'result' in parsed:
-                result_value = parsed.get('result')
-                if isinstance(result_value, str) and result_value.strip().startswith('{'):
-                    # Try to parse the nested JSON string
-                    try:
-                        nested_parsed = json.loads(result_value)
-                        if isinstance(nested_parsed, dict):
-                            nested_message = nested_parsed.get('message') or nested_parsed.get('result')
-                            nested_session_id = nested_parsed.get('session_id')
-                            if nested_message and isinstance(nested_message, str):
-                                return nested_message, nested_session_id
-                    except json.JSONDecodeError:
-                        pass
-            
-            # Case 3: Check for content array format: {"content": [{"text": "..."}]}
-            if 'content' in parsed and isinstance(parsed['content'], list):
-                content_list = parsed['content']
-                if len(content_list) > 0:
-                    first_content = content_list[0]
-                    if isinstance(first_content, dict) and 'text' in first_content:
-                        return first_content['text'], parsed.get('session_id')
-    except json.JSONDecodeError:
-        pass
-    except Exception as e:
-        logger.info(f"[extract_text_from_analyst_response] Error: {e}")
-    
-    return None, None
-
 # â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€â"€
 # Lambda Warm-Up endpoint
 # Called silently when the BRD Analyst page opens to pre-warm Lambda containers
@@ -1657,9 +1871,139 @@ def extract_text_from_analyst_response(response_str: str) -> tuple[str, str]:
 
 
 
+def _first_s3_object(results):
+    """Return the first successful ``get_object`` result, in priority order.
+
+    ``results`` come from ``asyncio.gather(..., return_exceptions=True)``.
+    A missing key (NoSuchKey) falls through to the next candidate; any other
+    error is raised. Returns None when every candidate is missing.
+    """
+    for result in results:
+        if not isinstance(result, BaseException):
+            return result
+        if not (isinstance(result, ClientError)
+                and result.response.get('Error', {}).get('Code') == 'NoSuchKey'):
+            raise result
+    return None
+
+# Bytes the download path's "is this English?" check does not count: every
+# byte except ASCII letters, whitespace and basic punctuation. Used with
+# bytes.translate(None, ...) so the count is one C-level pass.
+_NON_ENGLISH_BYTES = bytes(
+    b for b in range(256)
+    if not (b < 128 and (chr(b).isalpha() or chr(b).isspace() or chr(b) in '.,;:!?()-'))
+)
+
+_DOCX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+def _docx_download_response(buf: io.BytesIO, filename: str) -> StreamingResponse:
+    """Stream a rendered DOCX buffer in chunks (no extra copy into Response.body)."""
+    size = buf.tell()
+    buf.seek(0)
+    return StreamingResponse(
+        iter(lambda: buf.read(_DOWNLOAD_CHUNK_SIZE), b""),
+        media_type=_DOCX_MEDIA_TYPE,
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Content-Length": str(size),
+        }
+    )
+
+# Rendered DOCX files are written through to one S3 object per BRD, tagged
+# with a hash of the source (structure JSON or text) they were rendered from,
+# so a repeat download of an unchanged BRD streams the stored file instead of
+# re-running python-docx. An edit overwrites the same key, so the cache never
+# holds more than one file per BRD. Bump the version whenever
+# render_brd_json_to_docx output changes.
+_DOCX_CACHE_VERSION = "1"
+_DOCX_CACHE_HASH_META = "source-hash"
+# Opt-in: cache hits redirect the client to a short-lived presigned S3 URL
+# instead of proxying the bytes through the API. The SPA downloads with
+# fetch + a Bearer header, so only enable this once the bucket has a CORS rule
+# for the frontend origin; by default cache hits are streamed.
+DOWNLOAD_BRD_PRESIGNED_REDIRECT = os.getenv("DOWNLOAD_BRD_PRESIGNED_REDIRECT", "false").lower() == "true"
+_PRESIGNED_URL_EXPIRES_SECONDS = 300
+
+
+def _docx_cache_key(brd_id: str) -> str:
+    return f"brds/{brd_id}/docx_cache/brd.docx"
+
+
+def _docx_source_hash(source: bytes) -> str:
+    return f"v{_DOCX_CACHE_VERSION}-{hashlib.sha256(source).hexdigest()[:32]}"
+
+
+def _store_docx_cache(cache_key: str, source_hash: str, docx_bytes: bytes, bucket: str) -> None:
+    """Write a rendered DOCX to the S3 cache (runs after the response is sent)."""
+    try:
+        s3_put_object(key=cache_key, body=docx_bytes, content_type=_DOCX_MEDIA_TYPE, bucket=bucket,
+                      metadata={_DOCX_CACHE_HASH_META: source_hash})
+        logger.info(f"[DOWNLOAD] âœ… Cached rendered DOCX at s3://{bucket}/{cache_key}")
+    except Exception as e:
+        logger.info(f"[DOWNLOAD] âš ï¸  Could not cache rendered DOCX: {e}")
+
+
+async def _cached_docx_response(s3_client, bucket_name: str, brd_id: str, source: bytes,
+                                brd_data, background_tasks: BackgroundTasks):
+    """Serve the DOCX for ``brd_data``, reusing a cached render of ``source`` when present.
+
+    A cache hit streams the cached object (or, with
+    DOWNLOAD_BRD_PRESIGNED_REDIRECT, is a 307 to a presigned S3 URL); a miss
+    renders and streams.
+    """
+    filename = f"BRD_{brd_id}.docx"
+    cache_key = _docx_cache_key(brd_id)
+    source_hash = _docx_source_hash(source)
+    cached = None
+    try:
+        if DOWNLOAD_BRD_PRESIGNED_REDIRECT:
+            head = await asyncio.to_thread(s3_client.head_object, Bucket=bucket_name, Key=cache_key)
+            if head.get('Metadata', {}).get(_DOCX_CACHE_HASH_META) == source_hash:
+                url = s3_client.generate_presigned_url(
+                    'get_object',
+                    Params={
+                        'Bucket': bucket_name,
+                        'Key': cache_key,
+                        'ResponseContentDisposition': f'attachment; filename="{filename}"',
+                        'ResponseContentType': _DOCX_MEDIA_TYPE,
+                    },
+                    ExpiresIn=_PRESIGNED_URL_EXPIRES_SECONDS,
+                )
+                logger.info(f"[DOWNLOAD] âœ… Redirecting to cached DOCX s3://{bucket_name}/{cache_key}")
+                return RedirectResponse(url, status_code=307)
+        else:
+            cached = await asyncio.to_thread(s3_client.get_object, Bucket=bucket_name, Key=cache_key)
+            if cached.get('Metadata', {}).get(_DOCX_CACHE_HASH_META) != source_hash:
+                # Rendered from an older version of this BRD
+                cached['Body'].close()
+                cached = None
+    except ClientError as e:
+        # head_object reports a missing key as a bare 404
+        if e.response.get('Error', {}).get('Code') not in ('NoSuchKey', '404'):
+            logger.info(f"[DOWNLOAD] âš ï¸  DOCX cache lookup failed, rendering: {e}")
+
+    if cached is not None:
+        logger.info(f"[DOWNLOAD] âœ… Serving cached DOCX ({cached.get('ContentLength')} bytes)")
+        headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+        if cached.get('ContentLength') is not None:
+            headers["Content-Length"] = str(cached['ContentLength'])
+        return StreamingResponse(
+            cached['Body'].iter_chunks(_DOWNLOAD_CHUNK_SIZE),
+            media_type=_DOCX_MEDIA_TYPE,
+            headers=headers,
+        )
+
+    docx_buf = render_brd_json_to_docx(brd_data, out=io.BytesIO())
+    logger.info(f"[DOWNLOAD] âœ… Converted to DOCX: {docx_buf.tell()} bytes")
+    background_tasks.add_task(_store_docx_cache, cache_key, source_hash, docx_buf.getvalue(), bucket_name)
+    return _docx_download_response(docx_buf, filename)
+
 @app.get("/api/download-brd/{brd_id}")
 async def download_brd(
     brd_id: str,
+    background_tasks: BackgroundTasks,
     download_format: str = Query("docx", alias="format"),
     current_user: dict = Depends(get_current_user)
 ):
@@ -1678,45 +2022,43 @@ async def download_brd(
         # BRD is stored as: brds/{brd_id}/BRD_{brd_id}.txt
         s3_key_txt = f"brds/{brd_id}/BRD_{brd_id}.txt"
         
-        logger.info(f"[DOWNLOAD-BRD] Fetching TXT from s3://{bucket_name}/{s3_key_txt}")
+        logger.info(f"[DOWNLOAD-BRD] Fetching BRD objects from s3://{bucket_name}/brds/{brd_id}/")
         
-        # Get the BRD TXT file from S3
-        try:
-            head_response = s3_client.head_object(Bucket=bucket_name, Key=s3_key_txt)
-            logger.info(f"[DOWNLOAD] âœ… File exists in S3! Size: {head_response.get('ContentLength', 0)} bytes")
-        except ClientError as head_err:
-            head_error_code = head_err.response.get('Error', {}).get('Code', 'Unknown')
-            logger.info(f"[DOWNLOAD] âš ï¸  head_object failed: {head_error_code} - {head_err}")
+        # Fetch every candidate object concurrently -- the structure JSON,
+        # the legacy BRD_{id}.json and the text render -- instead of walking
+        # the fallbacks one S3 round-trip at a time, then use the first hit
+        # in that priority order.
+        json_key = f"brds/{brd_id}/brd_structure.json"
+        legacy_json_key = f"brds/{brd_id}/BRD_{brd_id}.json"
+        fetched = await asyncio.gather(
+            *(asyncio.to_thread(s3_client.get_object, Bucket=bucket_name, Key=key)
+              for key in (json_key, legacy_json_key, s3_key_txt)),
+            return_exceptions=True,
+        )
         
         try:
-            # Try to get BRD JSON structure first (preferred for DOCX conversion)
-            # Check both possible naming conventions
-            json_key = f"brds/{brd_id}/brd_structure.json"
-            try:
-                try:
-                    json_response = s3_client.get_object(Bucket=bucket_name, Key=json_key)
-                except ClientError as e:
-                    if e.response.get('Error', {}).get('Code') == 'NoSuchKey':
-                        json_key = f"brds/{brd_id}/BRD_{brd_id}.json"
-                        json_response = s3_client.get_object(Bucket=bucket_name, Key=json_key)
-                    else:
-                        raise e
-                
+            json_response = _first_s3_object(fetched[:2])
+            text_result = fetched[2]
+            chosen = json_response if json_response is not None else text_result
+            for result in fetched:
+                if result is not chosen and not isinstance(result, BaseException):
+                    result['Body'].close()
+            
+            if json_response is not None:
                 # Read with explicit UTF-8 encoding and error handling
-                json_body = json_response['Body'].read()
+                json_body = await asyncio.to_thread(json_response['Body'].read)
                 logger.info(f"[DOWNLOAD] Read {len(json_body)} bytes from JSON file")
                 
                 # Parse JSON
                 try:
-                    brd_data = json.loads(json_body)
+                    brd_data = _loads(json_body)
                 except json.JSONDecodeError as je:
                     logger.info(f"[DOWNLOAD] âš ï¸ Error parsing BRD JSON: {je}")
                     raise je
 
                 # format=json — return the full structure (with content) as-is.
                 if download_format == "json":
-                    from fastapi.responses import Response
-                    print(f"[DOWNLOAD-BRD] ✅ Returning raw structure JSON ({len(json_body)} bytes)")
+                    logger.debug("[DOWNLOAD-BRD] ✅ Returning raw structure JSON (%d bytes)", len(json_body))
                     return Response(
                         content=json_body,
                         media_type="application/json",
@@ -1725,86 +2067,70 @@ async def download_brd(
                         }
                     )
 
-                # Convert JSON to DOCX
-                docx_bytes = render_brd_json_to_docx(brd_data)
+                # Convert JSON to DOCX (or stream the cached render of this JSON)
+                return await _cached_docx_response(
+                    s3_client, bucket_name, brd_id, json_body, brd_data, background_tasks
+                )
+            else:
+                logger.info(f"[DOWNLOAD] âš ï¸  BRD JSON not found, trying text file...")
+                # Fallback to text file and convert to DOCX
+                if isinstance(text_result, BaseException):
+                    raise text_result
+                response = text_result
+                # Read with explicit UTF-8 encoding and error handling
+                text_body = await asyncio.to_thread(response['Body'].read)
+                logger.info(f"[DOWNLOAD] Read {len(text_body)} bytes from text file")
                 
-                logger.info(f"[DOWNLOAD-BRD] âœ… Converted JSON to DOCX: {len(docx_bytes)} bytes")
+                try:
+                    brd_text = text_body.decode('utf-8')
+                except UnicodeDecodeError as decode_err:
+                    # Try with error handling
+                    logger.info(f"[DOWNLOAD] âš ï¸ UTF-8 decode error: {decode_err}, trying with error replacement")
+                    brd_text = text_body.decode('utf-8', errors='replace')
+                
+                logger.info(f"[DOWNLOAD] âœ… Fetched BRD text from S3 ({len(brd_text)} chars)")
+                logger.info(f"[DOWNLOAD] First 300 chars: {brd_text[:300]}")
+                logger.info(f"[DOWNLOAD] Last 100 chars: {brd_text[-100:]}")
+                
+                # Check if text looks like it's in English (basic check)
+                english_chars = len(brd_text[:500].encode('ascii', 'ignore').translate(None, _NON_ENGLISH_BYTES))
+                total_chars = min(500, len(brd_text))
+                if total_chars > 0:
+                    english_ratio = english_chars / total_chars
+                    logger.info(f"[DOWNLOAD] English character ratio (first 500 chars): {english_ratio:.2%}")
+                    if english_ratio < 0.5:
+                        logger.info(f"[DOWNLOAD] âš ï¸ WARNING: Text may not be in English! Ratio: {english_ratio:.2%}")
                 
-                return Response(
-                    content=docx_bytes,
-                    media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                    headers={
-                        "Content-Disposition": f"attachment; filename=BRD_{brd_id}.docx"
-                    }
+                # Convert text to DOCX with proper markdown parsing
+                # (render_brd_json_to_docx handles string input)
+                return await _cached_docx_response(
+                    s3_client, bucket_name, brd_id, text_body, brd_text, background_tasks
                 )
-            except ClientError as json_err:
-                json_error_code = json_err.response.get('Error', {}).get('Code', '')
-                if json_error_code == 'NoSuchKey':
-                    logger.info(f"[DOWNLOAD] âš ï¸  BRD JSON not found, trying text file...")
-                    # Fallback to text file and convert to DOCX
-                    response = s3_client.get_object(Bucket=bucket_name, Key=s3_key_txt)
-                    # Read with explicit UTF-8 encoding and error handling
-                    text_body = response['Body'].read()
-                    logger.info(f"[DOWNLOAD] Read {len(text_body)} bytes from text file")
-                    
-                    try:
-                        brd_text = text_body.decode('utf-8')
-                    except UnicodeDecodeError as decode_err:
-                        # Try with error handling
-                        logger.info(f"[DOWNLOAD] âš ï¸ UTF-8 decode error: {decode_err}, trying with error replacement")
-                        brd_text = text_body.decode('utf-8', errors='replace')
-                    
-                    logger.info(f"[DOWNLOAD] âœ… Fetched BRD text from S3 ({len(brd_text)} chars)")
-                    logger.info(f"[DOWNLOAD] First 300 chars: {brd_text[:300]}")
-                    logger.info(f"[DOWNLOAD] Last 100 chars: {brd_text[-100:]}")
-                    
-                    # Check if text looks like it's in English (basic check)
-                    english_chars = sum(1 for c in brd_text[:500] if c.isascii() and (c.isalpha() or c.isspace() or c in '.,;:!?()-'))
-                    total_chars = min(500, len(brd_text))
-                    if total_chars > 0:
-                        english_ratio = english_chars / total_chars
-                        logger.info(f"[DOWNLOAD] English character ratio (first 500 chars): {english_ratio:.2%}")
-                        if english_ratio < 0.5:
-                            logger.info(f"[DOWNLOAD] âš ï¸ WARNING: Text may not be in English! Ratio: {english_ratio:.2%}")
-                    
-                    # Convert text to DOCX with proper markdown parsing
-                    docx_content = render_brd_json_to_docx(brd_text)  # This handles string input
-                    
-                    logger.info(f"[DOWNLOAD] âœ… Converted text to DOCX ({len(docx_content)} bytes)")
-                    
-                    from fastapi.responses import Response
-                    return Response(
-                        content=docx_content,
-                        media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                        headers={
-                            "Content-Disposition": f'attachment; filename="BRD_{brd_id}.docx"'
-                        }
-                    )
-                else:
-                    raise json_err
         except ClientError as e:
             error_code = e.response.get('Error', {}).get('Code', 'Unknown')
             error_message = e.response.get('Error', {}).get('Message', str(e))
             
             logger.info(f"[DOWNLOAD] âŒ S3 ClientError: Code={error_code}, Message={error_message}")
-            logger.info(f"[DOWNLOAD] Full error response: {e.response}")
+            logger.debug("[DOWNLOAD] Full error response: %s", e.response)
             
-            # Check credentials
-            try:
-                creds_valid, creds_info = check_aws_credentials()
-                if not creds_valid:
-                    logger.info(f"[DOWNLOAD] âš ï¸  AWS credentials check failed: {creds_info}")
-                    return JSONResponse(
-                        status_code=403,
-                        content={"error": f"AWS credentials invalid or expired. Please refresh credentials. Details: {creds_info}"}
-                    )
-                else:
-                    logger.info(f"[DOWNLOAD] âœ… AWS credentials valid: {creds_info.get('Account', 'Unknown')}")
-            except Exception as cred_err:
-                logger.info(f"[DOWNLOAD] âš ï¸  Could not check credentials: {cred_err}")
+            # Check credentials -- only when the error could be a credential
+            # problem; a missing key (the usual fallback case) skips the STS call.
+            if error_code != 'NoSuchKey':
+                try:
+                    creds_valid, creds_info = check_aws_credentials_cached()
+                    if not creds_valid:
+                        logger.info(f"[DOWNLOAD] âš ï¸  AWS credentials check failed: {creds_info}")
+                        return JSONResponse(
+                            status_code=403,
+                            content={"error": f"AWS credentials invalid or expired. Please refresh credentials. Details: {creds_info}"}
+                        )
+                    else:
+                        logger.info(f"[DOWNLOAD] âœ… AWS credentials valid: {creds_info.get('Account', 'Unknown')}")
+                except Exception as cred_err:
+                    logger.info(f"[DOWNLOAD] âš ï¸  Could not check credentials: {cred_err}")
             
             # Check if it's an access denied error
-            if error_code == 'AccessDeniedException' or '403' in str(error_code) or 'Access Denied' in error_message:
+            if error_code in _ACCESS_DENIED_CODES:
                 return JSONResponse(
                     status_code=403,
                     content={"error": f"Access denied to S3 bucket '{bucket_name}'. Please check IAM permissions for s3:GetObject. Error: {error_message}"}
@@ -1818,16 +2144,15 @@ async def download_brd(
                     json_key = f"brds/{brd_id}/brd_structure.json"
                     try:
                         try:
-                            json_response = s3_client.get_object(Bucket=bucket_name, Key=json_key)
+                            json_body = await asyncio.to_thread(_read_s3_object, s3_client, bucket_name, json_key)
                         except ClientError as e:
                             if e.response.get('Error', {}).get('Code') == 'NoSuchKey':
                                 json_key = f"brds/{brd_id}/BRD_{brd_id}.json"
-                                json_response = s3_client.get_object(Bucket=bucket_name, Key=json_key)
+                                json_body = await asyncio.to_thread(_read_s3_object, s3_client, bucket_name, json_key)
                             else:
                                 raise e
                         
-                        # Read with explicit UTF-8 encoding and error handling
-                        json_body = json_response['Body'].read()
+                        # Decode with explicit UTF-8 encoding and error handling
                         try:
                             json_text = json_body.decode('utf-8')
                         except UnicodeDecodeError:
@@ -1835,7 +2160,7 @@ async def download_brd(
                             json_text = json_body.decode('utf-8', errors='replace')
                             logger.info(f"[DOWNLOAD] âš ï¸ Had to use error replacement for JSON decoding (fallback)")
                         
-                        brd_json = json.loads(json_text)
+                        brd_json = _loads(json_text)
                         logger.info(f"[DOWNLOAD] âœ… Found BRD JSON structure, rendering to text...")
                         
                         # Render BRD JSON to text (see render_brd_json_to_text above).
@@ -1843,7 +2168,8 @@ async def download_brd(
                         
                         # Also save the text file for future downloads
                         try:
-                            s3_put_object(
+                            await asyncio.to_thread(
+                                s3_put_object,
                                 key=s3_key_txt,
                                 body=brd_text,
                                 content_type="text/plain",
@@ -1856,17 +2182,10 @@ async def download_brd(
                         logger.info(f"[DOWNLOAD] âœ… Rendered BRD from JSON ({len(brd_text)} chars)")
                         
                         # Convert to DOCX
-                        docx_bytes = render_brd_json_to_docx(brd_json)
-                        logger.info(f"[DOWNLOAD] âœ… Generated DOCX ({len(docx_bytes)} bytes)")
+                        docx_buf = render_brd_json_to_docx(brd_json, out=io.BytesIO())
+                        logger.info(f"[DOWNLOAD] âœ… Generated DOCX ({docx_buf.tell()} bytes)")
                         
-                        from fastapi.responses import Response
-                        return Response(
-                            content=docx_bytes,
-                            media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                            headers={
-                                "Content-Disposition": f'attachment; filename="BRD_{brd_id}.docx"'
-                            }
-                        )
+                        return _docx_download_response(docx_buf, f"BRD_{brd_id}.docx")
                     except ClientError as json_err:
                         json_error_code = json_err.response.get('Error', {}).get('Code', '')
                         if json_error_code == 'NoSuchKey':
@@ -1875,7 +2194,6 @@ async def download_brd(
                             logger.info(f"[DOWNLOAD] âŒ Error fetching JSON: {json_err}")
                 except Exception as render_err:
                     logger.info(f"[DOWNLOAD] âŒ Failed to render BRD from JSON: {render_err}")
-                    import traceback
                     logger.exception("Exception details:")
                 
                 return JSONResponse(
@@ -1915,6 +2233,77 @@ async def download_brd(
 # BRD Chat History Endpoint (my_agent memory)
 # -------------------------
 
+# The BRD page re-fetches history every time the chat panel mounts, so the
+# last formatted history per (memory, session, actor) is kept briefly.
+# LRU-bounded; /api/chat drops a session's entries after each turn it adds.
+_BRD_HISTORY_CACHE_TTL_SECONDS = 30.0
+_BRD_HISTORY_CACHE_MAX_ENTRIES = 256
+# list_events pages at most 100 events; long sessions are followed through
+# nextToken up to this many events.
+_BRD_HISTORY_MAX_EVENTS = int(os.getenv("BRD_HISTORY_MAX_EVENTS", "2000"))
+_brd_history_cache = OrderedDict()  # key -> (time.monotonic() stamp, formatted messages)
+_brd_history_cache_lock = threading.Lock()
+
+
+def _list_all_memory_events(client, memory_id: str, session_id: str, actor_id: str,
+                            max_events: int = _BRD_HISTORY_MAX_EVENTS) -> list:
+    """list_events (payloads included), following nextToken up to ``max_events`` events."""
+    events = []
+    kwargs = {
+        "memoryId": memory_id,
+        "sessionId": session_id,
+        "actorId": actor_id,
+        "includePayloads": True,
+    }
+    while len(events) < max_events:
+        response = client.list_events(maxResults=min(99, max_events - len(events)), **kwargs)
+        events.extend(response.get("events", []))
+        next_token = response.get("nextToken")
+        if not next_token:
+            break
+        kwargs["nextToken"] = next_token
+    else:
+        logger.warning(f"[BRD-HISTORY] Session {session_id} has more than {max_events} events; truncated")
+    return events
+
+
+def _load_brd_history_cached(client, memory_id: str, session_id: str, actor_id: str) -> list:
+    """Fetch (list_events, all pages) and format a session's chat history, with a short TTL cache.
+
+    The formatted messages are cached rather than the raw events, so a hit
+    skips both the AgentCore round-trip and the sort/format pass.
+    """
+    key = (memory_id, session_id, actor_id)
+    now = time.monotonic()
+    with _brd_history_cache_lock:
+        hit = _brd_history_cache.get(key)
+        if hit is not None and now - hit[0] < _BRD_HISTORY_CACHE_TTL_SECONDS:
+            _brd_history_cache.move_to_end(key)
+            return hit[1]
+
+    events = _list_all_memory_events(client, memory_id, session_id, actor_id)
+    logger.info(f"[BRD-HISTORY] AgentCore returned {len(events)} events")
+    messages = _brd_history_messages(events)
+
+    with _brd_history_cache_lock:
+        _brd_history_cache[key] = (now, messages)
+        _brd_history_cache.move_to_end(key)
+        while len(_brd_history_cache) > _BRD_HISTORY_CACHE_MAX_ENTRIES:
+            _brd_history_cache.popitem(last=False)
+    return messages
+
+
+def _invalidate_memory_events(session_id: str) -> None:
+    """Drop cached history for ``session_id`` (any memory/actor)."""
+    with _brd_history_cache_lock:
+        for key in [k for k in _brd_history_cache if k[1] == session_id]:
+            del _brd_history_cache[key]
+
+
+# Trailing instruction block the frontend appends to section-scoped messages
+_USER_MESSAGE_TRAILER_RE = re.compile(r'\s+IMPORTANT:\s+The user is currently viewing')
+
+
 def _extract_clean_user_message(text: str) -> str:
     """Extract the clean user message from the enhanced context sent to the LLM.
 
@@ -1933,11 +2322,46 @@ def _extract_clean_user_message(text: str) -> str:
         clean = text
 
     # 2. Strip trailing IMPORTANT instruction block —" use regex to handle any whitespace (\n, \r\n, etc.)
-    clean = re.split(r'\s+IMPORTANT:\s+The user is currently viewing', clean, maxsplit=1)[0]
+    clean = _USER_MESSAGE_TRAILER_RE.split(clean, maxsplit=1)[0]
 
     return clean.strip()
 
 
+def _brd_history_messages(events: list) -> list:
+    """Turn memory events into the chat messages /api/brd-history returns, oldest first."""
+    # Sort events by (eventTimestamp, eventId) oldest first.
+    # list_events may return in undefined order. Using eventId as
+    # a secondary key ensures correct ordering when timestamps
+    # are identical or have low precision. Timestamps compare as epoch
+    # seconds (as the Lambdas do), not isoformat strings, so mixed UTC
+    # offsets still order correctly.
+    def _event_sort_key(e):
+        ts = e.get("eventTimestamp")
+        if ts is None:
+            ts_val = 0.0
+        elif hasattr(ts, "timestamp"):
+            ts_val = ts.timestamp()
+        else:
+            try:
+                ts_val = float(ts)
+            except (TypeError, ValueError):
+                ts_val = 0.0
+        return (ts_val, e.get("eventId", ""))
+
+    # User turns carry the enhanced section context; keep only the actual
+    # user message. Roles other than user/assistant are dropped.
+    return [
+        {"role": "user", "content": _extract_clean_user_message(text_content), "isBot": False}
+        if role == "user" else
+        {"role": "assistant", "content": text_content, "isBot": True}
+        for event in sorted(events, key=_event_sort_key)
+        for payload_item in event.get("payload", ())
+        if (conv_data := payload_item.get("conversational"))
+        and (text_content := conv_data.get("content", {}).get("text"))
+        and (role := conv_data.get("role", "assistant").lower()) in ("user", "assistant")
+    ]
+
+
 @app.get("/api/brd-history/{session_id}")
 async def get_brd_chat_history(
     session_id: str,
@@ -1961,58 +2385,9 @@ async def get_brd_chat_history(
         messages = []
 
         try:
-            response = agentcore_client.list_events(
-                memoryId=memory_id,
-                sessionId=session_id,
-                actorId=actor_id,
-                includePayloads=True,
-                maxResults=99
+            messages = await asyncio.to_thread(
+                _load_brd_history_cached, agentcore_client, memory_id, session_id, actor_id
             )
-
-            events = response.get("events", [])
-            logger.info(f"[BRD-HISTORY] AgentCore returned {len(events)} events")
-
-            # Sort events by (eventTimestamp, eventId) oldest first.
-            # list_events may return in undefined order. Using eventId as
-            # a secondary key ensures correct ordering when timestamps
-            # are identical or have low precision.
-            def _event_sort_key(e):
-                ts = e.get("eventTimestamp")
-                if ts is None:
-                    ts_str = ""
-                else:
-                    ts_str = ts.isoformat() if hasattr(ts, "isoformat") else str(ts)
-                eid = e.get("eventId", "")
-                return (ts_str, eid)
-            events = sorted(events, key=_event_sort_key)
-
-            for event in events:
-                payload_list = event.get("payload", [])
-                for payload_item in payload_list:
-                    conv_data = payload_item.get("conversational")
-                    if not conv_data:
-                        continue
-                    text_content = conv_data.get("content", {}).get("text")
-                    if not text_content:
-                        continue
-                    role = conv_data.get("role", "assistant").lower()
-                    if role == "user":
-                        # Strip the enhanced section context; keep only the actual user message
-                        clean_text = _extract_clean_user_message(text_content)
-                        messages.append({
-                            "role": "user",
-                            "content": clean_text,
-                            "isBot": False
-                        })
-                    elif role == "assistant":
-                        messages.append({
-                            "role": "assistant",
-                            "content": text_content,
-                            "isBot": True
-                        })
-
-            # Already sorted oldest-first above —" no need to reverse
-
         except Exception as e:
             logger.info(f"[BRD-HISTORY] AgentCore Memory query failed: {e}")
             logger.exception("Exception details:")
@@ -2158,11 +2533,9 @@ async def get_support_user_guide(current_user: dict = Depends(get_current_user))
 
     s3_client = get_s3_client()
     try:
-        response = s3_client.get_object(
-            Bucket=S3_BUCKET_NAME,
-            Key="support/SDLC_Orchestrator_Userguide_ForTesting.doc",
-        )
-        raw = response["Body"].read().decode("utf-8", errors="ignore")
+        raw = (await asyncio.to_thread(
+            _read_s3_object, s3_client, S3_BUCKET_NAME, "support/SDLC_Orchestrator_Userguide_ForTesting.doc"
+        )).decode("utf-8", errors="ignore")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to load user guide from S3: {e}")
 
@@ -2273,6 +2646,33 @@ async def revoke_brd_access(
     success = revoke_brd_access_via_agentcore(target_user_id)
     return JSONResponse(content={"success": success, "user_id": target_user_id})
 
+@app.get("/api/admin/cache-stats")
+async def get_cache_stats(current_user: dict = Depends(get_current_user)):
+    """Report the in-process caches on the request path.
+
+    The shared boto3 clients and the credential-check verdict are
+    single-slot; the BRD history cache is LRU-bounded. None of them grow
+    with traffic -- this shows whether they are populated and how often
+    the credential memo hits.
+    """
+    cached = _credentials_check_cache
+    return JSONResponse(content={
+        "brd_history": {
+            "entries": len(_brd_history_cache),
+            "max_entries": _BRD_HISTORY_CACHE_MAX_ENTRIES,
+            "ttl_seconds": _BRD_HISTORY_CACHE_TTL_SECONDS,
+        },
+        "credentials_check": {
+            **_credentials_check_stats,
+            "ttl_seconds": _CREDENTIALS_CHECK_TTL_SECONDS,
+            "age_seconds": round(time.monotonic() - cached[0], 1) if cached else None,
+        },
+        "clients": {
+            "agent_core": _agent_core_client is not None,
+            "lambda": _lambda_client is not None,
+        },
+    })
+
 
 # -------------------------
 # BRD Read APIs (S3-backed)
@@ -2286,7 +2686,7 @@ def _load_brd_structure_from_s3(brd_id: str) -> dict:
     try:
         response = s3_client.get_object(Bucket=bucket_name, Key=key)
         body = response["Body"].read()
-        return json.loads(body)
+        return _loads(body)
     except ClientError as e:
         code = e.response.get("Error", {}).get("Code", "Unknown")
         raise HTTPException(status_code=404, detail=f"BRD structure not found in S3 ({code}): {key}")
@@ -2401,7 +2801,7 @@ async def api_get_brd_structure(
     current_user: dict = Depends(get_current_user),
 ):
     """Return the latest structured BRD JSON from S3 (source of truth for sections)."""
-    brd_data = _load_brd_structure_from_s3(brd_id)
+    brd_data = await asyncio.to_thread(_load_brd_structure_from_s3, brd_id)
     return JSONResponse(content={"brd_id": brd_id, "brd": brd_data})
 
 
@@ -2411,7 +2811,7 @@ async def api_list_brd_sections(
     current_user: dict = Depends(get_current_user),
 ):
     """Return user-visible section numbers + titles (use this to build tabs)."""
-    brd_data = _load_brd_structure_from_s3(brd_id)
+    brd_data = await asyncio.to_thread(_load_brd_structure_from_s3, brd_id)
     sections = [{"number": n, "title": re.sub(r"^\\d+\\.\\s*", "", t).strip() or t} for n, _idx, t, _sec in (_iter_user_sections(brd_data) or [])]
     return JSONResponse(content={"brd_id": brd_id, "sections": sections})
 
@@ -2427,7 +2827,7 @@ async def api_get_brd_section(
 
     This is the safest way to power section-tabs: it always reads the newest `brd_structure.json`.
     """
-    brd_data = _load_brd_structure_from_s3(brd_id)
+    brd_data = await asyncio.to_thread(_load_brd_structure_from_s3, brd_id)
     found = _get_user_section_by_number(brd_data, section_number)
     title = found["title"]
     section = found["section"]
@@ -5,10 +5,147 @@ This script ensures that jmespath/ast.py stays in jmespath/ and doesn't shadow P
 """
 
 import os
-import zipfile
+import struct
 import sys
+import time
+import zipfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+# Already-compressed formats: stored without deflate
+STORED_SUFFIXES = frozenset({'.png', '.jpg', '.jpeg', '.gif', '.zip', '.gz', '.whl', '.zst'})
+
+# Files/directories to exclude: set lookups for exact names, one C-level
+# endswith() call for suffixes
+EXCLUDE_DIRS = frozenset({'__pycache__', '.git'})
+EXCLUDE_NAMES = frozenset({'.DS_Store', '.gitignore'})
+EXCLUDE_SUFFIXES = ('.pyc',)
+
+def _iter_package_files(base):
+    """Yield (path, arcname) for every file under base, skipping
+    EXCLUDE_DIRS directories and EXCLUDE_NAMES / EXCLUDE_SUFFIXES files.
+
+    Iterative os.scandir walk: each DirEntry carries its file type from the
+    directory listing, and arcnames are sliced off the known base prefix
+    instead of building a Path per file for relative_to().
+    """
+    base_len = len(base.rstrip(os.sep)) + 1
+    stack = [base]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in EXCLUDE_DIRS:
+                        stack.append(entry.path)
+                elif entry.name in EXCLUDE_NAMES or entry.name.endswith(EXCLUDE_SUFFIXES):
+                    continue
+                else:
+                    # Use forward slashes for zip
+                    yield entry.path, entry.path[base_len:].replace(os.sep, '/')
+
+def _is_stored(path):
+    return os.path.splitext(path)[1].lower() in STORED_SUFFIXES
+
+
+def _write_zip_serial(output_path, entries):
+    """Write entries with zipfile, one file at a time (small packages, and
+    the fallback for archives that need ZIP64)."""
+    with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=9) as zipf:
+        for arcname, file_path in entries:
+            if _is_stored(file_path):
+                zipf.write(file_path, arcname, compress_type=zipfile.ZIP_STORED)
+            else:
+                zipf.write(file_path, arcname)
+
+
+# Below this many files the process-pool start-up costs more than it saves
+PARALLEL_MIN_FILES = 200
+
+# Classic (non-ZIP64) format limits; the parallel writer falls back to
+# zipfile when an archive would exceed them.
+_ZIP_MAX_ENTRIES = 0xFFFF
+_ZIP_MAX_SIZE = 0xFFFFFFFF
+
+
+# Host OS recorded in the central directory, as zipfile does
+_CREATE_SYSTEM = 0 if sys.platform == 'win32' else 3
+
+
+class _Zip64Required(Exception):
+    pass
+
+
+def _compress_entry(file_path):
+    """Worker: read one file and return (crc, size, method, payload, mtime,
+    mode). Payload is raw deflate at level 9, or the bytes unchanged for
+    already-compressed formats."""
+    st = os.stat(file_path)
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    crc = zlib.crc32(data)
+    if _is_stored(file_path):
+        return crc, len(data), zipfile.ZIP_STORED, data, st.st_mtime, st.st_mode
+    c = zlib.compressobj(9, zlib.DEFLATED, -15)
+    payload = c.compress(data) + c.flush()
+    return crc, len(data), zipfile.ZIP_DEFLATED, payload, st.st_mtime, st.st_mode
+
+
+def _dos_datetime(mtime):
+    t = time.localtime(mtime)
+    year = min(max(t.tm_year, 1980), 2107)
+    return (
+        (t.tm_hour << 11) | (t.tm_min << 5) | (t.tm_sec // 2),
+        ((year - 1980) << 9) | (t.tm_mon << 5) | t.tm_mday,
+    )
+
+
+def _write_zip_parallel(output_path, entries):
+    """Deflate entries across a process pool and write the archive here.
+
+    Workers read and compress whole files; the parent writes the PKZIP local
+    headers, payloads and central directory in entry order (the layout
+    zipfile produces, minus ZIP64 - that raises _Zip64Required instead).
+    """
+    if len(entries) >= _ZIP_MAX_ENTRIES:
+        raise _Zip64Required()
+    central = []
+    with open(output_path, 'wb') as out, ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        results = pool.map(_compress_entry, [p for _, p in entries], chunksize=32)
+        for (arcname, _), (crc, size, method, payload, mtime, mode) in zip(entries, results):
+            offset = out.tell()
+            if size > _ZIP_MAX_SIZE or offset + len(payload) > _ZIP_MAX_SIZE:
+                raise _Zip64Required()
+            try:
+                name = arcname.encode('ascii')
+                flags = 0
+            except UnicodeEncodeError:
+                name = arcname.encode('utf-8')
+                flags = 0x800
+            dostime, dosdate = _dos_datetime(mtime)
+            out.write(struct.pack(
+                '<4s2B4HL2L2H', b'PK\003\004', 20, 0, flags, method,
+                dostime, dosdate, crc, len(payload), size, len(name), 0,
+            ))
+            out.write(name)
+            out.write(payload)
+            central.append(struct.pack(
+                '<4s4B4HL2L5H2L', b'PK\001\002', 20, _CREATE_SYSTEM, 20, 0, flags, method,
+                dostime, dosdate, crc, len(payload), size, len(name), 0, 0, 0, 0,
+                (mode & 0xFFFF) << 16, offset,
+            ) + name)
+        cd_offset = out.tell()
+        for record in central:
+            out.write(record)
+        cd_size = out.tell() - cd_offset
+        if cd_offset + cd_size > _ZIP_MAX_SIZE:
+            raise _Zip64Required()
+        out.write(struct.pack(
+            '<4s4H2LH', b'PK\005\006', 0, 0, len(central), len(central),
+            cd_size, cd_offset, 0,
+        ))
+
+
 def create_lambda_zip(package_dir, output_zip):
     """Create a zip file from the package directory, preserving structure."""
     package_path = Path(package_dir)
@@ -19,62 +156,45 @@ def create_lambda_zip(package_dir, output_zip):
         output_path.unlink()
         print(f"  Removed old {output_zip}")
     
-    # Files/directories to exclude
-    exclude_patterns = [
-        '__pycache__',
-        '*.pyc',
-        '.DS_Store',
-        '*.pyc',
-        '.git',
-        '.gitignore',
-    ]
+    print(f"  Creating zip from {package_dir}...")
     
-    # Files to explicitly exclude (should not be at root)
-    exclude_files = ['ast.py']  # Never include ast.py at root level
+    # Collect every entry first so the archive is written in sorted arcname
+    # order: a stable entry order across builds regardless of filesystem
+    # listing order, with each package's files kept together.
+    entries = []
+    for file_path, arcname in _iter_package_files(str(package_path)):
+        # Skip ast.py at root level (it would shadow Python's built-in ast)
+        if arcname == 'ast.py':
+            print(f"  [WARNING] Skipping root-level ast.py: {arcname}")
+            continue
+        entries.append((arcname, file_path))
+    entries.sort()
     
-    print(f"  Creating zip from {package_dir}...")
+    # Verify no ast.py at root level (checked on the entry list, so the
+    # finished zip doesn't have to be reopened and re-read)
+    root_ast_files = [name for name, _ in entries
+                      if name == 'ast.py' or name.startswith('ast.py/')]
+    if root_ast_files:
+        print(f"  [ERROR] Found ast.py at root level in zip: {root_ast_files}")
+        sys.exit(1)
     
-    file_count = 0
-    with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        # Walk through all files in the package directory
-        for root, dirs, files in os.walk(package_path):
-            # Skip __pycache__ directories
-            dirs[:] = [d for d in dirs if d != '__pycache__']
-            
-            for file in files:
-                # Skip .pyc files
-                if file.endswith('.pyc'):
-                    continue
-                
-                # Skip .DS_Store
-                if file == '.DS_Store':
-                    continue
-                
-                # Skip ast.py at root level (it would shadow Python's built-in ast)
-                file_path = Path(root) / file
-                relative_path = file_path.relative_to(package_path)
-                
-                # Check if this is ast.py at root level
-                if file == 'ast.py' and len(relative_path.parts) == 1:
-                    print(f"  [WARNING] Skipping root-level ast.py: {relative_path}")
-                    continue
-                
-                # Add file to zip with proper path
-                arcname = str(relative_path).replace('\\', '/')  # Use forward slashes for zip
-                zipf.write(file_path, arcname)
-                file_count += 1
+    # Max deflate level: a smaller package uploads faster and cold-starts
+    # faster. Already-compressed files are stored as-is - deflating them
+    # again costs CPU and saves nothing. Large packages (boto3/pandas
+    # layers) spread the deflate work across every core.
+    if len(entries) >= PARALLEL_MIN_FILES and (os.cpu_count() or 1) > 1:
+        try:
+            _write_zip_parallel(output_path, entries)
+        except _Zip64Required:
+            print(f"  [WARNING] Package needs ZIP64 - rewriting with zipfile")
+            _write_zip_serial(output_path, entries)
+    else:
+        _write_zip_serial(output_path, entries)
+    file_count = len(entries)
     
     zip_size_mb = output_path.stat().st_size / (1024 * 1024)
     print(f"  [OK] Package created: {output_zip} ({zip_size_mb:.2f} MB, {file_count} files)")
     
-    # Verify no ast.py at root level
-    with zipfile.ZipFile(output_path, 'r') as zipf:
-        root_ast_files = [name for name in zipf.namelist() 
-                         if name == 'ast.py' or name.startswith('ast.py/')]
-        if root_ast_files:
-            print(f"  [ERROR] Found ast.py at root level in zip: {root_ast_files}")
-            sys.exit(1)
-    
     print(f"  [OK] Verified: No ast.py at root level")
     return True
 
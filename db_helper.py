@@ -734,6 +734,7 @@ def create_session(
     title: str = "New Chat",
     stage: str = "NEW",
     use_long_term_context: bool = True,
+    brd_id: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Create a new analyst session.
@@ -751,6 +752,8 @@ def create_session(
             AgentCore Memory and seeds prompts with project context.
             When False, the session starts fresh — no retrieval; writes
             still feed long-term memory for future sessions.
+        brd_id: Optional BRD ID to stamp on the row at insert time, for
+            callers that already know it (saves a follow-up update_session).
 
     Returns:
         Session record as dictionary.
@@ -762,10 +765,10 @@ def create_session(
         with conn.cursor(cursor_factory=RealDictCursor) as cursor:
             cursor.execute("""
                 INSERT INTO analyst_sessions
-                    (id, project_id, user_id, title, stage, use_long_term_context)
-                VALUES (%s, %s, %s, %s, %s, %s)
+                    (id, project_id, user_id, title, stage, use_long_term_context, brd_id)
+                VALUES (%s, %s, %s, %s, %s, %s, %s)
                 RETURNING *
-            """, (session_id, project_id, user_id, title, stage, use_long_term_context))
+            """, (session_id, project_id, user_id, title, stage, use_long_term_context, brd_id))
 
             session = dict(cursor.fetchone())
             conn.commit()
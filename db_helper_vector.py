@@ -872,25 +872,14 @@ def get_surrounding_chunks_batch(
     try:
         cursor = conn.cursor(cursor_factory=RealDictCursor)
         
-        # Build a list of all (source_id, chunk_index) tuples we need to fetch
-        # For each chunk, we need: chunk-1 (before) and chunk+1 (after)
-        fetch_list = []
-        for item in chunk_identifiers:
-            source_id = item['source_id']
-            chunk_index = item['chunk_index']
-            # Add before chunk
-            fetch_list.append((source_id, chunk_index - window))
-            # Add after chunk
-            fetch_list.append((source_id, chunk_index + window))
-        
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_fetch_list = []
-        for sid, cidx in fetch_list:
-            key = (sid, cidx)
-            if key not in seen:
-                seen.add(key)
-                unique_fetch_list.append(key)
+        # Build the (source_id, chunk_index) tuples we need to fetch:
+        # chunk-window (before) and chunk+window (after) for each chunk.
+        # dict.fromkeys dedupes while preserving first-seen order.
+        unique_fetch_list = list(dict.fromkeys(
+            (item['source_id'], item['chunk_index'] + offset)
+            for item in chunk_identifiers
+            for offset in (-window, window)
+        ))
         
         # Single batch query using VALUES and IN clause
         # Build the query dynamically
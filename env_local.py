@@ -19,6 +19,7 @@ import os
 import json
 import logging
 import boto3
+from botocore.config import Config
 from typing import Dict, List, Optional, Union
 
 logger = logging.getLogger(__name__)
@@ -30,9 +31,23 @@ S3_BUCKET_NAME = os.getenv("S3_BUCKET_NAME", "test-development-bucket-siriusai")
 AWS_REGION = os.getenv("AWS_REGION", "us-east-1")
 
 
+_s3_client = None
+
+
 def get_s3_client():
-    """Return a plain boto3 S3 client (no KMS)."""
-    return boto3.client("s3", region_name=AWS_REGION)
+    """Return a cached plain boto3 S3 client (no KMS)."""
+    global _s3_client
+    if _s3_client is None:
+        _s3_client = boto3.client(
+            "s3",
+            region_name=AWS_REGION,
+            config=Config(
+                max_pool_connections=50,
+                retries={"max_attempts": 5, "mode": "adaptive"},
+                tcp_keepalive=True,
+            ),
+        )
+    return _s3_client
 
 
 def s3_put_object(
@@ -40,14 +55,26 @@ def s3_put_object(
     body,
     content_type: str = "application/octet-stream",
     bucket: str = None,
+    metadata: dict = None,
+    if_match: str = None,
+    if_none_match: str = None,
 ) -> str:
-    """Upload an object to S3 without KMS encryption (local dev)."""
+    """Upload an object to S3 without KMS encryption (local dev).
+
+    ``if_match`` / ``if_none_match`` make the write conditional; a failed
+    condition raises ClientError with code "PreconditionFailed".
+    """
     if bucket is None:
         bucket = S3_BUCKET_NAME
     if isinstance(body, str):
         body = body.encode("utf-8")
+    extra = {"Metadata": metadata} if metadata else {}
+    if if_match:
+        extra["IfMatch"] = if_match
+    if if_none_match:
+        extra["IfNoneMatch"] = if_none_match
     client = get_s3_client()
-    client.put_object(Key=key, Body=body, Bucket=bucket, ContentType=content_type)
+    client.put_object(Key=key, Body=body, Bucket=bucket, ContentType=content_type, **extra)
     logger.info(f"[LOCAL S3] Uploaded s3://{bucket}/{key}")
     return f"s3://{bucket}/{key}"
 
@@ -418,7 +445,9 @@ def chat_completion_stream(
 ):
     """
     Stream a chat request directly to AWS Bedrock (local dev — no gateway).
-    Yields SSE-formatted data strings: { type: 'chunk', text: '...' } and a final { type: 'done' }.
+    Yields SSE-formatted data strings: { type: 'chunk', text: '...' } and a final
+    { type: 'done', finish_reason } carrying Bedrock's stop_reason (e.g.
+    'end_turn', 'max_tokens').
 
     Captures token usage from Bedrock's streaming event protocol:
       - `message_start.message.usage` → input + cache fields
@@ -454,6 +483,7 @@ def chat_completion_stream(
     cache_read = 0
     cache_write = 0
     output_tokens = 0
+    stop_reason = None
 
     for event in response["body"]:
         chunk = json.loads(event["chunk"]["bytes"])
@@ -468,6 +498,7 @@ def chat_completion_stream(
             if text:
                 yield f"data: {json.dumps({'type': 'chunk', 'text': text})}\n\n"
         elif etype == "message_delta":
+            stop_reason = (chunk.get("delta") or {}).get("stop_reason") or stop_reason
             u = chunk.get("usage") or {}
             if u:
                 output_tokens = u.get("output_tokens", output_tokens) or output_tokens
@@ -498,4 +529,4 @@ def chat_completion_stream(
             except Exception as e:
                 logger.warning(f"[LOCAL LLM STREAM] token_usage write failed: {e}")
 
-    yield f"data: {json.dumps({'type': 'done'})}\n\n"
+    yield f"data: {json.dumps({'type': 'done', 'finish_reason': stop_reason})}\n\n"
@@ -22,12 +22,14 @@ try:
         qualifier="DEFAULT"
     )
 
-    content = []
+    # Accumulate raw bytes and decode once: a multi-byte UTF-8 character
+    # can be split across chunk boundaries, so per-chunk decode can fail
+    buf = bytearray()
     for chunk in response.get("response", []):
-        content.append(chunk.decode('utf-8'))
+        buf.extend(chunk)
 
     print("Response:")
-    print(json.loads(''.join(content)))
+    print(json.loads(buf))
 
 except Exception as e:
     print(f"Error invoking agent: {e}")
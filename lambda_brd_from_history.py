@@ -3,7 +3,8 @@ BRD from History Lambda Function
 Generates BRD directly from conversation history using Bedrock.
 
 Two paths:
-  - Monolithic (legacy): single chat_completion produces all 16 sections.
+  - Monolithic (legacy): single streamed chat_completion_stream call produces
+    all 16 sections.
   - Parallel (Phase 6, opt-in via event["parallel"]=True): prime-then-
     fan-out using prompts.brd_section_prompts + chat_completion's
     cacheable system blocks. Sections write to
@@ -11,25 +12,89 @@ Two paths:
     final assembly writes brd_structure.json + _generation_status.json.
 """
 
+import hashlib
+import io
 import json
 import logging
 import os
+import re
+import threading
 import time
 import uuid
+import zipfile
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
 # Environment-specific LLM and S3 (local: direct Bedrock + plain S3 | VDI: Gateway + KMS S3)
-from environment import chat_completion, s3_put_object
+from environment import chat_completion, chat_completion_stream, s3_put_object
+
+# lxml (optional, ship it as a layer) parses the template in libxml2 and can
+# filter to <w:p> events in C; libxml2 also caps entity expansion. Without
+# it, defusedxml hardens the ElementTree parse, and plain ElementTree is the
+# last fallback.
+try:
+    from lxml.etree import iterparse as _lxml_iterparse
+except ImportError:
+    _lxml_iterparse = None
+try:
+    from defusedxml.ElementTree import iterparse as _xml_iterparse
+except ImportError:
+    from xml.etree.ElementTree import iterparse as _xml_iterparse
+
+# orjson is an optional speed-up for the S3 artifacts and response envelopes
+# this handler serialises (brd_structure.json can run to hundreds of KB);
+# stdlib json is the fallback when it isn't in the deployment package.
+# The S3 artifacts are only read by services, so they are written compact:
+# indentation added a third to brd_structure.json for no reader's benefit.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError / ValueError,
+    # so existing exception handling is unchanged.
+    _loads = orjson.loads
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+    def _dumps_bytes(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+else:
+    _loads = json.loads
+
+    def _dumps(obj) -> str:
+        return json.dumps(obj)
+
+    def _dumps_bytes(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _reply(status_code: int, /, **body: Any) -> Dict[str, Any]:
+    """{statusCode, body} envelope every handler return path uses.
+    status_code is positional-only so a body field may be named `status`."""
+    return {"statusCode": status_code, "body": _dumps(body)}
+
+
+# Constant envelope body, serialised once at import
+_MISSING_SESSION_BODY = _dumps({"error": "Missing required field: session_id"})
 
 # Import prompts from centralized prompts module
-from prompts import get_brd_from_history_prompt
+from prompts import (
+    BRD_HISTORY_SUMMARY_PROMPT,
+    get_brd_from_history_session_prompt,
+    get_brd_from_history_static_prompt,
+)
+from prompts.cache_control import cached_system_blocks
 
 # Phase 6 — parallel path imports. Reuses the same prompt and
 # validation infrastructure as lambda_brd_generator so the two
 # generation entry points behave identically.
-from prompts.brd_section_definitions import BRD_SECTIONS
+from prompts.brd_section_definitions import BRD_SECTIONS, section_title
 from prompts.brd_section_prompts import (
     build_cached_system_blocks,
     build_section_user_message,
@@ -41,7 +106,7 @@ logger.setLevel(logging.INFO)
 
 # Configuration
 AWS_REGION = os.getenv('AWS_REGION', 'us-east-1')
-from environment import S3_BUCKET_NAME, DEFAULT_AGENTCORE_MEMORY_ID, DEFAULT_AGENTCORE_ACTOR_ID
+from environment import S3_BUCKET_NAME, DEFAULT_AGENTCORE_MEMORY_ID, DEFAULT_AGENTCORE_ACTOR_ID, AGENT_MODEL_PROVIDER
 AGENTCORE_MEMORY_ID = DEFAULT_AGENTCORE_MEMORY_ID
 AGENTCORE_ACTOR_ID = DEFAULT_AGENTCORE_ACTOR_ID
 S3_BUCKET = S3_BUCKET_NAME
@@ -52,31 +117,153 @@ TEMPLATE_S3_KEY = 'templates/Deluxe_BRD_Template.docx'
 BEDROCK_MODEL_ID = os.getenv('BEDROCK_MODEL_ID', 'global.anthropic.claude-sonnet-4-5-20250929-v1:0')
 BEDROCK_GUARDRAIL_ARN = os.getenv('BEDROCK_GUARDRAIL_ARN', '')
 BEDROCK_GUARDRAIL_VERSION = os.getenv('BEDROCK_GUARDRAIL_VERSION', '1')
-MAX_TOKENS = int(os.getenv('BEDROCK_MAX_TOKENS', '32000'))
+# Output ceiling for the monolithic call. The provider reserves
+# input + max_tokens of throughput quota up front, so deployments whose BRDs
+# run well short can lower it. On the gateway path "" or "0" omits the
+# parameter and leaves the ceiling to the gateway/model default. Direct
+# Bedrock (env_local) cannot omit it - chat_completion_stream substitutes
+# 8192 there, which truncates a 16-section BRD - so locally "" or "0"
+# keeps the 32000 default.
+_DEFAULT_MAX_TOKENS = 32000
+MAX_TOKENS = int(os.getenv('BEDROCK_MAX_TOKENS', str(_DEFAULT_MAX_TOKENS)) or 0) or None
+if MAX_TOKENS is None and AGENT_MODEL_PROVIDER != "gateway":
+    MAX_TOKENS = _DEFAULT_MAX_TOKENS
 TEMPERATURE = float(os.getenv('BEDROCK_TEMPERATURE', '0'))
 
-# Lazy loading
-_agentcore_memory_client = None
-_s3_client = None
+# Clients are built at import so Lambda's INIT phase pays the service-model
+# load, not the first invocation; tcp_keepalive keeps the pooled HTTPS
+# connections warm between calls on a reused container.
+_CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=10,
+    retries={'mode': 'standard', 'max_attempts': 3},
+)
+# list_events returns at most 100 events per page; history reads follow
+# nextToken up to this many events per actor so long sessions aren't cut at
+# the first page, while a runaway session still can't exhaust memory.
+HISTORY_MAX_EVENTS = int(os.getenv('BRD_HISTORY_MAX_EVENTS', '2000'))
+# A "running" _generation_status.json younger than this blocks a second
+# parallel run for the same brd_id (client retries, duplicate deliveries).
+# Older markers are treated as abandoned by a crashed/timed-out invocation.
+GENERATION_LOCK_TTL_S = int(os.getenv('BRD_GENERATION_LOCK_TTL_S', '900'))
+
+# Extracted template text kept across warm invocations; see
+# fetch_template_from_s3 for the revalidation rules. The static prompt
+# built from that text (and its digest) is kept too; see _static_prompt.
+TEMPLATE_CACHE_TTL_S = int(os.getenv('BRD_TEMPLATE_CACHE_TTL_S', '300'))
+_TEMPLATE_CACHE: Dict[str, Any] = {
+    "etag": None, "text": None, "checked_at": 0.0,
+    "prompt_template": None, "static_prompt": None, "static_digest": None,
+}
+
+# Opt-in: monolithic BRDs are stored under a hash of the exact generation
+# request (rendered prompt + model settings), so re-running an unchanged
+# session against an unchanged template reuses the earlier text instead of
+# paying for another multi-minute LLM call. Only generations whose stream
+# completed normally are stored. Entries older than the TTL are
+# regenerated; 0 (the default) disables the cache. This code never deletes
+# entries: when enabling it, add an S3 lifecycle rule expiring the
+# brd_generation_cache/ prefix (see docs/LAMBDA_FUNCTIONS_EXPLAINED.md).
+GENERATION_CACHE_TTL_S = int(os.getenv('BRD_GENERATION_CACHE_TTL_S', '0'))
+_GENERATION_CACHE_PREFIX = 'brd_generation_cache/'
+
+# Long sessions are condensed before the monolithic call: once the formatted
+# history passes HISTORY_SUMMARY_THRESHOLD_CHARS, everything but the last
+# HISTORY_VERBATIM_MESSAGES messages is replaced by an LLM summary (0
+# disables). The older part is summarised in slices of at most
+# HISTORY_SUMMARY_SLICE_CHARS so no single summary call can overflow the
+# context, and the partial summaries are reduced the same way until they
+# fit one slice. HISTORY_SUMMARY_MODEL picks a cheaper model where the LLM
+# layer honours it; unset uses the environment default.
+HISTORY_SUMMARY_THRESHOLD_CHARS = int(os.getenv('BRD_HISTORY_SUMMARY_THRESHOLD_CHARS', '40000'))
+HISTORY_VERBATIM_MESSAGES = int(os.getenv('BRD_HISTORY_VERBATIM_MESSAGES', '20'))
+HISTORY_SUMMARY_MODEL = os.getenv('BRD_HISTORY_SUMMARY_MODEL') or None
+HISTORY_SUMMARY_MAX_TOKENS = int(os.getenv('BRD_HISTORY_SUMMARY_MAX_TOKENS', '1500'))
+HISTORY_SUMMARY_SLICE_CHARS = int(os.getenv('BRD_HISTORY_SUMMARY_SLICE_CHARS', '60000'))
+HISTORY_SUMMARY_PARALLELISM = int(os.getenv('BRD_HISTORY_SUMMARY_PARALLELISM', '4'))
+
+_PREWARM_TIMEOUT_S = float(os.getenv('BRD_PREWARM_TIMEOUT_S', '2'))
+
+_agentcore_memory_client = boto3.client('bedrock-agentcore', region_name=AWS_REGION, config=_CLIENT_CONFIG)
+_s3_client = boto3.client('s3', region_name=AWS_REGION, config=_CLIENT_CONFIG)
+
+
+def _prewarm_s3_client() -> None:
+    """Open the S3 client's first TLS connection during Lambda INIT.
+
+    Client construction doesn't touch the network, so without this the
+    first invocation pays the credential fetch and TLS handshake before it
+    can read the template. A HEAD on the bucket resolves credentials and
+    leaves a pooled connection behind. A 403 works just as well. Only runs
+    inside Lambda (AWS_LAMBDA_FUNCTION_NAME is set) so imports in tests and
+    local tooling stay offline. Failures are ignored: the first real call
+    just pays the cost as before. INIT waits at most _PREWARM_TIMEOUT_S, so
+    a network hiccup can't stall container start-up.
+    """
+    if not os.getenv('AWS_LAMBDA_FUNCTION_NAME') or not S3_BUCKET:
+        return
+
+    def _head():
+        try:
+            _s3_client.head_bucket(Bucket=S3_BUCKET)
+        except Exception as e:
+            logger.debug(f"S3 pre-warm skipped: {e}")
+
+    t = threading.Thread(target=_head, name="s3-prewarm", daemon=True)
+    t.start()
+    t.join(timeout=_PREWARM_TIMEOUT_S)
+
 
+_prewarm_s3_client()
 
-def _get_agentcore_memory_client():
-    global _agentcore_memory_client
-    if _agentcore_memory_client is None:
-        _agentcore_memory_client = boto3.client('bedrock-agentcore', region_name=AWS_REGION)
-    return _agentcore_memory_client
+
+def _list_actor_events(client, session_id: str, actor: str) -> List[Dict]:
+    """All events for one actor in a session, read page by page (nextToken)
+    up to HISTORY_MAX_EVENTS. A failed page keeps what was read before it."""
+    events: List[Dict] = []
+    request = {
+        "memoryId": AGENTCORE_MEMORY_ID,
+        "sessionId": session_id,
+        "actorId": actor,
+        "includePayloads": True,
+    }
+    try:
+        while len(events) < HISTORY_MAX_EVENTS:
+            response = client.list_events(
+                maxResults=min(99, HISTORY_MAX_EVENTS - len(events)), **request
+            )
+            events.extend(response.get("events", []))
+            next_token = response.get("nextToken")
+            if not next_token:
+                break
+            request["nextToken"] = next_token
+        else:
+            logger.warning(f"actor={actor} session={session_id}: history truncated at {HISTORY_MAX_EVENTS} events")
+    except Exception as e:
+        logger.warning(f"list_events failed actor={actor} session={session_id}: {e}")
+    return events
 
 
-def _get_s3_client():
-    global _s3_client
-    if _s3_client is None:
-        _s3_client = boto3.client('s3', region_name=AWS_REGION)
-    return _s3_client
+def _max_messages_from_event(evt: Dict) -> int:
+    """Optional `max_messages` from the invoke payload, for callers that
+    only want the tail of a long session in the prompt. Missing or invalid
+    values keep the whole (HISTORY_MAX_EVENTS-bounded) history."""
+    raw = evt.get("max_messages")
+    if raw is None:
+        return HISTORY_MAX_EVENTS
+    try:
+        value = int(raw)
+    except (TypeError, ValueError):
+        value = 0
+    if value < 1:
+        logger.warning(f"Ignoring invalid max_messages={raw!r}")
+        return HISTORY_MAX_EVENTS
+    return min(value, HISTORY_MAX_EVENTS)
 
 
 def get_conversation_history(
     session_id: str,
-    max_messages: int = 99,
+    max_messages: int = HISTORY_MAX_EVENTS,
     user_id: Optional[str] = None,
 ) -> List[Dict]:
     """Get conversation history from AgentCore Memory using the DUAL-ACTOR
@@ -89,9 +276,11 @@ def get_conversation_history(
     session — the symptom that hit Phase 6 testing: worker reported
     "Retrieved 0 messages from history" even after the user chatted.
 
-    Returns events from both actors merged by eventTimestamp ascending.
+    Each actor's events are read page by page (nextToken) up to
+    HISTORY_MAX_EVENTS. Returns the latest `max_messages` messages from both
+    actors merged by eventTimestamp ascending.
     """
-    client = _get_agentcore_memory_client()
+    client = _agentcore_memory_client
 
     # Build the list of actors to query. When user_id is known, query the
     # per-user actor first; always also query the legacy actor for
@@ -109,24 +298,23 @@ def get_conversation_history(
         f"actors={actors} max_messages={max_messages}"
     )
 
+    # Both actors' histories are fetched concurrently: ListEvents has no
+    # payload-type filter or projection to push server-side, so the saving
+    # available is overlapping the per-actor round trips.
+    if len(actors) > 1:
+        with ThreadPoolExecutor(max_workers=len(actors)) as pool:
+            actor_events = list(pool.map(
+                lambda actor: _list_actor_events(client, session_id, actor), actors
+            ))
+    else:
+        actor_events = [_list_actor_events(client, session_id, a) for a in actors]
+
     # Tuples of (eventTimestamp_ms, actor_priority, {role,content}) so we
     # can sort across actors with a stable tiebreak.
     merged: List[Tuple[int, int, Dict]] = []
-    for priority, actor in enumerate(actors):
-        try:
-            response = client.list_events(
-                memoryId=AGENTCORE_MEMORY_ID,
-                sessionId=session_id,
-                actorId=actor,
-                includePayloads=True,
-                maxResults=min(max_messages, 99),
-            )
-        except Exception as e:
-            logger.warning(f"list_events failed actor={actor} session={session_id}: {e}")
-            continue
-
+    for priority, (actor, events) in enumerate(zip(actors, actor_events)):
         actor_msg_count = 0
-        for event in response.get("events", []):
+        for event in events:
             # Convert eventTimestamp (datetime) to epoch ms for sorting.
             ts_raw = event.get("eventTimestamp")
             if ts_raw is None:
@@ -158,28 +346,141 @@ def get_conversation_history(
 
 def format_conversation(messages: List[Dict]) -> str:
     """Format conversation history as readable text"""
-    lines = []
-    
-    for msg in messages:
-        role = "USER" if msg.get("role") == "user" else "ANALYST"
-        content = msg.get("content", "")
-        lines.append(f"{role}: {content}")
-    
-    return "\n\n".join(lines)
+    # Single join over a generator: no intermediate list of formatted lines
+    return "\n\n".join(
+        f"{'USER' if msg.get('role') == 'user' else 'ANALYST'}: {msg.get('content', '')}"
+        for msg in messages
+    )
+
+
+def _pack_slices(segments: List[str], limit: int) -> List[str]:
+    """Greedily join segments with blank lines into slices of at most
+    `limit` characters; a single longer segment is cut into limit-sized
+    pieces."""
+    slices: List[str] = []
+    current: List[str] = []
+    size = 0
+    for segment in segments:
+        for k in range(0, max(len(segment), 1), limit):
+            piece = segment[k:k + limit]
+            if current and size + 2 + len(piece) > limit:
+                slices.append("\n\n".join(current))
+                current, size = [], 0
+            size += len(piece) + (2 if current else 0)
+            current.append(piece)
+    if current:
+        slices.append("\n\n".join(current))
+    return slices
+
+
+def _summarise_slices(slices: List[str], user_id: Optional[str]) -> List[str]:
+    """One summary chat_completion per slice, run concurrently; results in
+    slice order. Raises if any call fails or returns nothing."""
+    def _summarise(text: str) -> str:
+        summary = chat_completion(
+            messages=[{"role": "user", "content": text}],
+            model=HISTORY_SUMMARY_MODEL,
+            system_prompt=BRD_HISTORY_SUMMARY_PROMPT,
+            temperature=0,
+            max_tokens=HISTORY_SUMMARY_MAX_TOKENS,
+            user_id=user_id,
+            token_source="lambda_brd_from_history:summary",
+        )
+        if not summary or not summary.strip():
+            raise ValueError("empty summary")
+        return summary.strip()
+
+    if len(slices) == 1:
+        return [_summarise(slices[0])]
+    with ThreadPoolExecutor(max_workers=max(1, min(HISTORY_SUMMARY_PARALLELISM, len(slices)))) as pool:
+        return list(pool.map(_summarise, slices))
+
+
+def condense_conversation(messages: List[Dict], conversation_text: str, user_id: str = None) -> str:
+    """Bound the conversation sent to the BRD generator.
+
+    Returns conversation_text unchanged while it is under
+    HISTORY_SUMMARY_THRESHOLD_CHARS. Otherwise the older messages are
+    summarised slice by slice (map), the partial summaries are summarised
+    again until they fit one slice (reduce), and the result is followed by
+    the latest HISTORY_VERBATIM_MESSAGES messages verbatim. A failed summary
+    falls back to the full text.
+    """
+    if (
+        HISTORY_SUMMARY_THRESHOLD_CHARS <= 0
+        or len(conversation_text) <= HISTORY_SUMMARY_THRESHOLD_CHARS
+        or len(messages) <= HISTORY_VERBATIM_MESSAGES
+    ):
+        return conversation_text
+
+    split = len(messages) - HISTORY_VERBATIM_MESSAGES
+    head, tail = messages[:split], messages[split:]
+    limit = max(HISTORY_SUMMARY_SLICE_CHARS, 1000)
+    start = time.time()
+    calls = 0
+    try:
+        slices = _pack_slices([format_conversation([m]) for m in head], limit)
+        while True:
+            summaries = _summarise_slices(slices, user_id)
+            calls += len(slices)
+            combined = "\n\n".join(summaries)
+            if len(summaries) == 1 or len(combined) <= limit:
+                break
+            reduced = _pack_slices(summaries, limit)
+            if len(reduced) >= len(slices):
+                # Summaries aren't shrinking; stop rather than loop
+                break
+            slices = reduced
+    except Exception as e:
+        logger.warning(
+            f"History summary failed, sending the full {len(conversation_text)}-character "
+            f"conversation (over the {HISTORY_SUMMARY_THRESHOLD_CHARS} threshold): {e}"
+        )
+        return conversation_text
+
+    condensed = (
+        f"SUMMARY OF EARLIER CONVERSATION ({len(head)} messages):\n{combined}"
+        f"\n\n{format_conversation(tail)}"
+    )
+    logger.info(
+        f"Condensed {len(head)} older messages with {calls} summary calls in "
+        f"{time.time() - start:.1f}s: {len(conversation_text)} -> {len(condensed)} characters"
+    )
+    return condensed
 
 
 def fetch_template_from_s3() -> str:
-    """Fetch BRD template from S3 and extract text"""
-    s3_client = _get_s3_client()
+    """Fetch BRD template from S3 and extract text.
+
+    The extracted text is cached at module scope for warm invocations.
+    Within TEMPLATE_CACHE_TTL_S it is returned without touching S3; after
+    that a conditional GET (If-None-Match on the cached ETag) revalidates
+    it, and only a changed template is downloaded and re-parsed.
+    """
+    s3_client = _s3_client
+    cache = _TEMPLATE_CACHE
+    if cache["text"] is not None and time.time() - cache["checked_at"] < TEMPLATE_CACHE_TTL_S:
+        return cache["text"]
     
     try:
         logger.info(f"Fetching template from s3://{S3_BUCKET}/{TEMPLATE_S3_KEY}")
-        response = s3_client.get_object(Bucket=S3_BUCKET, Key=TEMPLATE_S3_KEY)
+        request = {"Bucket": S3_BUCKET, "Key": TEMPLATE_S3_KEY}
+        if cache["etag"]:
+            request["IfNoneMatch"] = cache["etag"]
+        try:
+            response = s3_client.get_object(**request)
+        except ClientError as e:
+            if cache["text"] is not None and e.response.get("Error", {}).get("Code") in ("304", "NotModified"):
+                cache["checked_at"] = time.time()
+                logger.info("Template unchanged since last fetch, using cached text")
+                return cache["text"]
+            raise
         template_bytes = response['Body'].read()
         
         # Extract text from DOCX
         template_text = extract_text_from_docx(template_bytes)
         logger.info(f"Template extracted: {len(template_text)} characters")
+        cache.update(etag=response.get("ETag"), text=template_text, checked_at=time.time())
         return template_text
         
     except Exception as e:
@@ -187,27 +488,71 @@ def fetch_template_from_s3() -> str:
         raise
 
 
+_W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_W_P = _W_NS + 'p'
+_W_T = _W_NS + 't'
+
+
+def _detach_lxml(elem) -> None:
+    """Drop an lxml paragraph's content and every already-processed sibling
+    before it and before each of its ancestors (earlier body blocks, table
+    rows, cells), so the partial tree stays bounded as iterparse advances."""
+    elem.clear()
+    node = elem
+    parent = node.getparent()
+    while parent is not None:
+        while node.getprevious() is not None:
+            del parent[0]
+        node, parent = parent, parent.getparent()
+
+
 def extract_text_from_docx(docx_bytes: bytes) -> str:
-    """Extract text from DOCX file"""
-    import zipfile
-    import xml.etree.ElementTree as ET
-    import io
-    
+    """Extract text from DOCX file.
+
+    Streams word/document.xml with iterparse and walks it once, handling
+    each top-level paragraph as soon as it closes. Finished elements are
+    detached from the partial tree as parsing advances (paragraphs, and on
+    the ElementTree path also table/row/cell/section elements), so memory
+    stays bounded by the largest paragraph rather than the document.
+    Paragraphs nested inside a paragraph (text boxes) produce the same
+    lines, in the same order, as a findall('.//w:p') walk would.
+    """
     try:
-        zip_file = zipfile.ZipFile(io.BytesIO(docx_bytes))
-        document_xml = zip_file.read('word/document.xml')
-        root = ET.fromstring(document_xml)
-        
-        ns = {'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'}
-        
         paragraphs = []
-        for para in root.findall('.//w:p', ns):
-            texts = []
-            for text_elem in para.findall('.//w:t', ns):
-                if text_elem.text:
-                    texts.append(text_elem.text)
-            if texts:
-                paragraphs.append(''.join(texts))
+        depth = 0
+        # Open elements, innermost last; on the ElementTree path this is how a
+        # finished element finds the parent to detach it from.
+        open_elems = []
+        use_lxml = _lxml_iterparse is not None
+        with zipfile.ZipFile(io.BytesIO(docx_bytes)) as zip_file, \
+                zip_file.open('word/document.xml') as document_xml:
+            if use_lxml:
+                events = _lxml_iterparse(document_xml, events=('start', 'end'), tag=_W_P)
+            else:
+                events = _xml_iterparse(document_xml, events=('start', 'end'))
+            for event, elem in events:
+                if event == 'start':
+                    open_elems.append(elem)
+                    if elem.tag == _W_P:
+                        depth += 1
+                    continue
+                open_elems.pop()
+                if elem.tag == _W_P:
+                    depth -= 1
+                    if not depth:
+                        for para in elem.iter(_W_P):
+                            text = ''.join(t.text for t in para.iter(_W_T) if t.text)
+                            if text:
+                                paragraphs.append(text)
+                if depth:
+                    # Inside a paragraph: its outermost <w:p> still needs it
+                    continue
+                if use_lxml:
+                    _detach_lxml(elem)
+                elif open_elems:
+                    # Earlier siblings were detached when they closed, so this
+                    # is the parent's only child and remove() is O(1)
+                    open_elems[-1].remove(elem)
         
         return '\n'.join(paragraphs)
         
@@ -216,47 +561,157 @@ def extract_text_from_docx(docx_bytes: bytes) -> str:
         raise
 
 
-def generate_brd_with_bedrock(template: str, conversation: str, user_id: str = None) -> str:
-    """Generate BRD using Bedrock AI"""
-    # Build the full prompt using the centralized prompt function
-    prompt = get_brd_from_history_prompt(
-        template=template,
-        conversation=conversation
-    )
+# Stop reasons (Bedrock / OpenAI-compatible) meaning the output hit its ceiling
+_TRUNCATED_FINISH_REASONS = frozenset({"max_tokens", "length"})
+
 
-    logger.info(f"Calling Bedrock with prompt length: {len(prompt)} characters")
-    logger.info(f"Model: {BEDROCK_MODEL_ID}, Max tokens: {MAX_TOKENS}")
+def generate_brd_with_bedrock(template: str, conversation: str, user_id: str = None) -> Tuple[str, bool]:
+    """Generate BRD using Bedrock AI.
+
+    Returns (brd_text, complete). complete is True only when the stream
+    ended with its done event and a finish reason other than an output-limit
+    stop; callers must not cache or reuse an incomplete BRD as final.
+    """
+    # Instructions + template are the same for every generation against this
+    # template, so they go in a cached system block (billed and processed as
+    # a cache read on repeat calls); only the conversation varies per call.
+    static_prompt, _ = _static_prompt(template)
+    session_prompt = get_brd_from_history_session_prompt(conversation)
+
+    logger.info(
+        f"Calling Bedrock with prompt length: {len(static_prompt) + len(session_prompt)} characters "
+        f"({len(static_prompt)} cached)"
+    )
+    logger.info(f"Model: {BEDROCK_MODEL_ID}, Max tokens: {MAX_TOKENS or 'gateway default'}")
 
     try:
-        brd_text = chat_completion(
-            messages=[{"role": "user", "content": prompt}],
+        # Streamed so a long generation arrives over an active connection
+        # instead of one request idling until the whole document is done;
+        # chunks are gathered and joined once at the end.
+        start = time.time()
+        first_chunk_at = None
+        parts: List[str] = []
+        done_event = None
+        for event in chat_completion_stream(
+            messages=[{"role": "user", "content": session_prompt}],
+            system_prompt=cached_system_blocks(static_prompt),
             temperature=TEMPERATURE,
             max_tokens=MAX_TOKENS,
             user_id=user_id,
             token_source="lambda_brd_from_history",
-        )
+        ):
+            if not event.startswith("data: "):
+                continue
+            data = _loads(event[6:])
+            if data.get("type") == "chunk":
+                if first_chunk_at is None:
+                    first_chunk_at = time.time()
+                parts.append(data.get("text", ""))
+            elif data.get("type") == "error":
+                raise RuntimeError(f"LLM stream failed: {data.get('message')}")
+            elif data.get("type") == "done":
+                done_event = data
+        brd_text = "".join(parts).strip()
         
-        logger.info(f"Generated BRD: {len(brd_text)} characters")
-        return brd_text
+        finish_reason = done_event.get("finish_reason") if done_event else None
+        complete = done_event is not None and finish_reason not in _TRUNCATED_FINISH_REASONS
+        ttfb = f"{first_chunk_at - start:.1f}s" if first_chunk_at else "n/a"
+        logger.info(
+            f"Generated BRD: {len(brd_text)} characters "
+            f"(first chunk {ttfb}, total {time.time() - start:.1f}s, finish_reason={finish_reason})"
+        )
+        if not complete:
+            logger.warning(
+                "BRD generation did not complete normally "
+                f"({'no done event' if done_event is None else f'finish_reason={finish_reason}'}); "
+                "the text may be truncated"
+            )
+        return brd_text, complete
         
     except Exception as e:
         logger.error(f"Error calling Bedrock: {e}", exc_info=True)
         raise
 
 
+def _static_prompt(template: str) -> Tuple[str, str]:
+    """(instructions + template prompt, its sha256 hex digest).
+
+    Built once per template text and reused while fetch_template_from_s3
+    keeps returning the same cached string, so warm invocations don't
+    re-concatenate or re-hash the multi-KB fixed part of the prompt.
+    """
+    cache = _TEMPLATE_CACHE
+    if cache["prompt_template"] is not template:
+        static_prompt = get_brd_from_history_static_prompt(template)
+        cache.update(
+            prompt_template=template,
+            static_prompt=static_prompt,
+            static_digest=hashlib.sha256(static_prompt.encode("utf-8")).hexdigest(),
+        )
+    return cache["static_prompt"], cache["static_digest"]
+
+
+def _generation_cache_key(template: str, conversation: str) -> str:
+    """S3 key for the cached BRD text of this exact generation request."""
+    request = "\0".join((
+        _static_prompt(template)[1],
+        get_brd_from_history_session_prompt(conversation),
+        BEDROCK_MODEL_ID,
+        f"{AGENT_MODEL_PROVIDER}:{MAX_TOKENS or 'gateway-default'}",
+        str(TEMPERATURE),
+    ))
+    digest = hashlib.sha256(request.encode("utf-8")).hexdigest()
+    return f"{_GENERATION_CACHE_PREFIX}{digest}.txt"
+
+
+def _load_cached_brd(cache_key: str) -> Optional[str]:
+    """Cached BRD text for cache_key if present and within
+    GENERATION_CACHE_TTL_S, else None. Lookup failures count as a miss."""
+    try:
+        obj = _s3_client.get_object(Bucket=S3_BUCKET, Key=cache_key)
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code') != 'NoSuchKey':
+            logger.warning(f"BRD cache lookup failed, generating: {e}")
+        return None
+    except Exception as e:
+        logger.warning(f"BRD cache lookup failed, generating: {e}")
+        return None
+    age_s = time.time() - obj['LastModified'].timestamp()
+    if age_s > GENERATION_CACHE_TTL_S:
+        obj['Body'].close()
+        return None
+    return obj['Body'].read().decode('utf-8')
+
+
+def _store_cached_brd(cache_key: str, brd_text: str) -> None:
+    """Write generated BRD text to the cache. Best-effort."""
+    try:
+        s3_put_object(key=cache_key, body=brd_text, content_type="text/plain")
+    except Exception as e:
+        logger.warning(f"Could not cache generated BRD at {cache_key}: {e}")
+
+
+# Section-header pattern for convert_brd_to_json, compiled once rather than
+# looked up in the re cache on every line of every BRD
+_SECTION_HEADER_RE = re.compile(r'^(?:SECTION\s+)?(\d+)\.?\s*(.+)$', re.IGNORECASE)
+
+
 def convert_brd_to_json(brd_text: str) -> Dict:
     """
     Convert plain-text BRD into structured JSON format for editing.
     
     Parses sections, paragraphs, bullet points, and tables.
     """
-    import re
-    
     try:
         sections = []
         lines = brd_text.split('\n')
         current_section = None
         current_content = []
+        # Type of the section's last content block ('paragraph' | 'bullet' |
+        # 'table', None when empty) and the block itself, so consecutive
+        # bullets/rows extend it without re-inspecting the content list.
+        mode = None
+        last_block = None
         
         for line in lines:
             line = line.strip()
@@ -268,10 +723,11 @@ def convert_brd_to_json(brd_text: str) -> Dict:
                         "text": '\n'.join(current_content).strip()
                     })
                     current_content = []
+                    mode = 'paragraph'
                 continue
             
             # Look for section headers (1-16 only)
-            section_match = re.match(r'^(?:SECTION\s+)?(\d+)\.?\s*(.+)$', line, re.IGNORECASE)
+            section_match = _SECTION_HEADER_RE.match(line)
             if section_match:
                 section_num = int(section_match.group(1))
                 
@@ -298,6 +754,7 @@ def convert_brd_to_json(brd_text: str) -> Dict:
                     "content": []
                 }
                 current_content = []
+                mode = None
                 
             elif line.startswith('##') and len(line) > 3:
                 # Alternative section header format
@@ -309,19 +766,24 @@ def convert_brd_to_json(brd_text: str) -> Dict:
                         })
                     sections.append(current_section)
                 
+                # Only '##' pairs are removed, so '### In Scope' keeps a '#'
+                # prefix: app.py treats '#'-titled sections as subsections
+                # (skipped as tabs, merged into an empty Scope section).
                 title = line.replace('##', '').strip()
                 current_section = {
                     "title": title,
                     "content": []
                 }
                 current_content = []
+                mode = None
                 
             elif current_section:
                 # Check for bullet points
                 if line.startswith('- ') or line.startswith('• ') or line.startswith('* '):
-                    bullet_text = re.sub(r'^[-•*]\s+', '', line)
-                    if current_section['content'] and current_section['content'][-1].get('type') == 'bullet':
-                        current_section['content'][-1]['items'].append(bullet_text)
+                    # Marker and its separator are the first two chars
+                    bullet_text = line[2:].lstrip()
+                    if mode == 'bullet':
+                        last_block['items'].append(bullet_text)
                     else:
                         # Start new bullet list
                         if current_content:
@@ -330,18 +792,20 @@ def convert_brd_to_json(brd_text: str) -> Dict:
                                 "text": '\n'.join(current_content).strip()
                             })
                             current_content = []
-                        current_section['content'].append({
+                        last_block = {
                             "type": "bullet",
                             "items": [bullet_text]
-                        })
+                        }
+                        current_section['content'].append(last_block)
+                        mode = 'bullet'
                     continue
                 
                 # Check for tables
                 if '|' in line:
                     cells = [cell.strip() for cell in line.split('|') if cell.strip()]
                     if cells and len(cells) > 1:
-                        if current_section['content'] and current_section['content'][-1].get('type') == 'table':
-                            current_section['content'][-1]['rows'].append(cells)
+                        if mode == 'table':
+                            last_block['rows'].append(cells)
                         else:
                             if current_content:
                                 current_section['content'].append({
@@ -349,10 +813,12 @@ def convert_brd_to_json(brd_text: str) -> Dict:
                                     "text": '\n'.join(current_content).strip()
                                 })
                                 current_content = []
-                            current_section['content'].append({
+                            last_block = {
                                 "type": "table",
                                 "rows": [cells]
-                            })
+                            }
+                            current_section['content'].append(last_block)
+                            mode = 'table'
                         continue
                 
                 # Regular content line
@@ -387,23 +853,30 @@ def save_brd_to_s3(brd_text: str, brd_id: str) -> Dict[str, str]:
                                                   the canonical key)
     """
     try:
-        # Save as text file (human-readable export — unchanged)
-        txt_key = f"brds/{brd_id}/BRD_{brd_id}.txt"
-        s3_put_object(key=txt_key, body=brd_text, content_type="text/plain")
-        txt_location = f"s3://{S3_BUCKET}/{txt_key}"
-        logger.info(f"Saved BRD text to {txt_location}")
-
-        # Convert to JSON structure
-        brd_json = convert_brd_to_json(brd_text)
-
-        # Save as canonical brd_structure.json (audit-flagged bug fix:
-        # was BRD_{brd_id}.json, which app.py:3670 / routers/integrations.py:678
-        # / lambda_brd_chat.py:264 / routers/brd.py /{sid}/sections couldn't
-        # find — they all expect brd_structure.json).
-        json_key = f"brds/{brd_id}/brd_structure.json"
-        s3_put_object(key=json_key, body=json.dumps(brd_json, indent=2), content_type="application/json")
-        json_location = f"s3://{S3_BUCKET}/{json_key}"
-        logger.info(f"Saved BRD JSON to {json_location}")
+        # The text upload doesn't depend on the JSON conversion, so it runs
+        # on a worker thread while this thread converts and uploads the JSON.
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            # Save as text file (human-readable export — unchanged)
+            txt_key = f"brds/{brd_id}/BRD_{brd_id}.txt"
+            txt_upload = pool.submit(
+                s3_put_object, key=txt_key, body=brd_text, content_type="text/plain",
+            )
+
+            # Convert to JSON structure
+            brd_json = convert_brd_to_json(brd_text)
+
+            # Save as canonical brd_structure.json (audit-flagged bug fix:
+            # was BRD_{brd_id}.json, which app.py:3670 / routers/integrations.py:678
+            # / lambda_brd_chat.py:264 / routers/brd.py /{sid}/sections couldn't
+            # find — they all expect brd_structure.json).
+            json_key = f"brds/{brd_id}/brd_structure.json"
+            s3_put_object(key=json_key, body=_dumps_bytes(brd_json), content_type="application/json")
+            json_location = f"s3://{S3_BUCKET}/{json_key}"
+            logger.info(f"Saved BRD JSON to {json_location}")
+
+            txt_upload.result()
+            txt_location = f"s3://{S3_BUCKET}/{txt_key}"
+            logger.info(f"Saved BRD text to {txt_location}")
 
         return {
             "txt": txt_location,
@@ -431,7 +904,7 @@ def _write_section_partial_h(brd_id: str, n: int, section_dict: Dict[str, Any])
     try:
         s3_put_object(
             key=key,
-            body=json.dumps(section_dict, indent=2, ensure_ascii=False),
+            body=_dumps_bytes(section_dict),
             content_type="application/json",
         )
     except Exception as e:
@@ -448,6 +921,31 @@ def _write_generation_status_h(
 ) -> None:
     """Write brds/{brd_id}/_generation_status.json — terminal-state signal
     consumed by the SSE endpoint."""
+    body = _generation_status_body_h(
+        brd_id, status, sections_complete, error_message, missing_sections, session_id,
+    )
+    try:
+        s3_put_object(
+            key=_generation_status_key_h(brd_id),
+            body=_dumps_bytes(body),
+            content_type="application/json",
+        )
+    except Exception as e:
+        logger.warning(f"[BRD-hist] failed to write _generation_status.json: {e}")
+
+
+def _generation_status_key_h(brd_id: str) -> str:
+    return f"brds/{brd_id}/_generation_status.json"
+
+
+def _generation_status_body_h(
+    brd_id: str,
+    status: str,
+    sections_complete: Optional[List[int]] = None,
+    error_message: Optional[str] = None,
+    missing_sections: Optional[List[int]] = None,
+    session_id: Optional[str] = None,
+) -> Dict[str, Any]:
     body = {
         "brd_id": brd_id,
         "session_id": session_id,
@@ -459,31 +957,87 @@ def _write_generation_status_h(
         body["error_message"] = error_message
     if missing_sections:
         body["missing_sections"] = missing_sections
+    return body
+
+
+def _is_active_status_h(status: Optional[Dict[str, Any]]) -> bool:
+    """True for a "running" marker updated within GENERATION_LOCK_TTL_S."""
+    if not status or status.get("status") != "running":
+        return False
+    return time.time() - int(status.get("updated_at") or 0) <= GENERATION_LOCK_TTL_S
+
+
+def _acquire_generation_lock_h(brd_id: str, session_id: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Mark brd_id "running" unless another invocation holds it.
+
+    Returns None once this invocation owns the marker, else the status of the
+    run that does. The write is conditional on the marker read just before it
+    (IfMatch on its ETag, or IfNoneMatch="*" when there is none), so of two
+    invokes racing past the read only one write lands; the other gets
+    PreconditionFailed and is reported as a duplicate. An unreadable marker
+    falls back to an unconditional write so a flaky read never blocks
+    generation.
+    """
+    key = _generation_status_key_h(brd_id)
+    etag = None
+    status = None
+    conditional = True
+    try:
+        obj = _s3_client.get_object(Bucket=S3_BUCKET, Key=key)
+        etag = obj["ETag"]
+        status = _loads(obj["Body"].read())
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") != "NoSuchKey":
+            logger.warning(f"[BRD-hist] could not read {key}, taking the lock unconditionally: {e}")
+            conditional = False
+    except Exception as e:
+        # Unparseable marker: still overwrite it conditionally on its ETag
+        logger.warning(f"[BRD-hist] ignoring unreadable {key}: {e}")
+        status = None
+
+    if _is_active_status_h(status):
+        return status
+
+    body = _generation_status_body_h(brd_id, "running", sections_complete=[], session_id=session_id)
     try:
         s3_put_object(
-            key=f"brds/{brd_id}/_generation_status.json",
-            body=json.dumps(body, indent=2),
+            key=key,
+            body=_dumps_bytes(body),
             content_type="application/json",
+            if_match=etag if conditional else None,
+            if_none_match="*" if conditional and etag is None else None,
         )
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") in ("PreconditionFailed", "ConditionalRequestConflict"):
+            return _read_generation_status_h(brd_id) or {"brd_id": brd_id, "status": "running"}
+        logger.warning(f"[BRD-hist] failed to write _generation_status.json: {e}")
     except Exception as e:
         logger.warning(f"[BRD-hist] failed to write _generation_status.json: {e}")
+    return None
+
+
+def _read_generation_status_h(brd_id: str) -> Optional[Dict[str, Any]]:
+    try:
+        obj = _s3_client.get_object(Bucket=S3_BUCKET, Key=_generation_status_key_h(brd_id))
+        return _loads(obj["Body"].read())
+    except Exception:
+        return None
 
 
 def _extract_section_blocks_h(text: str) -> List[Dict[str, Any]]:
     """Pull a JSON array of content blocks from an LLM response.
     Mirrors lambda_brd_generator._extract_section_blocks."""
-    import re
     if not text:
         raise ValueError("empty section response")
     s = text.strip()
     if s.startswith("["):
-        return json.loads(s)
+        return _loads(s)
     m = re.search(r"```(?:json)?\s*(\[.*?\])\s*```", s, re.DOTALL)
     if m:
-        return json.loads(m.group(1))
+        return _loads(m.group(1))
     m = re.search(r"\[.*\]", s, re.DOTALL)
     if m:
-        return json.loads(m.group(0))
+        return _loads(m.group(0))
     raise ValueError(f"no JSON array found in section response (first 200 chars: {s[:200]!r})")
 
 
@@ -509,7 +1063,6 @@ def _generate_section_history(
     fan-out caller can aggregate cost/parallelism stats. The debug
     fields are stripped before final brd_structure.json write.
     """
-    from prompts.brd_section_definitions import section_title
     title = section_title(section_number)
     user_msg = build_section_user_message(section_number)
     retry_suffix = (
@@ -609,44 +1162,57 @@ def _handle_parallel_history(evt: Dict[str, Any]) -> Dict[str, Any]:
     orchestrator can handle both transparently.
     """
     session_id = evt.get("session_id")
-    brd_id     = evt.get("brd_id") or str(uuid.uuid4())
+    brd_id     = evt.get("brd_id") or uuid.uuid4().hex
     user_id    = evt.get("user_id")
 
     if not session_id:
         _write_generation_status_h(brd_id, "failed",
                                     error_message="session_id required",
                                     session_id=session_id)
-        return {
-            "statusCode": 400,
-            "body": json.dumps({"error": "session_id required", "brd_id": brd_id}),
-        }
-
-    # Mark running so the SSE endpoint can confirm in-flight.
-    _write_generation_status_h(brd_id, "running", sections_complete=[], session_id=session_id)
+        return _reply(400, error="session_id required", brd_id=brd_id)
+
+    # Single-flight per brd_id: a retried or duplicated invoke for a draft
+    # that is already generating would redo the same Bedrock work and race
+    # the first run's S3 writes. Only caller-supplied ids can collide.
+    # Either way the "running" marker lets the SSE endpoint confirm in-flight.
+    if evt.get("brd_id"):
+        active = _acquire_generation_lock_h(brd_id, session_id)
+        if active is not None:
+            logger.info(
+                f"[BRD-hist parallel] {brd_id} already running "
+                f"(updated_at={active.get('updated_at')}) - skipping duplicate"
+            )
+            return _reply(
+                409,
+                error="BRD generation already in progress",
+                brd_id=brd_id,
+                status=active,
+            )
+    else:
+        _write_generation_status_h(brd_id, "running", sections_complete=[], session_id=session_id)
 
     # Fetch conversation history under DUAL-ACTOR read so we find events
     # the orchestrator wrote under `user-{user_id}` AS WELL AS any legacy
     # events under the shared `analyst-session` actor.
     try:
-        messages = get_conversation_history(session_id, user_id=user_id)
+        messages = get_conversation_history(
+            session_id, max_messages=_max_messages_from_event(evt), user_id=user_id
+        )
     except Exception as e:
         logger.error(f"[BRD-hist parallel] history fetch failed: {e}", exc_info=True)
         _write_generation_status_h(brd_id, "failed",
                                     error_message=f"history fetch failed: {e}",
                                     session_id=session_id)
-        return {
-            "statusCode": 500,
-            "body": json.dumps({"error": f"history fetch failed: {e}", "brd_id": brd_id}),
-        }
+        return _reply(500, error=f"history fetch failed: {e}", brd_id=brd_id)
     if not messages:
         _write_generation_status_h(brd_id, "failed",
                                     error_message="no conversation history",
                                     session_id=session_id)
-        return {
-            "statusCode": 400,
-            "body": json.dumps({"error": "no conversation history for this session",
-                                "brd_id": brd_id}),
-        }
+        return _reply(
+            400,
+            error="no conversation history for this session",
+            brd_id=brd_id,
+        )
 
     transcript_text = format_conversation(messages)
 
@@ -800,7 +1366,7 @@ def _handle_parallel_history(evt: Dict[str, Any]) -> Dict[str, Any]:
     try:
         s3_put_object(
             key=structure_key,
-            body=json.dumps(structure_payload, indent=2, ensure_ascii=False),
+            body=_dumps_bytes(structure_payload),
             content_type="application/json",
         )
     except Exception as e:
@@ -810,10 +1376,7 @@ def _handle_parallel_history(evt: Dict[str, Any]) -> Dict[str, Any]:
             sections_complete=[s["number"] for s in sections],
             session_id=session_id,
         )
-        return {
-            "statusCode": 500,
-            "body": json.dumps({"error": f"S3 write failed: {e}", "brd_id": brd_id}),
-        }
+        return _reply(500, error=f"S3 write failed: {e}", brd_id=brd_id)
 
     _write_generation_status_h(
         brd_id,
@@ -828,20 +1391,18 @@ def _handle_parallel_history(evt: Dict[str, Any]) -> Dict[str, Any]:
         f"[BRD-hist parallel] {terminal_status}: {len(sections)}/{len(BRD_SECTIONS)} "
         f"sections, failed={failed}, missing={missing}, elapsed={elapsed}s"
     )
-    return {
-        "statusCode": 200,
-        "body": json.dumps({
-            "brd_id":           brd_id,
-            "session_id":       session_id,
-            "status":           terminal_status,
-            "section_count":    len(sections),
-            "failed_sections":  failed,
-            "missing_sections": missing,
-            "s3_key":           structure_key,
-            "duration_seconds": elapsed,
-            "mode":             "parallel-history",
-        }),
-    }
+    return _reply(
+        200,
+        brd_id=brd_id,
+        session_id=session_id,
+        status=terminal_status,
+        section_count=len(sections),
+        failed_sections=failed,
+        missing_sections=missing,
+        s3_key=structure_key,
+        duration_seconds=elapsed,
+        mode="parallel-history",
+    )
 
 
 def lambda_handler(event, context):
@@ -856,11 +1417,15 @@ def lambda_handler(event, context):
     {
         "session_id": "analyst-session-xxx",
         "brd_id": "optional-brd-id",
-        "parallel": True | False   # optional, opt-in to Phase 6 path
+        "parallel": True | False,  # optional, opt-in to Phase 6 path
+        "max_messages": 40         # optional, keep only the latest N messages
     }
     """
     logger.info("=== BRD from History Lambda Started ===")
-    logger.info(f"Event: {json.dumps(event, default=str)}")
+    # Full-event dumps only at DEBUG: serialising a large event on every
+    # invocation costs time on the critical path and CloudWatch ingest.
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Event: %s", json.dumps(event, default=str))
 
     # Phase 6 opt-in path — orchestrator flips this when
     # BRD_USE_PARALLEL_GENERATION is on.
@@ -874,45 +1439,52 @@ def lambda_handler(event, context):
         user_id = event.get('user_id')  # for token attribution
         
         if not session_id:
-            return {
-                'statusCode': 400,
-                'body': json.dumps({
-                    'error': 'Missing required field: session_id'
-                })
-            }
+            return {'statusCode': 400, 'body': _MISSING_SESSION_BODY}
         
         # Generate BRD ID if not provided
         if not brd_id:
-            brd_id = str(uuid.uuid4())
+            brd_id = uuid.uuid4().hex
             logger.info(f"Generated new BRD ID: {brd_id}")
         else:
             logger.info(f"Using provided BRD ID: {brd_id}")
         
-        # Step 1: Fetch conversation history from AgentCore Memory
-        logger.info("Step 1: Fetching conversation history...")
-        messages = get_conversation_history(session_id)
+        # Steps 1 + 3 are independent round trips (AgentCore Memory, S3),
+        # so the template fetch runs alongside the history read. History is
+        # checked first to keep the no-history 400 ahead of template errors.
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            logger.info("Step 3: Fetching template from S3 (in parallel)...")
+            template_future = pool.submit(fetch_template_from_s3)
+
+            # Step 1: Fetch conversation history from AgentCore Memory
+            logger.info("Step 1: Fetching conversation history...")
+            messages = get_conversation_history(session_id, max_messages=_max_messages_from_event(event))
         
         if not messages:
             logger.warning("No conversation history found")
-            return {
-                'statusCode': 400,
-                'body': json.dumps({
-                    'error': 'No conversation history found for this session',
-                    'message': 'Please have a conversation with the analyst first'
-                })
-            }
+            return _reply(
+                400,
+                error='No conversation history found for this session',
+                message='Please have a conversation with the analyst first',
+            )
         
         # Step 2: Format conversation
         logger.info("Step 2: Formatting conversation...")
         conversation_text = format_conversation(messages)
         
-        # Step 3: Fetch template from S3
-        logger.info("Step 3: Fetching template from S3...")
-        template_text = fetch_template_from_s3()
+        # Step 3: Template fetched above (re-raises a fetch failure)
+        template_text = template_future.result()
         
-        # Step 4: Generate BRD using Bedrock
-        logger.info("Step 4: Generating BRD with Bedrock...")
-        brd_text = generate_brd_with_bedrock(template_text, conversation_text, user_id=user_id)
+        # Step 4: Generate BRD using Bedrock (or reuse an identical earlier run)
+        cache_key = _generation_cache_key(template_text, conversation_text) if GENERATION_CACHE_TTL_S > 0 else None
+        brd_text = _load_cached_brd(cache_key) if cache_key else None
+        if brd_text is not None:
+            logger.info(f"Step 4: Reusing cached BRD s3://{S3_BUCKET}/{cache_key}")
+        else:
+            logger.info("Step 4: Generating BRD with Bedrock...")
+            prompt_conversation = condense_conversation(messages, conversation_text, user_id=user_id)
+            brd_text, complete = generate_brd_with_bedrock(template_text, prompt_conversation, user_id=user_id)
+            if cache_key and brd_text and complete:
+                _store_cached_brd(cache_key, brd_text)
         
         # Step 5: Save BRD to S3
         logger.info("Step 5: Saving BRD to S3...")
@@ -921,23 +1493,19 @@ def lambda_handler(event, context):
         logger.info(f"BRD generation completed successfully. BRD ID: {brd_id}")
         
         # Return success
-        return {
-            'statusCode': 200,
-            'body': json.dumps({
-                'brd_id': brd_id,
-                'message': 'BRD generated successfully from conversation history',
-                'status': 'success',
-                's3_location_txt': s3_locations['txt'],
-                's3_location_json': s3_locations['json']
-            })
-        }
+        return _reply(
+            200,
+            brd_id=brd_id,
+            message='BRD generated successfully from conversation history',
+            status='success',
+            s3_location_txt=s3_locations['txt'],
+            s3_location_json=s3_locations['json'],
+        )
         
     except Exception as e:
         logger.error(f"Error in lambda_handler: {str(e)}", exc_info=True)
-        return {
-            'statusCode': 500,
-            'body': json.dumps({
-                'error': str(e),
-                'message': 'Error generating BRD from history'
-            })
-        }
+        return _reply(
+            500,
+            error=str(e),
+            message='Error generating BRD from history',
+        )
@@ -7,6 +7,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any, Dict, List, Optional, Tuple
 
 import boto3
+from botocore.config import Config
 # Environment-specific LLM and S3 (local: direct Bedrock + plain S3 | VDI: Gateway + KMS S3)
 from environment import (
     chat_completion,
@@ -138,14 +139,17 @@ BRD_SECTION_TITLES: List[Tuple[int, str]] = [
 AGENTCORE_MEMORY_ID = DEFAULT_AGENTCORE_MEMORY_ID
 AGENTCORE_ACTOR_ID = DEFAULT_AGENTCORE_ACTOR_ID
 
-_memory_client = None
-
-
-def _get_memory_client():
-    global _memory_client
-    if _memory_client is None:
-        _memory_client = boto3.client("bedrock-agentcore", region_name=BEDROCK_REGION)
-    return _memory_client
+# Clients are built at import so Lambda's INIT phase pays the construction
+# (credential resolution, service-model load) once per container, instead
+# of the first invocation - or, for S3, every call site. tcp_keepalive keeps
+# the pooled HTTPS connections warm between calls on a reused container.
+_CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=10,
+    retries={"mode": "standard", "max_attempts": 3},
+)
+_memory_client = boto3.client("bedrock-agentcore", region_name=BEDROCK_REGION, config=_CLIENT_CONFIG)
+_s3_client = boto3.client("s3", region_name=os.getenv("AWS_REGION", "us-east-1"), config=_CLIENT_CONFIG)
 
 
 def get_conversation_history(
@@ -164,7 +168,7 @@ def get_conversation_history(
     if not AGENTCORE_MEMORY_ID or not session_id:
         return []
 
-    client = _get_memory_client()
+    client = _memory_client
 
     actors: List[str] = []
     if user_id:
@@ -222,11 +226,10 @@ def get_conversation_history(
 
 def format_conversation(messages: List[Dict[str, str]]) -> str:
     """Format chat history as readable transcript text."""
-    lines = []
-    for msg in messages:
-        role = "USER" if msg.get("role") == "user" else "ANALYST"
-        lines.append(f"{role}: {msg.get('content', '')}")
-    return "\n\n".join(lines)
+    return "\n\n".join(
+        f"{'USER' if msg.get('role') == 'user' else 'ANALYST'}: {msg.get('content', '')}"
+        for msg in messages
+    )
 
 
 def _read_existing_brd_sections(existing_brd_id: str) -> Dict[int, List[Dict[str, Any]]]:
@@ -242,8 +245,7 @@ def _read_existing_brd_sections(existing_brd_id: str) -> Dict[int, List[Dict[str
     key = f"brds/{existing_brd_id}/brd_structure.json"
     bucket = os.getenv("S3_BUCKET_NAME", "sdlc-orch-dev-us-east-1-app-data")
     try:
-        s3 = boto3.client("s3", region_name=os.getenv("AWS_REGION", "us-east-1"))
-        obj = s3.get_object(Bucket=bucket, Key=key)
+        obj = _s3_client.get_object(Bucket=bucket, Key=key)
         data = json.loads(obj["Body"].read().decode("utf-8"))
     except Exception as e:
         logger.warning(f"[BRD-gen] could not read existing BRD {existing_brd_id} for regen-merge: {e}")
@@ -1674,8 +1676,7 @@ def _handle_parallel(evt: Dict[str, Any]) -> Dict[str, Any]:
 
     if not template_text and template_s3_bucket and template_s3_key:
         try:
-            s3 = boto3.client("s3", region_name=os.getenv("AWS_REGION", "us-east-1"))
-            obj = s3.get_object(Bucket=template_s3_bucket, Key=template_s3_key)
+            obj = _s3_client.get_object(Bucket=template_s3_bucket, Key=template_s3_key)
             data = obj["Body"].read()
             template_text = _extract_text_from_docx(data) if template_s3_key.endswith(".docx") \
                 else data.decode("utf-8", errors="replace")
@@ -1697,8 +1698,7 @@ def _handle_parallel(evt: Dict[str, Any]) -> Dict[str, Any]:
                 f"[BRD-gen parallel] no template in event — fetching canonical "
                 f"Deluxe template from s3://{default_bucket}/{default_key}"
             )
-            s3 = boto3.client("s3", region_name=os.getenv("AWS_REGION", "us-east-1"))
-            obj = s3.get_object(Bucket=default_bucket, Key=default_key)
+            obj = _s3_client.get_object(Bucket=default_bucket, Key=default_key)
             data = obj["Body"].read()
             template_text = _extract_text_from_docx(data) if default_key.endswith(".docx") \
                 else data.decode("utf-8", errors="replace")
@@ -1711,8 +1711,7 @@ def _handle_parallel(evt: Dict[str, Any]) -> Dict[str, Any]:
 
     if not transcript_text and transcript_s3_bucket and transcript_s3_key:
         try:
-            s3 = boto3.client("s3", region_name=os.getenv("AWS_REGION", "us-east-1"))
-            obj = s3.get_object(Bucket=transcript_s3_bucket, Key=transcript_s3_key)
+            obj = _s3_client.get_object(Bucket=transcript_s3_bucket, Key=transcript_s3_key)
             data = obj["Body"].read()
             transcript_text = _extract_text_from_docx(data) if transcript_s3_key.endswith(".docx") \
                 else data.decode("utf-8", errors="replace")
@@ -1933,7 +1932,8 @@ def lambda_handler(event, context):
     """
     logger.info("=== BRD Generator Lambda Started ===")
     logger.info(f"Received event type: {type(event)}")
-    logger.info(f"Received event: {json.dumps(event, default=str)[:1000]}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Received event: %s", json.dumps(event, default=str)[:1000])
 
     evt = _coerce_event(event)
 
@@ -1945,63 +1945,66 @@ def lambda_handler(event, context):
     if isinstance(evt, dict) and evt.get("parallel") is True:
         return _handle_parallel(evt)
 
-    # Log the FULL event structure for debugging (no truncation)
-    logger.info("=" * 80)
-    logger.info("=== FULL EVENT STRUCTURE DEBUG ===")
-    logger.info("=" * 80)
-    try:
-        if isinstance(evt, dict):
-            logger.info(f"Event is a dict with {len(evt)} keys")
-            logger.info(f"Event keys: {list(evt.keys())}")
-            
-            # Log each key-value pair separately
-            for key, value in evt.items():
-                if isinstance(value, (dict, list)):
-                    logger.info(f"  {key}: {type(value).__name__} with {len(value)} items")
-                    if isinstance(value, dict):
-                        logger.info(f"    Sub-keys: {list(value.keys())}")
-                        # Check for actionGroupInput
-                        if key == "actionGroupInput" or "actionGroupInput" in str(value):
-                            logger.info(f"    Found actionGroupInput structure!")
-                            if isinstance(value, dict) and "actionGroupInput" in value:
-                                logger.info(f"    actionGroupInput keys: {list(value['actionGroupInput'].keys())}")
-                else:
-                    value_str = str(value)
-                    if len(value_str) > 200:
-                        logger.info(f"  {key}: {value_str[:200]}... (truncated, length: {len(value_str)})")
+    # Event-structure dump for debugging. DEBUG only: it walks and
+    # stringifies every field (transcripts included) on each invocation,
+    # which is CPU on the critical path and billed CloudWatch ingest.
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("=" * 80)
+        logger.debug("=== FULL EVENT STRUCTURE DEBUG ===")
+        logger.debug("=" * 80)
+        try:
+            if isinstance(evt, dict):
+                logger.debug(f"Event is a dict with {len(evt)} keys")
+                logger.debug(f"Event keys: {list(evt.keys())}")
+                
+                # Log each key-value pair separately
+                for key, value in evt.items():
+                    if isinstance(value, (dict, list)):
+                        logger.debug(f"  {key}: {type(value).__name__} with {len(value)} items")
+                        if isinstance(value, dict):
+                            logger.debug(f"    Sub-keys: {list(value.keys())}")
+                            # Check for actionGroupInput
+                            if key == "actionGroupInput" or "actionGroupInput" in str(value):
+                                logger.debug(f"    Found actionGroupInput structure!")
+                                if isinstance(value, dict) and "actionGroupInput" in value:
+                                    logger.debug(f"    actionGroupInput keys: {list(value['actionGroupInput'].keys())}")
                     else:
-                        logger.info(f"  {key}: {value_str}")
-            
-            # Try to find brd_id in various locations
-            logger.info("--- Searching for brd_id ---")
-            if "brd_id" in evt:
-                logger.info(f"  Found brd_id at top level: {evt['brd_id']}")
-            if "brdId" in evt:
-                logger.info(f"  Found brdId at top level: {evt['brdId']}")
-            if "actionGroupInput" in evt:
-                ag_input = evt["actionGroupInput"]
-                if isinstance(ag_input, dict):
-                    if "brd_id" in ag_input:
-                        logger.info(f"  Found brd_id in actionGroupInput: {ag_input['brd_id']}")
-                    if "brdId" in ag_input:
-                        logger.info(f"  Found brdId in actionGroupInput: {ag_input['brdId']}")
-            if "parameters" in evt:
-                params = evt["parameters"]
-                if isinstance(params, dict):
-                    if "brd_id" in params:
-                        logger.info(f"  Found brd_id in parameters dict: {params['brd_id']}")
-                elif isinstance(params, list):
-                    logger.info(f"  parameters is a list with {len(params)} items")
-                    for i, param in enumerate(params):
-                        if isinstance(param, dict):
-                            if param.get("name") == "brd_id" or param.get("key") == "brd_id":
-                                logger.info(f"  Found brd_id in parameters[{i}]: {param.get('value')}")
-        else:
-            logger.info(f"Event is NOT a dict, it's: {type(evt)}")
-            logger.info(f"Event value: {str(evt)[:500]}")
-    except Exception as e:
-        logger.error(f"Failed to log event structure: {e}", exc_info=True)
-    logger.info("=" * 80)
+                        value_str = str(value)
+                        if len(value_str) > 200:
+                            logger.debug(f"  {key}: {value_str[:200]}... (truncated, length: {len(value_str)})")
+                        else:
+                            logger.debug(f"  {key}: {value_str}")
+                
+                # Try to find brd_id in various locations
+                logger.debug("--- Searching for brd_id ---")
+                if "brd_id" in evt:
+                    logger.debug(f"  Found brd_id at top level: {evt['brd_id']}")
+                if "brdId" in evt:
+                    logger.debug(f"  Found brdId at top level: {evt['brdId']}")
+                if "actionGroupInput" in evt:
+                    ag_input = evt["actionGroupInput"]
+                    if isinstance(ag_input, dict):
+                        if "brd_id" in ag_input:
+                            logger.debug(f"  Found brd_id in actionGroupInput: {ag_input['brd_id']}")
+                        if "brdId" in ag_input:
+                            logger.debug(f"  Found brdId in actionGroupInput: {ag_input['brdId']}")
+                if "parameters" in evt:
+                    params = evt["parameters"]
+                    if isinstance(params, dict):
+                        if "brd_id" in params:
+                            logger.debug(f"  Found brd_id in parameters dict: {params['brd_id']}")
+                    elif isinstance(params, list):
+                        logger.debug(f"  parameters is a list with {len(params)} items")
+                        for i, param in enumerate(params):
+                            if isinstance(param, dict):
+                                if param.get("name") == "brd_id" or param.get("key") == "brd_id":
+                                    logger.debug(f"  Found brd_id in parameters[{i}]: {param.get('value')}")
+            else:
+                logger.debug(f"Event is NOT a dict, it's: {type(evt)}")
+                logger.debug(f"Event value: {str(evt)[:500]}")
+        except Exception as e:
+            logger.error(f"Failed to log event structure: {e}", exc_info=True)
+        logger.debug("=" * 80)
 
     # Handle agent invocation format
     # Bedrock Agent passes parameters in different formats:
@@ -2110,8 +2113,7 @@ def lambda_handler(event, context):
     if (template_s3_bucket and template_s3_key) and not template_text:
         logger.info(f"Fetching template from S3: s3://{template_s3_bucket}/{template_s3_key}")
         try:
-            s3_client = boto3.client("s3", region_name=os.getenv("AWS_REGION", "us-east-1"))
-            template_obj = s3_client.get_object(Bucket=template_s3_bucket, Key=template_s3_key)
+            template_obj = _s3_client.get_object(Bucket=template_s3_bucket, Key=template_s3_key)
             template_bytes = template_obj["Body"].read()
             
             # Extract text from DOCX or plain text
@@ -2127,8 +2129,7 @@ def lambda_handler(event, context):
     if (transcript_s3_bucket and transcript_s3_key) and not transcript_text:
         logger.info(f"Fetching transcript from S3: s3://{transcript_s3_bucket}/{transcript_s3_key}")
         try:
-            s3_client = boto3.client("s3", region_name=os.getenv("AWS_REGION", "us-east-1"))
-            transcript_obj = s3_client.get_object(Bucket=transcript_s3_bucket, Key=transcript_s3_key)
+            transcript_obj = _s3_client.get_object(Bucket=transcript_s3_bucket, Key=transcript_s3_key)
             transcript_bytes = transcript_obj["Body"].read()
             
             # Extract text from DOCX or plain text
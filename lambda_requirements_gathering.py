@@ -10,6 +10,7 @@ from datetime import datetime
 from typing import List, Dict, Optional
 
 import boto3
+from botocore.config import Config
 # Environment-specific LLM (local: direct Bedrock | VDI: Deluxe API Gateway)
 from environment import chat_completion
 
@@ -32,20 +33,21 @@ MAX_TOKENS = int(os.getenv('BEDROCK_MAX_TOKENS', '2000'))
 TEMPERATURE = float(os.getenv('BEDROCK_TEMPERATURE', '0.7'))
 MAX_HISTORY_MESSAGES = int(os.getenv('MAX_HISTORY_MESSAGES', '50'))
 
-# Lazy loading
-_agentcore_memory_client = None
-
-
-def _get_agentcore_memory_client():
-    global _agentcore_memory_client
-    if _agentcore_memory_client is None:
-        _agentcore_memory_client = boto3.client('bedrock-agentcore', region_name=AWS_REGION)
-    return _agentcore_memory_client
+# Built at import so Lambda's INIT phase pays the client construction
+# (credential resolution, service-model load), not the first invocation;
+# tcp_keepalive keeps the pooled HTTPS connection warm between the
+# history read and the event writes on a reused container.
+_CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=10,
+    retries={'mode': 'standard', 'max_attempts': 3},
+)
+_agentcore_memory_client = boto3.client('bedrock-agentcore', region_name=AWS_REGION, config=_CLIENT_CONFIG)
 
 
 def add_message_to_memory(session_id: str, role: str, content: str):
     """Add a message to AgentCore Memory"""
-    client = _get_agentcore_memory_client()
+    client = _agentcore_memory_client
     
     # Convert role to uppercase to match AgentCore enum: USER, ASSISTANT, TOOL, OTHER
     role_upper = role.upper()
@@ -79,7 +81,7 @@ def add_message_to_memory(session_id: str, role: str, content: str):
 
 def get_conversation_history(session_id: str, max_messages: int = 99) -> List[Dict]:
     """Get conversation history from AgentCore Memory"""
-    client = _get_agentcore_memory_client()
+    client = _agentcore_memory_client
     
     max_results = min(max_messages, 99)  # API constraint
     
@@ -92,25 +94,14 @@ def get_conversation_history(session_id: str, max_messages: int = 99) -> List[Di
             maxResults=max_results
         )
         
-        events = response.get("events", [])
-        messages = []
-        
-        for event in events:
-            payload_list = event.get("payload", [])
-            for payload_item in payload_list:
-                conv_data = payload_item.get("conversational")
-                if not conv_data:
-                    continue
-                
-                text_content = conv_data.get("content", {}).get("text")
-                if not text_content:
-                    continue
-                
-                role = conv_data.get("role", "assistant").lower()
-                messages.append({
-                    "role": role,
-                    "content": text_content
-                })
+        # Conversational payloads with non-empty text, in event order
+        messages = [
+            {"role": conv_data.get("role", "assistant").lower(), "content": text_content}
+            for event in response.get("events", ())
+            for payload_item in event.get("payload", ())
+            if (conv_data := payload_item.get("conversational"))
+            and (text_content := conv_data.get("content", {}).get("text"))
+        ]
         
         logger.info(f"Retrieved {len(messages)} messages from history")
         return messages
@@ -120,18 +111,28 @@ def get_conversation_history(session_id: str, max_messages: int = 99) -> List[Di
         return []
 
 
+# Display labels for the roles history reads return (lower-cased AgentCore
+# conversational roles, plus "system"), so the common case is a dict hit;
+# anything unexpected still falls back to .capitalize().
+_ROLE_LABELS = {
+    "user": "User",
+    "assistant": "Assistant",
+    "system": "System",
+    "tool": "Tool",
+    "other": "Other",
+}
+
+
 def build_conversation_context(messages: List[Dict]) -> str:
     """Build conversation context for the prompt"""
     if not messages:
         return "This is the start of a new conversation."
     
-    context_lines = ["Previous conversation:"]
-    for msg in messages[-10:]:  # Last 10 messages for context
-        role = msg['role'].capitalize()
-        content = msg['content']
-        context_lines.append(f"{role}: {content}")
-    
-    return "\n".join(context_lines)
+    # Last 10 messages for context
+    return "Previous conversation:\n" + "\n".join(
+        f"{_ROLE_LABELS.get(msg['role']) or msg['role'].capitalize()}: {msg['content']}"
+        for msg in messages[-10:]
+    )
 
 
 def lambda_handler(event, context):
@@ -145,7 +146,8 @@ def lambda_handler(event, context):
     }
     """
     logger.info("=== Requirements Gathering Lambda Started ===")
-    logger.info(f"Event: {json.dumps(event, default=str)}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Event: %s", json.dumps(event, default=str))
     
     try:
         # Extract inputs
@@ -169,7 +169,10 @@ def chat_completion_stream(
 
         data: {"type": "chunk", "text": "..."}\\n\\n
         ...
-        data: {"type": "done"}\\n\\n
+        data: {"type": "done", "finish_reason": "stop"}\\n\\n
+
+    finish_reason is the last one the upstream reported ("stop", "length",
+    ...), or null when the stream carried none.
 
     Token usage is recorded once at the end of the stream via the standard
     _record_tokens_async path (same DB row, same source label, same auth).
@@ -204,6 +207,7 @@ def chat_completion_stream(
     start = time.time()
     total_chars = 0
     final_usage = None
+    finish_reason = None
 
     try:
         response = client.chat.completions.create(**params)
@@ -218,6 +222,7 @@ def chat_completion_stream(
             choices = getattr(chunk, "choices", None) or []
             if not choices:
                 continue
+            finish_reason = getattr(choices[0], "finish_reason", None) or finish_reason
             delta = getattr(choices[0], "delta", None)
             text = getattr(delta, "content", None) if delta else None
             if text:
@@ -246,7 +251,7 @@ def chat_completion_stream(
             f"user={user_id or 'unknown'} chars={total_chars} (no usage in final chunk)"
         )
 
-    yield f"data: {json.dumps({'type': 'done'})}\n\n"
+    yield f"data: {json.dumps({'type': 'done', 'finish_reason': finish_reason})}\n\n"
 
 
 def chat_completion_with_tools(
@@ -13,7 +13,11 @@ from .brd_generator_prompts import (
 
 from .brd_from_history_prompts import (
     BRD_FROM_CHAT_PROMPT,
+    BRD_HISTORY_SUMMARY_PROMPT,
     get_brd_from_history_prompt,
+    get_brd_from_history_prompt_parts,
+    get_brd_from_history_session_prompt,
+    get_brd_from_history_static_prompt,
 )
 
 from .requirements_gathering_prompts import (
@@ -60,7 +64,11 @@ __all__ = [
     "BRD_REQUIRED_SECTIONS",
     "get_full_brd_generation_prompt",
     "BRD_FROM_CHAT_PROMPT",
+    "BRD_HISTORY_SUMMARY_PROMPT",
     "get_brd_from_history_prompt",
+    "get_brd_from_history_prompt_parts",
+    "get_brd_from_history_static_prompt",
+    "get_brd_from_history_session_prompt",
     "MARY_REQUIREMENTS_PROMPT",
     "get_requirements_gathering_prompt",
     # SAD
@@ -4,6 +4,9 @@ BRD from History Prompt Templates
 This module contains the prompt template for generating BRDs from analyst chat history.
 """
 
+import string
+from typing import Tuple
+
 # BRD Generation from Chat History Prompt
 # This prompt instructs Bedrock to generate BRD from conversation history
 BRD_FROM_CHAT_PROMPT = """
@@ -108,6 +111,41 @@ Return only the completed BRD as plain text following the template structure exa
 """
 
 
+# Condenses the older part of a long analyst session before BRD generation;
+# the most recent messages are still passed verbatim after this summary.
+BRD_HISTORY_SUMMARY_PROMPT = """You condense the earlier part of a requirements-gathering conversation between a business analyst and a stakeholder. The summary replaces those messages in the input to a Business Requirements Document generator, so anything you omit will be missing from the BRD.
+
+Keep every concrete fact: business goals, scope and out-of-scope items, stakeholders and users, functional and non-functional requirements, business rules, data, integrations, constraints, assumptions, risks, dates, numbers and names. Record decisions in their final form when the conversation changed them.
+
+The input is either a slice of the transcript or notes already condensed from earlier slices; treat both the same way.
+
+Drop greetings, repetition and the analyst's process chatter. Write terse bullet points grouped under short headings. Do not invent anything that was not said."""
+
+
+# The scaffolding around the two placeholders is fixed, so it is split into
+# literal slices once at import (Formatter.parse also unescapes any {{ }}).
+# Each call then only concatenates, instead of str.format re-scanning ~4 KB
+# of literal text.
+def _split_prompt(prompt: str) -> Tuple[str, str, str]:
+    """(prefix, middle, suffix) literals around {template} and {conversation}."""
+    # parse() yields (literal, field) pairs, splitting a literal again at
+    # every escaped {{ or }}, so literals are gathered up to each field.
+    literals = [""]
+    fields = []
+    for literal, field, _, _ in string.Formatter().parse(prompt):
+        literals[-1] += literal
+        if field is not None:
+            fields.append(field)
+            literals.append("")
+    if fields != ["template", "conversation"]:
+        raise ValueError("BRD_FROM_CHAT_PROMPT must contain {template} then {conversation}")
+    prefix, middle, suffix = literals
+    return prefix, middle, suffix
+
+
+_PREFIX, _MIDDLE, _SUFFIX = _split_prompt(BRD_FROM_CHAT_PROMPT)
+
+
 def get_brd_from_history_prompt(template: str, conversation: str) -> str:
     """
     Generate the full BRD from history prompt with template and conversation.
@@ -119,13 +157,39 @@ def get_brd_from_history_prompt(template: str, conversation: str) -> str:
     Returns:
         The complete prompt ready to send to Bedrock
     """
-    return BRD_FROM_CHAT_PROMPT.format(
-        template=template,
-        conversation=conversation
-    )
+    return "".join((_PREFIX, template, _MIDDLE, conversation, _SUFFIX))
+
+
+def get_brd_from_history_prompt_parts(template: str, conversation: str) -> Tuple[str, str]:
+    """
+    Split the BRD from history prompt into its static and per-session parts.
+    
+    The instructions plus template text are identical for every generation
+    against the same template, so callers send them as a cached system block
+    and only the conversation part as the user message. The two parts
+    concatenate to exactly get_brd_from_history_prompt().
+    
+    Returns:
+        (instructions_and_template, conversation_and_closing)
+    """
+    return get_brd_from_history_static_prompt(template), get_brd_from_history_session_prompt(conversation)
+
+
+def get_brd_from_history_static_prompt(template: str) -> str:
+    """First part of get_brd_from_history_prompt_parts(): instructions + template."""
+    return _PREFIX + template
+
+
+def get_brd_from_history_session_prompt(conversation: str) -> str:
+    """Second part of get_brd_from_history_prompt_parts(): conversation + closing."""
+    return "".join((_MIDDLE, conversation, _SUFFIX))
 
 
 __all__ = [
     "BRD_FROM_CHAT_PROMPT",
+    "BRD_HISTORY_SUMMARY_PROMPT",
     "get_brd_from_history_prompt",
+    "get_brd_from_history_prompt_parts",
+    "get_brd_from_history_static_prompt",
+    "get_brd_from_history_session_prompt",
 ]
@@ -74,6 +74,9 @@ from db_helper import (
 # Reuse the projects-router auth dependency (DB user row keyed by "id").
 from .projects import get_current_user
 
+# Lambda envelopes are parsed twice (outer JSON, then its `body` string).
+from utils.json_compat import loads as _loads
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/brd", tags=["brd"])
@@ -191,9 +194,9 @@ def _invoke_brd_lambda(
             detail=f"BRD Lambda error: {body_bytes.decode('utf-8', errors='replace')[:500]}",
         )
     try:
-        outer = json.loads(body_bytes)
+        outer = _loads(body_bytes)
         if isinstance(outer, dict) and "body" in outer and isinstance(outer["body"], str):
-            inner = json.loads(outer["body"])
+            inner = _loads(outer["body"])
             # Orchestrator's lambda_handler returns {statusCode, body} where
             # body holds either a handler result (200) OR an error envelope
             # ({"error": "..."}) when the handler crashed. The error envelope
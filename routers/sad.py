@@ -49,6 +49,9 @@ from services.s3_service import s3_put_object
 # Reuse the projects-router auth dependency (DB user row with key "id")
 from .projects import get_current_user
 
+# Lambda envelopes are parsed twice (outer JSON, then its `body` string).
+from utils.json_compat import loads as _loads
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/sad", tags=["sad"])
@@ -99,9 +102,9 @@ def _invoke_sad_lambda(payload: Dict[str, Any]) -> Dict[str, Any]:
             detail=f"SAD Lambda error: {body_bytes.decode('utf-8', errors='replace')[:500]}",
         )
     try:
-        outer = json.loads(body_bytes)
+        outer = _loads(body_bytes)
         if "body" in outer and isinstance(outer["body"], str):
-            return json.loads(outer["body"])
+            return _loads(outer["body"])
         return outer
     except Exception as e:
         raise HTTPException(status_code=502, detail=f"SAD Lambda response parse error: {e}")
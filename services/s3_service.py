@@ -6,6 +6,7 @@ Enforces SSE-KMS encryption on every upload as required by the bucket policy.
 import os
 import logging
 import boto3
+from botocore.config import Config
 
 logger = logging.getLogger(__name__)
 
@@ -28,11 +29,20 @@ def get_s3_client():
     """Get or create a cached S3 client."""
     global _s3_client
     if _s3_client is None:
-        _s3_client = boto3.client("s3", region_name=AWS_REGION)
+        _s3_client = boto3.client(
+            "s3",
+            region_name=AWS_REGION,
+            config=Config(
+                max_pool_connections=50,
+                retries={"max_attempts": 5, "mode": "adaptive"},
+                tcp_keepalive=True,
+            ),
+        )
     return _s3_client
 
 
-def s3_put_object(key: str, body, content_type: str = "application/octet-stream", bucket: str = None):
+def s3_put_object(key: str, body, content_type: str = "application/octet-stream", bucket: str = None,
+                  metadata: dict = None, if_match: str = None, if_none_match: str = None):
     """
     Upload an object to S3 with KMS encryption.
 
@@ -41,6 +51,11 @@ def s3_put_object(key: str, body, content_type: str = "application/octet-stream"
         body: File content (bytes or str — str will be encoded to UTF-8)
         content_type: MIME type of the content
         bucket: S3 bucket name (defaults to S3_BUCKET_NAME env var)
+        metadata: Optional user metadata (x-amz-meta-*) stored with the object
+        if_match: Only write if the current object has this ETag (conditional write)
+        if_none_match: "*" to only write if the key does not exist yet
+
+    A failed condition raises ClientError with code "PreconditionFailed".
     """
     if bucket is None:
         bucket = S3_BUCKET_NAME
@@ -48,6 +63,11 @@ def s3_put_object(key: str, body, content_type: str = "application/octet-stream"
     if isinstance(body, str):
         body = body.encode("utf-8")
 
+    extra = {"Metadata": metadata} if metadata else {}
+    if if_match:
+        extra["IfMatch"] = if_match
+    if if_none_match:
+        extra["IfNoneMatch"] = if_none_match
     client = get_s3_client()
     client.put_object(
         Bucket=bucket,
@@ -56,6 +76,7 @@ def s3_put_object(key: str, body, content_type: str = "application/octet-stream"
         ContentType=content_type,
         ServerSideEncryption="aws:kms",
         SSEKMSKeyId=KMS_KEY_ARN,
+        **extra,
     )
     logger.info(f"[S3] Uploaded s3://{bucket}/{key} ({len(body)} bytes, KMS encrypted)")
 
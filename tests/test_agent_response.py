@@ -0,0 +1,77 @@
+"""Tests for utils.agent_response — agent reply text extraction."""
+
+import pytest
+
+from utils.agent_response import extract_agent_text, extract_text_from_analyst_response, first_non_ws
+
+
+# -----------------------------------------------------------------------------
+# extract_agent_text
+# -----------------------------------------------------------------------------
+
+class TestExtractAgentText:
+    """Test extract_agent_text() across the reply shapes the agents emit."""
+
+    @pytest.mark.parametrize("result_json, expected", [
+        ({"role": "assistant", "content": [{"text": "hi"}]}, "hi"),
+        ({"result": "plain"}, "plain"),
+        ({"result": {"content": [{"text": "nested"}]}}, "nested"),
+        ({"text": "t"}, "t"),
+        ({"message": "m"}, "m"),
+        ({"response": "r"}, "r"),
+        ({"answer": "a"}, "a"),
+        ({"result": [{"text": "listed"}]}, "listed"),
+    ])
+    def test_known_shapes(self, result_json, expected):
+        assert extract_agent_text(result_json) == expected
+
+    def test_non_string_message_is_stringified(self):
+        assert extract_agent_text({"message": {"k": 1}}) == "{'k': 1}"
+
+    def test_blank_values_are_skipped(self):
+        assert extract_agent_text({"content": [], "text": "", "answer": "a"}) == "a"
+
+    @pytest.mark.parametrize("result_json", [{"a": 1}, [1, 2], "str", None])
+    def test_no_text_returns_none(self, result_json):
+        assert extract_agent_text(result_json) is None
+
+
+# -----------------------------------------------------------------------------
+# extract_text_from_analyst_response
+# -----------------------------------------------------------------------------
+
+class TestExtractTextFromAnalystResponse:
+    """Test extract_text_from_analyst_response() returns (text, session_id)."""
+
+    def test_direct_response(self):
+        raw = '{"message": "hello", "session_id": "s1"}'
+        assert extract_text_from_analyst_response(raw) == ("hello", "s1")
+
+    def test_wrapped_response(self):
+        raw = '{"result": "{\\"message\\": \\"inner\\", \\"session_id\\": \\"s2\\"}"}'
+        assert extract_text_from_analyst_response(raw) == ("inner", "s2")
+
+    def test_content_array(self):
+        raw = '{"content": [{"text": "c"}], "session_id": "s3"}'
+        assert extract_text_from_analyst_response(raw) == ("c", "s3")
+
+    def test_plain_text_passes_through(self):
+        assert extract_text_from_analyst_response("just text") == ("just text", None)
+
+    @pytest.mark.parametrize("raw", [None, "", "{not json"])
+    def test_unparseable_returns_none(self, raw):
+        assert extract_text_from_analyst_response(raw) == (None, None)
+
+
+# -----------------------------------------------------------------------------
+# first_non_ws
+# -----------------------------------------------------------------------------
+
+@pytest.mark.parametrize("text, expected", [
+    ('  \n\t{"a": 1}', "{"),
+    ("plain", "p"),
+    ("   ", ""),
+    ("", ""),
+])
+def test_first_non_ws(text, expected):
+    assert first_non_ws(text) == expected
@@ -0,0 +1,48 @@
+"""Tests for prompts.brd_from_history_prompts — pre-split prompt assembly."""
+
+import pytest
+
+from prompts.brd_from_history_prompts import (
+    BRD_FROM_CHAT_PROMPT,
+    _split_prompt,
+    get_brd_from_history_prompt,
+    get_brd_from_history_prompt_parts,
+)
+
+
+@pytest.mark.parametrize("template, conversation", [
+    ("T", "C"),
+    ("{x} {{y}}", "{conversation}"),
+    ("", ""),
+])
+def test_matches_str_format(template, conversation):
+    expected = BRD_FROM_CHAT_PROMPT.format(template=template, conversation=conversation)
+    assert get_brd_from_history_prompt(template, conversation) == expected
+    assert "".join(get_brd_from_history_prompt_parts(template, conversation)) == expected
+
+
+def test_parts_split_at_template():
+    static, session = get_brd_from_history_prompt_parts("TEMPLATE", "CONV")
+    assert static.endswith("TEMPLATE")
+    assert "CONV" in session and "CONV" not in static
+
+
+@pytest.mark.parametrize("prompt", [
+    "A {template} B {conversation} C",
+    "A {template} B {conversation}",          # ends on a placeholder
+    "{template}{conversation}",
+    "{{literal}} {template} }}x{{ {conversation} {{",  # escaped braces
+])
+def test_split_prompt_matches_format(prompt):
+    prefix, middle, suffix = _split_prompt(prompt)
+    assert prefix + "T" + middle + "C" + suffix == prompt.format(template="T", conversation="C")
+
+
+@pytest.mark.parametrize("prompt", [
+    "{conversation} {template}",
+    "{template} only",
+    "{template} {conversation} {extra}",
+])
+def test_split_prompt_rejects_other_placeholders(prompt):
+    with pytest.raises(ValueError):
+        _split_prompt(prompt)
@@ -0,0 +1,54 @@
+"""Golden tests for lambda_brd_from_history.convert_brd_to_json — plain-text BRD to section JSON."""
+
+import pytest
+
+from lambda_brd_from_history import convert_brd_to_json
+
+
+@pytest.mark.parametrize("brd_text, expected", [
+    # A bullet after un-flushed paragraph text still extends the open list;
+    # the text is flushed as a paragraph at the next blank line.
+    (
+        "1. Scope\n- a\nsome text\n- b\n\nafter",
+        [{"section_number": 1, "title": "Scope", "content": [
+            {"type": "bullet", "items": ["a", "b"]},
+            {"type": "paragraph", "text": "some text"},
+            {"type": "paragraph", "text": "after"},
+        ]}],
+    ),
+    # A table after bullets starts a new block; a bullet after the table
+    # starts a new list rather than reopening the first one.
+    (
+        "2. Data\n- a\n- b\n| Col | Val |\n| x | 1 |\n- c",
+        [{"section_number": 2, "title": "Data", "content": [
+            {"type": "bullet", "items": ["a", "b"]},
+            {"type": "table", "rows": [["Col", "Val"], ["x", "1"]]},
+            {"type": "bullet", "items": ["c"]},
+        ]}],
+    ),
+    # Only '##' is stripped from alternative headers; deeper headers keep a
+    # '#' prefix, which app.py uses to recognise subsections.
+    (
+        "## Scope\n### In Scope\n- a\n### Out of Scope\n- b",
+        [
+            {"title": "Scope", "content": []},
+            {"title": "# In Scope", "content": [{"type": "bullet", "items": ["a"]}]},
+            {"title": "# Out of Scope", "content": [{"type": "bullet", "items": ["b"]}]},
+        ],
+    ),
+    # Bullet markers drop all following whitespace; numbers above 16 are
+    # body text, not section headers.
+    (
+        "SECTION 3 Goals\n-   spaced\n•  dot\n*\tnot a bullet\n17. Not a section",
+        [{"section_number": 3, "title": "Goals", "content": [
+            {"type": "bullet", "items": ["spaced", "dot"]},
+            {"type": "paragraph", "text": "*\tnot a bullet\n17. Not a section"},
+        ]}],
+    ),
+])
+def test_golden(brd_text, expected):
+    assert convert_brd_to_json(brd_text) == {"sections": expected}
+
+
+def test_empty_text_has_no_sections():
+    assert convert_brd_to_json("") == {"sections": []}
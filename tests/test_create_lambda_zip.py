@@ -0,0 +1,110 @@
+"""Tests for create_lambda_zip — archive validity, filters, serial vs parallel writer."""
+
+import zipfile
+
+import pytest
+
+import create_lambda_zip as clz
+
+
+def _build_tree(root, extra_files=0):
+    """A small package tree with kept, excluded and already-compressed files."""
+    files = {
+        "handler.py": b"def handler(event, context):\n    return 1\n" * 50,
+        "pkg/__init__.py": b"",
+        "pkg/data.json": b'{"k": "v"}' * 200,
+        "pkg/logo.png": b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 4,
+        "pkg/bundle.whl": b"PK-not-really" * 10,
+        "pkg/café.txt": "unicode name".encode("utf-8"),
+        "jmespath/ast.py": b"# must stay inside its package\n",
+        # Excluded
+        "ast.py": b"# root-level ast.py would shadow the stdlib\n",
+        "pkg/__pycache__/mod.cpython-311.pyc": b"\x00",
+        "pkg/stale.pyc": b"\x00",
+        ".git/config": b"[core]\n",
+        ".DS_Store": b"\x00",
+        "pkg/.gitignore": b"*.pyc\n",
+    }
+    for i in range(extra_files):
+        files[f"bulk/m{i:04d}.py"] = f"VALUE = {i}\n".encode() * 20
+    for rel, data in files.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+    return files
+
+
+EXPECTED_EXCLUDED = {
+    "ast.py",
+    "pkg/__pycache__/mod.cpython-311.pyc",
+    "pkg/stale.pyc",
+    ".git/config",
+    ".DS_Store",
+    "pkg/.gitignore",
+}
+
+
+def _check_archive(zip_path, files):
+    expected = {name: data for name, data in files.items() if name not in EXPECTED_EXCLUDED}
+    with zipfile.ZipFile(zip_path) as zf:
+        assert zf.testzip() is None
+        names = zf.namelist()
+        assert names == sorted(expected)
+        for info in zf.infolist():
+            assert zf.read(info) == expected[info.filename]
+            stored = info.filename.endswith((".png", ".whl"))
+            assert info.compress_type == (zipfile.ZIP_STORED if stored else zipfile.ZIP_DEFLATED)
+        return {info.filename: (info.CRC, info.file_size, info.compress_type) for info in zf.infolist()}
+
+
+def test_serial_archive_is_valid_and_filtered(tmp_path):
+    files = _build_tree(tmp_path / "src")
+    out = tmp_path / "out.zip"
+
+    assert clz.create_lambda_zip(str(tmp_path / "src"), str(out))
+    _check_archive(out, files)
+
+
+def test_parallel_path_above_threshold_matches_serial(tmp_path, monkeypatch):
+    files = _build_tree(tmp_path / "src", extra_files=clz.PARALLEL_MIN_FILES)
+    monkeypatch.setattr(clz.os, "cpu_count", lambda: 2)
+    calls = []
+    real_parallel = clz._write_zip_parallel
+    monkeypatch.setattr(
+        clz, "_write_zip_parallel",
+        lambda *args: calls.append(1) or real_parallel(*args),
+    )
+
+    parallel_zip = tmp_path / "parallel.zip"
+    clz.create_lambda_zip(str(tmp_path / "src"), str(parallel_zip))
+    assert calls, "expected the parallel writer above PARALLEL_MIN_FILES"
+    parallel = _check_archive(parallel_zip, files)
+
+    entries = sorted(
+        (arcname, path) for path, arcname in clz._iter_package_files(str(tmp_path / "src"))
+        if arcname != "ast.py"
+    )
+    serial_zip = tmp_path / "serial.zip"
+    clz._write_zip_serial(serial_zip, entries)
+    assert _check_archive(serial_zip, files) == parallel
+
+
+def test_zip64_fallback_rewrites_with_zipfile(tmp_path, monkeypatch):
+    files = _build_tree(tmp_path / "src", extra_files=clz.PARALLEL_MIN_FILES)
+    monkeypatch.setattr(clz.os, "cpu_count", lambda: 2)
+    monkeypatch.setattr(clz, "_ZIP_MAX_ENTRIES", 10)
+
+    out = tmp_path / "out.zip"
+    clz.create_lambda_zip(str(tmp_path / "src"), str(out))
+    _check_archive(out, files)
+
+
+@pytest.mark.parametrize("name, stored", [
+    ("a.PNG", True),
+    ("b.jpeg", True),
+    ("c.tar.gz", True),
+    ("d.py", False),
+    ("e.json", False),
+])
+def test_is_stored(name, stored):
+    assert clz._is_stored(name) is stored
@@ -0,0 +1,44 @@
+"""Tests for app.read_docx — lxml text extraction must match Paragraph.text."""
+
+import io
+
+from docx import Document
+from docx.enum.text import WD_BREAK
+from docx.shared import Inches
+
+from app import read_docx
+
+
+def _docx_bytes(doc):
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+
+def test_tabs_and_line_breaks_are_kept():
+    doc = Document()
+    p = doc.add_paragraph()
+    p.paragraph_format.tab_stops.add_tab_stop(Inches(1))  # a <w:tab> under pPr, not text
+    run = p.add_run("Speaker 1:")
+    run.add_tab()
+    run.add_text("Hello")
+    run.add_break()
+    p.add_run("next line")
+    doc.add_paragraph("second")
+
+    assert read_docx(_docx_bytes(doc)) == "Speaker 1:\tHello\nnext line\nsecond"
+
+
+def test_matches_python_docx_paragraph_text():
+    doc = Document()
+    doc.add_paragraph("plain")
+    p = doc.add_paragraph("before page break")
+    p.add_run().add_break(WD_BREAK.PAGE)
+    p.add_run("after")
+    doc.add_paragraph("")
+    doc.add_table(rows=1, cols=1).cell(0, 0).text = "table text is not a body paragraph"
+    doc.add_paragraph("a\tb\nc")
+    data = _docx_bytes(doc)
+
+    expected = "\n".join(p.text for p in Document(io.BytesIO(data)).paragraphs)
+    assert read_docx(data) == expected
@@ -0,0 +1,173 @@
+"""
+Text extraction from AgentCore agent replies.
+
+The agent runtime wraps its answer in a handful of JSON shapes depending on
+which agent and SDK version produced it. The helpers here take the decoded
+reply and pull out the user-facing text, so the /api/chat handler and any
+other caller share one parser.
+
+The module is fully annotated and mypyc-compatible: running
+``mypyc utils/agent_response.py`` next to the source builds a native
+extension that Python imports in its place, with no caller changes.
+"""
+
+import json
+import logging
+from typing import Any, Final, Optional, Tuple, Union
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch
+# the stdlib exception either way.
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+
+# Where agent replies carry their text, in priority order. Each entry is a
+# path of dict keys / list indexes into the parsed response; the first truthy
+# hit wins. A bare `result` only counts when it is already a string.
+_AGENT_TEXT_PATHS: Final[Tuple[Tuple[Union[str, int], ...], ...]] = (
+    ('content', 0, 'text'),            # {'role': 'assistant', 'content': [{'text': ...}]}
+    ('result',),                       # {'result': '...'}
+    ('result', 'content', 0, 'text'),  # {'result': {'content': [{'text': ...}]}}
+    ('text',),
+    ('message',),
+    ('response',),
+)
+
+# Keys tried, in order, by extract_agent_text's last-resort scan.
+_FALLBACK_TEXT_KEYS: Final[Tuple[str, ...]] = ('text', 'message', 'content', 'result', 'response', 'answer')
+
+
+def first_non_ws(text: str) -> str:
+    """Return the first non-whitespace character of ``text``, or ``''``.
+
+    Same whitespace rules as ``str.strip()``, but stops at the first hit
+    instead of allocating a stripped copy of a possibly large reply.
+    """
+    for ch in text:
+        if not ch.isspace():
+            return ch
+    return ''
+
+
+# The helpers below only ever see json/orjson output, which never contains
+# subclasses, so they test ``type(x) is dict`` (a pointer compare) rather
+# than ``isinstance``.
+def _dig(obj: Any, path: Tuple[Union[str, int], ...]) -> Any:
+    """Follow ``path`` (dict keys / list indexes) into parsed JSON; None if any hop is missing."""
+    for key in path:
+        if type(key) is int:
+            if type(obj) is not list or len(obj) <= key:
+                return None
+        elif type(obj) is not dict or key not in obj:
+            return None
+        obj = obj[key]
+    return obj
+
+
+def extract_agent_text(result_json: Any) -> Optional[str]:
+    """Return the reply text from an already-parsed agent response, or None.
+
+    Walks ``_AGENT_TEXT_PATHS`` over the single parsed object instead of
+    re-testing the same keys in a nested branch cascade.
+    """
+    if type(result_json) is not dict:
+        return None
+    for path in _AGENT_TEXT_PATHS:
+        value = _dig(result_json, path)
+        is_str = type(value) is str
+        if not is_str and path == ('result',):
+            continue
+        if value:
+            return value if is_str else str(value)
+
+    # Last resort: any well-known key holding a non-blank string or a
+    # [{'text': ...}] list.
+    for key in _FALLBACK_TEXT_KEYS:
+        value = result_json.get(key)
+        vtype = type(value)
+        if vtype is str:
+            if value and not value.isspace():
+                return value
+        elif vtype is list and value and type(value[0]) is dict and 'text' in value[0]:
+            return value[0]['text'] or None
+    return None
+
+
+def extract_text_from_analyst_response(response_str: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Extract plain text message and session_id from analyst agent's JSON response.
+    Handles both direct analyst agent responses and AgentCore-wrapped responses.
+    Returns: (message_text, session_id)
+    """
+    logger.debug("[extract_text] Called with response length: %d", len(response_str) if response_str else 0)
+    
+    if not response_str or not isinstance(response_str, str):
+        logger.debug("[extract_text] Response is None or not string")
+        return None, None
+    
+    if first_non_ws(response_str) != '{':
+        logger.debug("[extract_text] Response doesn't start with '{', returning as plain text")
+        return response_str, None
+    
+    logger.debug("[extract_text] Attempting JSON parse, first 200 chars: %.200s", response_str)
+    
+    try:
+        # JSON allows surrounding whitespace, so the untrimmed reply parses as-is.
+        parsed = _loads(response_str)
+        logger.debug("[extract_text] JSON parse successful, type: %s", type(parsed).__name__)
+        
+        if type(parsed) is dict:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[extract_text] Parsed dict keys: %s", list(parsed.keys()))
+            
+            # Case 1: Direct analyst agent response: {"result": "...", "session_id": "...", "message": "..."}
+            has_message = 'message' in parsed
+            has_result_and_session = ('result' in parsed and 'session_id' in parsed)
+            logger.debug("[extract_text] has_message: %s, has_result_and_session: %s", has_message, has_result_and_session)
+            
+            if has_message or has_result_and_session:
+                message_text = parsed.get('message') or parsed.get('result')
+                session_id = parsed.get('session_id')
+                logger.debug("[extract_text] Extracted message_text type: %s, session_id: %s",
+                             type(message_text).__name__, session_id)
+                
+                if message_text and type(message_text) is str:
+                    return message_text, session_id
+                elif message_text:
+                    # If message_text is not a string, convert it
+                    return str(message_text), session_id
+                else:
+                    logger.debug("[extract_text] message_text is None or empty")
+            
+            # Case 2: AgentCore wrapped response: {"result": "{\"result\": \"...\", \"session_id\": \"...\", \"message\": \"...\"}"}
+            if 'result' in parsed:
+                result_value = parsed.get('result')
+                if type(result_value) is str and first_non_ws(result_value) == '{':
+                    # Try to parse the nested JSON string
+                    try:
+                        nested_parsed = _loads(result_value)
+                        if type(nested_parsed) is dict:
+                            nested_message = nested_parsed.get('message') or nested_parsed.get('result')
+                            nested_session_id = nested_parsed.get('session_id')
+                            if nested_message and type(nested_message) is str:
+                                return nested_message, nested_session_id
+                    except json.JSONDecodeError:
+                        pass
+            
+            # Case 3: Check for content array format: {"content": [{"text": "..."}]}
+            content_list = parsed.get('content')
+            if type(content_list) is list:
+                if len(content_list) > 0:
+                    first_content = content_list[0]
+                    if type(first_content) is dict and 'text' in first_content:
+                        return first_content['text'], parsed.get('session_id')
+    except json.JSONDecodeError:
+        pass
+    except Exception as e:
+        logger.info(f"[extract_text_from_analyst_response] Error: {e}")
+    
+    return None, None
@@ -0,0 +1,17 @@
+"""
+JSON decoding with an optional orjson fast path.
+
+Lambda invoke responses are JSON envelopes whose ``body`` is itself a JSON
+string, so every response is parsed twice; orjson (optional) makes both
+passes cheap. ``orjson.JSONDecodeError`` subclasses ``json.JSONDecodeError``,
+so callers catch the stdlib exception either way.
+"""
+
+import json
+
+try:
+    from orjson import loads
+except ImportError:
+    loads = json.loads
+
+__all__ = ["loads"]